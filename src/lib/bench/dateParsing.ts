@@ -0,0 +1,85 @@
+import {
+	format,
+	isAfter,
+	isBefore,
+	isValid,
+	isWithinInterval,
+	parseISO,
+	startOfWeek
+} from 'date-fns';
+
+import type { PeriodFilter, TransactionEntry } from '$lib/types';
+import { buildKpiBundle, createKpiAccumulatorFromColumns } from '$lib/utils/kpis';
+import { createColumnarLedger, findDateSpan, toDayRange } from '$lib/utils/ledger';
+
+import { countDateConstructions, medianMs } from './measure';
+
+// Baseline: the filter-change path as it was before entries carried date keys.
+const legacyWithin = (isoDate: string, filter: PeriodFilter): boolean => {
+	const date = parseISO(isoDate);
+	if (!isValid(date)) return false;
+
+	const start = parseISO(filter.startDate);
+	const end = parseISO(filter.endDate);
+	if (!isValid(start) || !isValid(end)) return false;
+
+	const normalizedStart = isBefore(start, end) ? start : end;
+	const normalizedEnd = isAfter(end, start) ? end : start;
+	return isWithinInterval(date, { start: normalizedStart, end: normalizedEnd });
+};
+
+const legacyCompare = (a: TransactionEntry, b: TransactionEntry): number => {
+	const dateA = parseISO(a.date);
+	const dateB = parseISO(b.date);
+	if (dateA.getTime() !== dateB.getTime()) return dateA.getTime() > dateB.getTime() ? -1 : 1;
+	return a.id > b.id ? -1 : 1;
+};
+
+const legacyFilterChange = (entries: TransactionEntry[], filter: PeriodFilter) => {
+	const filtered = entries.filter((entry) => legacyWithin(entry.date, filter)).sort(legacyCompare);
+	entries.slice().sort(legacyCompare);
+
+	const weeks = new Map<string, { income: number; expenses: number; label: string }>();
+	for (const entry of filtered) {
+		const bucketDate = startOfWeek(parseISO(entry.date), { weekStartsOn: 1 });
+		const key = bucketDate.toISOString().slice(0, 10);
+		const bucket = weeks.get(key) ?? {
+			income: 0,
+			expenses: 0,
+			label: format(bucketDate, 'MMM d')
+		};
+		bucket[entry.type === 'income' ? 'income' : 'expenses'] += entry.amount;
+		weeks.set(key, bucket);
+	}
+};
+
+/**
+ * Date-fns work (as `Date` constructions) and time for one filter change over
+ * `entries`, before and after pre-parsed epoch-day keys.
+ */
+export const benchmarkDateParsing = (entries: TransactionEntry[], filter: PeriodFilter) => {
+	// Keys are computed once when entries enter the store, not per filter change.
+	const ledger = createColumnarLedger(entries);
+	const indexedFilterChange = () => {
+		const span = findDateSpan(ledger, toDayRange(filter.startDate, filter.endDate));
+		ledger.entries.slice(span.from, span.to);
+		buildKpiBundle(createKpiAccumulatorFromColumns(ledger, span));
+	};
+
+	const legacyDates = countDateConstructions(() => legacyFilterChange(entries, filter));
+	const indexedDates = countDateConstructions(indexedFilterChange);
+
+	return {
+		entries: entries.length,
+		legacy: {
+			dateConstructions: legacyDates,
+			perEntry: legacyDates / Math.max(entries.length, 1),
+			ms: medianMs(() => legacyFilterChange(entries, filter))
+		},
+		indexed: {
+			dateConstructions: indexedDates,
+			perEntry: indexedDates / Math.max(entries.length, 1),
+			ms: medianMs(indexedFilterChange)
+		}
+	};
+};
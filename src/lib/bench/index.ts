@@ -0,0 +1,5 @@
+// Dev-only benchmarks, loaded on demand through `window.__expenseTracker.bench()`.
+export { benchmarkCsvImport } from './csvImport';
+export { benchmarkDateParsing } from './dateParsing';
+export { benchmarkKpiAggregation } from './kpiAggregation';
+export { benchmarkRenderCounts } from './renderCounts';
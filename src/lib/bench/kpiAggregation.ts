@@ -0,0 +1,109 @@
+import { format, isValid, parseISO, startOfWeek } from 'date-fns';
+
+import type { KPIBundle, PeriodFilter, TransactionEntry } from '$lib/types';
+import { buildKpiBundle, createKpiAccumulatorFromColumns, toCurrency } from '$lib/utils/kpis';
+import { createColumnarLedger, findDateSpan, toDayRange } from '$lib/utils/ledger';
+
+import { allocatedBytes, medianMs } from './measure';
+
+// Baseline: the KPI block of `recalculateState` before aggregation was fused,
+// i.e. two filter/reduce pairs for the totals plus separate trend and category passes.
+const legacyTrendSeries = (entries: TransactionEntry[]) => {
+	const buckets = entries.reduce<
+		Map<string, { label: string; startDate: Date; income: number; expenses: number }>
+	>((acc, entry) => {
+		const parsed = parseISO(entry.date);
+		if (!isValid(parsed)) return acc;
+
+		const bucketDate = startOfWeek(parsed, { weekStartsOn: 1 });
+		const key = bucketDate.toISOString().slice(0, 10);
+		const bucket =
+			acc.get(key) ??
+			acc
+				.set(key, {
+					label: format(bucketDate, 'MMM d'),
+					startDate: bucketDate,
+					income: 0,
+					expenses: 0
+				})
+				.get(key)!;
+
+		if (entry.type === 'income') {
+			bucket.income += entry.amount;
+		} else {
+			bucket.expenses += entry.amount;
+		}
+		return acc;
+	}, new Map());
+
+	return Array.from(buckets.values())
+		.sort((a, b) => a.startDate.getTime() - b.startDate.getTime())
+		.map(({ label, income, expenses }) => ({
+			label,
+			income: toCurrency(income),
+			expenses: toCurrency(expenses)
+		}));
+};
+
+const legacyCategoryShare = (entries: TransactionEntry[]) => {
+	const expenses = entries.filter((entry) => entry.type === 'expense');
+	const total = expenses.reduce((sum, entry) => sum + entry.amount, 0);
+	if (total <= 0) return [];
+
+	const bucket = expenses.reduce<Record<string, number>>((acc, entry) => {
+		const key = entry.subCategory || entry.primaryCategory;
+		acc[key] = (acc[key] ?? 0) + entry.amount;
+		return acc;
+	}, {});
+
+	return Object.entries(bucket)
+		.map(([category, value]) => ({
+			category,
+			value: toCurrency(value),
+			percentage: Math.round((value / total) * 1000) / 10
+		}))
+		.sort((a, b) => b.value - a.value);
+};
+
+const legacyKpis = (filteredEntries: TransactionEntry[]): KPIBundle => {
+	const totalIncome = filteredEntries
+		.filter((entry) => entry.type === 'income')
+		.reduce((sum, entry) => sum + entry.amount, 0);
+	const totalExpenses = filteredEntries
+		.filter((entry) => entry.type === 'expense')
+		.reduce((sum, entry) => sum + entry.amount, 0);
+
+	return {
+		totalIncome: toCurrency(totalIncome),
+		totalExpenses: toCurrency(totalExpenses),
+		amountSaved: toCurrency(totalIncome - totalExpenses),
+		leftoverBalance: toCurrency(totalIncome - totalExpenses),
+		previousPeriod: null,
+		trendGranularity: 'week',
+		trendSeries: legacyTrendSeries(filteredEntries),
+		categoryShare: legacyCategoryShare(filteredEntries)
+	};
+};
+
+/**
+ * Time and heap allocation of one KPI recalculation over the entries inside
+ * `filter`, multi-pass baseline vs the fused columnar pass. Both sides produce
+ * the same `KPIBundle` (the fused side is pinned to the baseline's weekly
+ * trend); `matches` confirms it.
+ */
+export const benchmarkKpiAggregation = (entries: TransactionEntry[], filter: PeriodFilter) => {
+	const ledger = createColumnarLedger(entries);
+	const span = findDateSpan(ledger, toDayRange(filter.startDate, filter.endDate));
+	const filteredEntries = ledger.entries.slice(span.from, span.to);
+
+	const legacy = () => legacyKpis(filteredEntries);
+	const fused = () => buildKpiBundle(createKpiAccumulatorFromColumns(ledger, span), 'week');
+
+	return {
+		entries: entries.length,
+		filteredEntries: filteredEntries.length,
+		matches: JSON.stringify(legacy()) === JSON.stringify(fused()),
+		legacy: { ms: medianMs(legacy), allocatedBytes: allocatedBytes(legacy) },
+		fused: { ms: medianMs(fused), allocatedBytes: allocatedBytes(fused) }
+	};
+};
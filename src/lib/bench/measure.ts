@@ -0,0 +1,58 @@
+/**
+ * Counts `Date` objects constructed while `run` executes. date-fns builds a
+ * fresh `Date` for nearly every call (`parseISO`, `startOfWeek`, `format`,
+ * `isWithinInterval`, ...), so this is a faithful proxy for date-fns work.
+ */
+export const countDateConstructions = (run: () => void): number => {
+	const NativeDate = globalThis.Date;
+	let count = 0;
+
+	class CountingDate extends NativeDate {
+		constructor(...args: ConstructorParameters<DateConstructor>) {
+			super(...args);
+			count += 1;
+		}
+	}
+
+	globalThis.Date = CountingDate as DateConstructor;
+	try {
+		run();
+	} finally {
+		globalThis.Date = NativeDate;
+	}
+
+	return count;
+};
+
+/** Median wall-clock milliseconds of `run` over `iterations` calls. */
+export const medianMs = (run: () => void, iterations = 5): number => {
+	const samples: number[] = [];
+
+	for (let i = 0; i < iterations; i += 1) {
+		const started = performance.now();
+		run();
+		samples.push(performance.now() - started);
+	}
+
+	samples.sort((a, b) => a - b);
+	return Math.round(samples[samples.length >> 1] * 1000) / 1000;
+};
+
+type ChromeMemory = { usedJSHeapSize: number };
+
+/**
+ * JS heap growth while `run` executes, or null where the browser cannot report
+ * it. Only meaningful in Chromium started with `--js-flags=--expose-gc` and
+ * `--enable-precise-memory-info` (see `testsprite_tests/benchmarks.py`) and a
+ * young generation large enough that `run` does not trigger a scavenge.
+ */
+export const allocatedBytes = (run: () => void): number | null => {
+	const memory = (performance as Performance & { memory?: ChromeMemory }).memory;
+	const gc = (globalThis as typeof globalThis & { gc?: () => void }).gc;
+	if (!memory || !gc) return null;
+
+	gc();
+	const before = memory.usedJSHeapSize;
+	run();
+	return memory.usedJSHeapSize - before;
+};
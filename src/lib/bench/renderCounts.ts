@@ -0,0 +1,92 @@
+import { tick } from 'svelte';
+import { get } from 'svelte/store';
+
+import { transactionsStore } from '$lib/stores/transactions';
+import type { PeriodPreset, TransactionDraft, TransactionEntry } from '$lib/types';
+import {
+	getInstrumentationSnapshot,
+	isInstrumentationEnabled,
+	resetInstrumentation,
+	setInstrumentationEnabled
+} from '$lib/utils/instrumentation';
+
+const PROBE_LABEL = 'Render count probe';
+
+type ScenarioCounts = { notifications: number; renders: Record<string, number> };
+
+// Resolves once the store has no worker aggregation in flight and Svelte has flushed.
+const settled = async () => {
+	await new Promise<void>((resolve) => {
+		let done = false;
+		const unsubscribe = transactionsStore.subscribe((state) => {
+			if (done || state.kpisPending) return;
+			done = true;
+			queueMicrotask(() => unsubscribe());
+			resolve();
+		});
+	});
+	await tick();
+	await new Promise((resolve) => requestAnimationFrame(resolve));
+};
+
+const probe = (date: string): TransactionDraft => ({
+	date,
+	label: PROBE_LABEL,
+	primaryCategory: 'variable_expense',
+	subCategory: 'Groceries',
+	amount: 12.5
+});
+
+const removeProbe = () => {
+	const entry = get(transactionsStore).entries.find(({ label }) => label === PROBE_LABEL);
+	if (entry) transactionsStore.removeEntry(entry.id);
+};
+
+/**
+ * Component updates caused by single mutations on the live dashboard. Before
+ * the store was split into slices, every store notification updated every
+ * subscribed component; `notifications` is that old cost, `renders` the
+ * per-component updates that actually ran. Seeds `entries` first and needs the
+ * dashboard page to be mounted.
+ */
+export const benchmarkRenderCounts = async (entries: TransactionEntry[]) => {
+	const wasEnabled = isInstrumentationEnabled();
+	setInstrumentationEnabled(true);
+
+	try {
+		// A background IndexedDB rewrite would overlap the first scenarios.
+		await transactionsStore.seed(entries);
+		await settled();
+
+		const { filter } = get(transactionsStore);
+		const otherPreset: PeriodPreset = filter.preset === 'last_month' ? 'this_month' : 'last_month';
+		const scenarios: Array<[string, () => void]> = [
+			['add-outside-period', () => transactionsStore.addEntry(probe('2000-01-03'))],
+			['remove-outside-period', removeProbe],
+			['add-inside-period', () => transactionsStore.addEntry(probe(filter.endDate))],
+			['remove-inside-period', removeProbe],
+			['reapply-preset', () => transactionsStore.setPreset(filter.preset)],
+			['switch-preset', () => transactionsStore.setPreset(otherPreset)],
+			['switch-back', () => transactionsStore.setPreset(filter.preset)]
+		];
+
+		const results: Record<string, ScenarioCounts> = {};
+		for (const [name, run] of scenarios) {
+			resetInstrumentation();
+			let notifications = -1; // the first call is the subscription replaying the current state
+			const unsubscribe = transactionsStore.subscribe(() => {
+				notifications += 1;
+			});
+
+			run();
+			await settled();
+			unsubscribe();
+
+			results[name] = { notifications, renders: getInstrumentationSnapshot().renders };
+		}
+
+		return { entries: entries.length, scenarios: results };
+	} finally {
+		setInstrumentationEnabled(wasEnabled);
+	}
+};
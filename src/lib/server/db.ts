@@ -0,0 +1,125 @@
+import { mkdirSync } from 'node:fs';
+import { dirname } from 'node:path';
+import { DatabaseSync } from 'node:sqlite';
+
+import { env } from '$env/dynamic/private';
+
+const DEFAULT_DATABASE_PATH = '.data/expense-tracker.sqlite';
+
+// Epoch day and ISO-week (Monday) start of a `yyyy-MM-dd` column, matching
+// `toEpochDay` / `toWeekStartDay` in `$lib/utils/ledger`.
+const epochDay = (column: string) => `CAST(julianday(${column}) - 2440587.5 AS INTEGER)`;
+const weekStart = (column: string) =>
+	`(${epochDay(column)} - (((${epochDay(column)} + 3) % 7) + 7) % 7)`;
+
+// Same grouping key as `internCategory` in `$lib/utils/ledger`.
+const categoryOf = (prefix: string) =>
+	`COALESCE(NULLIF(${prefix}sub_category, ''), ${prefix}primary_category)`;
+
+type Rollup = { table: string; key: string; bucket: (column: string) => string };
+
+// Each rollup sums amount and count per (bucket, type, category).
+const ROLLUPS: Rollup[] = [
+	{ table: 'daily_rollups', key: 'day', bucket: epochDay },
+	{ table: 'weekly_rollups', key: 'week_start', bucket: weekStart }
+];
+
+const rollupTable = ({ table, key, bucket }: Rollup) => `
+	CREATE TABLE ${table} (
+		${key} INTEGER NOT NULL,
+		type TEXT NOT NULL,
+		category TEXT NOT NULL,
+		amount REAL NOT NULL,
+		count INTEGER NOT NULL,
+		PRIMARY KEY (${key}, type, category)
+	) WITHOUT ROWID;
+	INSERT INTO ${table} (${key}, type, category, amount, count)
+	SELECT ${bucket('date')}, type, ${categoryOf('')}, SUM(amount), COUNT(*)
+	FROM transactions
+	GROUP BY 1, 2, 3;
+`;
+
+// Adds (NEW) or subtracts (OLD) one transaction row; an emptied bucket is dropped.
+const rollupTrigger = ({ table, key, bucket }: Rollup, row: 'NEW' | 'OLD') => {
+	const sign = row === 'NEW' ? '' : '-';
+	const values = `${bucket(`${row}.date`)}, ${row}.type, ${categoryOf(`${row}.`)}`;
+	const upsert = `
+		INSERT INTO ${table} (${key}, type, category, amount, count)
+		VALUES (${values}, ${sign}${row}.amount, ${sign}1)
+		ON CONFLICT (${key}, type, category)
+		DO UPDATE SET amount = amount + excluded.amount, count = count + excluded.count;
+	`;
+	if (row === 'NEW') return upsert;
+
+	return `${upsert}
+		DELETE FROM ${table} WHERE (${key}, type, category) = (${values}) AND count <= 0;
+	`;
+};
+
+// Applied in order; `PRAGMA user_version` records how many have run.
+const MIGRATIONS = [
+	// ISO `yyyy-MM-dd` strings sort like the dates they encode, so a plain text
+	// index on `date` serves range filters as index range scans.
+	`
+	CREATE TABLE IF NOT EXISTS transactions (
+		id TEXT PRIMARY KEY,
+		date TEXT NOT NULL,
+		label TEXT NOT NULL,
+		primary_category TEXT NOT NULL,
+		sub_category TEXT NOT NULL,
+		amount REAL NOT NULL,
+		type TEXT NOT NULL
+	);
+	CREATE INDEX IF NOT EXISTS transactions_by_date ON transactions (date DESC, id DESC);
+	`,
+	// Materialized KPI rollups per day and per ISO week, keyed by epoch day and
+	// kept current by triggers so `/api/kpis` never reads raw transactions.
+	`
+	${ROLLUPS.map(rollupTable).join('')}
+	CREATE TRIGGER transactions_rollup_insert AFTER INSERT ON transactions BEGIN
+		${ROLLUPS.map((rollup) => rollupTrigger(rollup, 'NEW')).join('')}
+	END;
+	CREATE TRIGGER transactions_rollup_delete AFTER DELETE ON transactions BEGIN
+		${ROLLUPS.map((rollup) => rollupTrigger(rollup, 'OLD')).join('')}
+	END;
+	`
+];
+
+const migrate = (db: DatabaseSync) => {
+	const { user_version: version } = db.prepare('PRAGMA user_version').get() as {
+		user_version: number;
+	};
+
+	for (let step = version; step < MIGRATIONS.length; step += 1) {
+		db.exec('BEGIN');
+		try {
+			db.exec(MIGRATIONS[step]);
+			db.exec(`PRAGMA user_version = ${step + 1}`);
+			db.exec('COMMIT');
+		} catch (cause) {
+			db.exec('ROLLBACK');
+			throw cause;
+		}
+	}
+};
+
+let database: DatabaseSync | undefined;
+
+/**
+ * Embedded SQLite store behind the `/api` endpoints, opened and migrated on
+ * first use. `EXPENSE_TRACKER_DB` overrides the file location; `:memory:`
+ * keeps it in RAM.
+ */
+export const getDatabase = (): DatabaseSync => {
+	if (database) return database;
+
+	const path = env.EXPENSE_TRACKER_DB || DEFAULT_DATABASE_PATH;
+	if (path !== ':memory:') {
+		mkdirSync(dirname(path), { recursive: true });
+	}
+
+	database = new DatabaseSync(path);
+	database.exec('PRAGMA journal_mode = WAL;');
+	migrate(database);
+	return database;
+};
@@ -0,0 +1,146 @@
+import type { StatementSync } from 'node:sqlite';
+
+import type { KPIBundle, PeriodTotals, TrendGranularity } from '$lib/types';
+import {
+	accumulateRollup,
+	buildKpiBundle,
+	chooseTrendGranularity,
+	createKpiAccumulator,
+	toCurrency
+} from '$lib/utils/kpis';
+import { precedingRange, toDayRange, toWeekStartDay, type DayRange } from '$lib/utils/ledger';
+
+import { getDatabase } from './db';
+
+type RollupRow = {
+	bucket: number;
+	type: 'income' | 'expense';
+	category: string;
+	amount: number;
+	count: number;
+};
+
+/**
+ * Rows come back grouped per trend bucket, type and category, so the cost
+ * tracks the number of buckets in the range rather than the number of
+ * transactions. Day buckets are `daily_rollups` rows as stored; month buckets
+ * sum them per calendar month. For week buckets, whole ISO weeks inside the
+ * range come from `weekly_rollups` and only the partial weeks at either edge
+ * (at most six days each) read `daily_rollups`.
+ */
+const DAY_QUERY = `
+	SELECT day AS bucket, type, category, amount, count
+	FROM daily_rollups
+	WHERE day BETWEEN :start AND :end
+`;
+
+const WEEK_QUERY = `
+	SELECT week_start AS bucket, type, category, amount, count
+	FROM weekly_rollups
+	WHERE week_start BETWEEN :firstWeek AND :lastWeek
+	UNION ALL
+	SELECT day - (((day + 3) % 7) + 7) % 7, type, category, SUM(amount), SUM(count)
+	FROM daily_rollups
+	WHERE day BETWEEN :start AND :headEnd OR day BETWEEN :tailStart AND :end
+	GROUP BY 1, 2, 3
+`;
+
+// Epoch day of the first of the month, matching `toMonthStartDay` in `$lib/utils/ledger`.
+const MONTH_QUERY = `
+	SELECT
+		CAST(julianday(date(day * 86400, 'unixepoch', 'start of month')) - 2440587.5 AS INTEGER)
+			AS bucket,
+		type,
+		category,
+		SUM(amount) AS amount,
+		SUM(count) AS count
+	FROM daily_rollups
+	WHERE day BETWEEN :start AND :end
+	GROUP BY 1, 2, 3
+`;
+
+// Totals for the comparison period; one row per type, at most one per day scanned.
+const PERIOD_TOTALS_QUERY = `
+	SELECT type, SUM(amount) AS amount
+	FROM daily_rollups
+	WHERE day BETWEEN :start AND :end
+	GROUP BY type
+`;
+
+const ROLLUP_QUERIES: Record<TrendGranularity, string> = {
+	day: DAY_QUERY,
+	week: WEEK_QUERY,
+	month: MONTH_QUERY
+};
+
+const rollupQueries = new Map<TrendGranularity, StatementSync>();
+let periodTotalsQuery: StatementSync | undefined;
+
+const prepare = (granularity: TrendGranularity) => {
+	let query = rollupQueries.get(granularity);
+	if (!query) {
+		query = getDatabase().prepare(ROLLUP_QUERIES[granularity]);
+		rollupQueries.set(granularity, query);
+	}
+	return query;
+};
+
+const readRollups = (granularity: TrendGranularity, start: number, end: number) => {
+	if (granularity !== 'week') return prepare(granularity).all({ start, end });
+
+	const firstWeek = toWeekStartDay(start) === start ? start : toWeekStartDay(start) + 7;
+	const lastWeek = toWeekStartDay(end - 6);
+	const hasWholeWeeks = firstWeek <= lastWeek;
+
+	return prepare('week').all({
+		start,
+		end,
+		firstWeek,
+		lastWeek,
+		headEnd: hasWholeWeeks ? firstWeek - 1 : end,
+		tailStart: hasWholeWeeks ? lastWeek + 7 : end + 1
+	});
+};
+
+const readPeriodTotals = ({ start, end }: DayRange): PeriodTotals => {
+	periodTotalsQuery ??= getDatabase().prepare(PERIOD_TOTALS_QUERY);
+	const rows = periodTotalsQuery.all({ start, end }) as { type: string; amount: number }[];
+
+	let income = 0;
+	let expenses = 0;
+	for (const row of rows) {
+		if (row.type === 'income') {
+			income += row.amount;
+		} else {
+			expenses += row.amount;
+		}
+	}
+
+	return {
+		totalIncome: toCurrency(income),
+		totalExpenses: toCurrency(expenses),
+		amountSaved: toCurrency(income - expenses)
+	};
+};
+
+/** KPIs for the inclusive `yyyy-MM-dd` range, or null when a bound is not a valid date. */
+export const computeKpis = (startDate: string, endDate: string): KPIBundle | null => {
+	const range = toDayRange(startDate, endDate);
+	if (!range) return null;
+
+	const granularity = chooseTrendGranularity(range);
+	const rows = readRollups(granularity, range.start, range.end) as RollupRow[];
+
+	const accumulator = createKpiAccumulator();
+	for (const row of rows) {
+		accumulateRollup(accumulator, {
+			startDay: row.bucket,
+			isIncome: row.type === 'income',
+			category: row.category,
+			amount: row.amount,
+			count: row.count
+		});
+	}
+
+	return buildKpiBundle(accumulator, granularity, readPeriodTotals(precedingRange(range)));
+};
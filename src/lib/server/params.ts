@@ -0,0 +1,11 @@
+import { error } from '@sveltejs/kit';
+
+import { isIsoDate } from './transactions';
+
+/** Optional `yyyy-MM-dd` query parameter; answers 400 when it is present but malformed. */
+export const readDateParam = (url: URL, name: string): string | undefined => {
+	const value = url.searchParams.get(name);
+	if (!value) return undefined;
+	if (!isIsoDate(value)) error(400, `${name} must be a yyyy-MM-dd date.`);
+	return value;
+};
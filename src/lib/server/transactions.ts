@@ -0,0 +1,192 @@
+import type { PrimaryCategory, TransactionDraft, TransactionEntry } from '$lib/types';
+import { toCurrency } from '$lib/utils/kpis';
+import { INVALID_EPOCH_DAY, toEpochDay } from '$lib/utils/ledger';
+import { parseTransactionFields, type ParsedTransactionFields } from '$lib/utils/validation';
+
+import { getDatabase } from './db';
+
+// Bounds for open-ended ranges; every valid ISO date sorts between them.
+const MIN_DATE = '0000-01-01';
+const MAX_DATE = '9999-12-31';
+
+type TransactionRow = {
+	id: string;
+	date: string;
+	label: string;
+	primary_category: PrimaryCategory;
+	sub_category: string;
+	amount: number;
+	type: TransactionEntry['type'];
+};
+
+export type TransactionQuery = { startDate?: string; endDate?: string };
+
+/** Keyset position: the (date, id) of the last row already returned. */
+export type TransactionCursor = { date: string; id: string };
+
+export type TransactionPage = { data: TransactionEntry[]; nextCursor: TransactionCursor | null };
+
+const toEntry = (row: TransactionRow): TransactionEntry => ({
+	id: row.id,
+	date: row.date,
+	label: row.label,
+	primaryCategory: row.primary_category,
+	subCategory: row.sub_category,
+	amount: row.amount,
+	type: row.type
+});
+
+let statements: ReturnType<typeof prepareStatements> | undefined;
+
+const prepareStatements = () => {
+	const db = getDatabase();
+	return {
+		listRange: db.prepare(
+			`SELECT * FROM transactions
+			WHERE date BETWEEN :startDate AND :endDate
+			ORDER BY date DESC, id DESC`
+		),
+		// Both page queries walk the (date DESC, id DESC) index and stop after :limit rows.
+		firstPage: db.prepare(
+			`SELECT * FROM transactions
+			WHERE date BETWEEN :startDate AND :endDate
+			ORDER BY date DESC, id DESC
+			LIMIT :limit`
+		),
+		// The row-value bound lets SQLite seek straight to the cursor instead of skipping rows.
+		pageAfter: db.prepare(
+			`SELECT * FROM transactions
+			WHERE (date, id) < (:cursorDate, :cursorId) AND date >= :startDate
+			ORDER BY date DESC, id DESC
+			LIMIT :limit`
+		),
+		insert: db.prepare(
+			`INSERT INTO transactions (id, date, label, primary_category, sub_category, amount, type)
+			VALUES (:id, :date, :label, :primaryCategory, :subCategory, :amount, :type)`
+		),
+		remove: db.prepare('DELETE FROM transactions WHERE id = :id')
+	};
+};
+
+const getStatements = () => (statements ??= prepareStatements());
+
+export const isIsoDate = (value: string): boolean => toEpochDay(value) !== INVALID_EPOCH_DAY;
+
+const toDateBounds = ({ startDate, endDate }: TransactionQuery) => {
+	const start = startDate || MIN_DATE;
+	const end = endDate || MAX_DATE;
+	return start <= end ? { startDate: start, endDate: end } : { startDate: end, endDate: start };
+};
+
+/** Transactions dated inside the inclusive range, newest first; either bound may be omitted. */
+export const listTransactions = (query: TransactionQuery): TransactionEntry[] => {
+	const rows = getStatements().listRange.all(toDateBounds(query));
+	return (rows as TransactionRow[]).map(toEntry);
+};
+
+/**
+ * Up to `limit` transactions that follow `cursor` in (date desc, id desc)
+ * order, the same order `recalculateState` shows. Each page is one bounded
+ * index seek, so its cost does not grow with the ledger or the page number.
+ * `cursor` must lie inside the range; check it with `cursorIsInRange`.
+ */
+export const listTransactionPage = (
+	query: TransactionQuery,
+	limit: number,
+	cursor: TransactionCursor | null = null
+): TransactionPage => {
+	const { firstPage, pageAfter } = getStatements();
+	const bounds = toDateBounds(query);
+	// One extra row tells whether another page exists.
+	const limitPlusOne = limit + 1;
+	const rows = (
+		cursor
+			? pageAfter.all({
+					startDate: bounds.startDate,
+					cursorDate: cursor.date,
+					cursorId: cursor.id,
+					limit: limitPlusOne
+				})
+			: firstPage.all({ ...bounds, limit: limitPlusOne })
+	) as TransactionRow[];
+
+	const data = rows.slice(0, limit).map(toEntry);
+	const last = data[data.length - 1];
+	const nextCursor = rows.length > limit && last ? { date: last.date, id: last.id } : null;
+
+	return { data, nextCursor };
+};
+
+/** Whether `cursor` could have come from a page of `query`'s range. */
+export const cursorIsInRange = (query: TransactionQuery, cursor: TransactionCursor): boolean => {
+	const { startDate, endDate } = toDateBounds(query);
+	return cursor.date >= startDate && cursor.date <= endDate;
+};
+
+/**
+ * Walks the whole range page by page. The first page is `firstLimit` rows so
+ * a streaming reader gets something to render after a single small query.
+ */
+export function* iterateTransactionPages(
+	query: TransactionQuery,
+	firstLimit: number,
+	limit: number
+): Generator<TransactionEntry[]> {
+	let page = listTransactionPage(query, firstLimit);
+	yield page.data;
+
+	while (page.nextCursor) {
+		page = listTransactionPage(query, limit, page.nextCursor);
+		yield page.data;
+	}
+}
+
+export const encodeCursor = ({ date, id }: TransactionCursor): string =>
+	Buffer.from(JSON.stringify([date, id])).toString('base64url');
+
+/** Null when `token` was not produced by `encodeCursor`. */
+export const decodeCursor = (token: string): TransactionCursor | null => {
+	try {
+		const [date, id] = JSON.parse(Buffer.from(token, 'base64url').toString());
+		return typeof date === 'string' && typeof id === 'string' && isIsoDate(date)
+			? { date, id }
+			: null;
+	} catch {
+		return null;
+	}
+};
+
+const asString = (value: unknown): string => (typeof value === 'string' ? value : '');
+
+/** Validates a request body with the same rules `TransactionForm` enforces. */
+export const parseTransactionInput = (body: unknown): ParsedTransactionFields => {
+	const input = (typeof body === 'object' && body !== null ? body : {}) as Record<string, unknown>;
+
+	return parseTransactionFields({
+		date: asString(input.date),
+		label: asString(input.label),
+		primaryCategory: asString(input.primaryCategory),
+		subCategory: asString(input.subCategory),
+		// The API takes numbers only; a numeric string is not a valid amount here.
+		amount: typeof input.amount === 'number' ? input.amount : Number.NaN
+	});
+};
+
+export const createTransaction = (draft: TransactionDraft): TransactionEntry => {
+	const entry: TransactionEntry = {
+		id: crypto.randomUUID(),
+		date: draft.date,
+		label: draft.label,
+		primaryCategory: draft.primaryCategory,
+		subCategory: draft.subCategory,
+		amount: toCurrency(draft.amount),
+		type: draft.primaryCategory === 'income' ? 'income' : 'expense'
+	};
+
+	getStatements().insert.run({ ...entry });
+	return entry;
+};
+
+/** Returns false when no transaction has `id`. */
+export const deleteTransaction = (id: string): boolean =>
+	Number(getStatements().remove.run({ id }).changes) > 0;
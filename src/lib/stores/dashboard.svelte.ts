@@ -0,0 +1,115 @@
+import { get } from 'svelte/store';
+
+import { transactionsStore } from '$lib/stores/transactions';
+import type {
+	CategoryShareSlice,
+	KPIBundle,
+	PeriodFilter,
+	PeriodTotals,
+	TransactionEntry,
+	TrendGranularity,
+	TrendSeriesPoint
+} from '$lib/types';
+
+export type DashboardTotals = Pick<
+	KPIBundle,
+	'totalIncome' | 'totalExpenses' | 'amountSaved' | 'leftoverBalance'
+>;
+
+const sameItems = <T>(a: T[], b: T[], same: (x: T, y: T) => boolean) =>
+	a === b || (a.length === b.length && a.every((item, index) => same(item, b[index])));
+
+const sameFilter = (a: PeriodFilter, b: PeriodFilter) =>
+	a.preset === b.preset && a.startDate === b.startDate && a.endDate === b.endDate;
+
+const sameTotals = (a: DashboardTotals, b: DashboardTotals) =>
+	a.totalIncome === b.totalIncome &&
+	a.totalExpenses === b.totalExpenses &&
+	a.amountSaved === b.amountSaved &&
+	a.leftoverBalance === b.leftoverBalance;
+
+const samePeriod = (a: PeriodTotals | null, b: PeriodTotals | null) =>
+	a === b ||
+	(a !== null &&
+		b !== null &&
+		a.totalIncome === b.totalIncome &&
+		a.totalExpenses === b.totalExpenses &&
+		a.amountSaved === b.amountSaved);
+
+const samePoint = (a: TrendSeriesPoint, b: TrendSeriesPoint) =>
+	a.label === b.label && a.income === b.income && a.expenses === b.expenses;
+
+const sameSlice = (a: CategoryShareSlice, b: CategoryShareSlice) =>
+	a.category === b.category && a.value === b.value && a.percentage === b.percentage;
+
+/** `previous` when `next` is structurally equal, so readers of the slice stay valid. */
+const keep = <T>(previous: T, next: T, same: (a: T, b: T) => boolean): T =>
+	same(previous, next) ? previous : next;
+
+const toTotals = ({ totalIncome, totalExpenses, amountSaved, leftoverBalance }: KPIBundle) => ({
+	totalIncome,
+	totalExpenses,
+	amountSaved,
+	leftoverBalance
+});
+
+const initial = get(transactionsStore);
+
+let filteredEntries = $state.raw<TransactionEntry[]>(initial.filteredEntries);
+let filter = $state.raw<PeriodFilter>(initial.filter);
+let totals = $state.raw<DashboardTotals>(toTotals(initial.kpis));
+let previousPeriod = $state.raw<PeriodTotals | null>(initial.kpis.previousPeriod);
+let trendGranularity = $state<TrendGranularity>(initial.kpis.trendGranularity);
+let trendSeries = $state.raw<TrendSeriesPoint[]>(initial.kpis.trendSeries);
+let categoryShare = $state.raw<CategoryShareSlice[]>(initial.kpis.categoryShare);
+let kpisPending = $state(initial.kpisPending);
+
+// Each store notification is split into slices; a slice whose content did not
+// change keeps its old reference, so only components reading a changed slice update.
+transactionsStore.subscribe((state) => {
+	filteredEntries = keep(filteredEntries, state.filteredEntries, (a, b) =>
+		sameItems(a, b, Object.is)
+	);
+	filter = keep(filter, state.filter, sameFilter);
+	totals = keep(totals, toTotals(state.kpis), sameTotals);
+	previousPeriod = keep(previousPeriod, state.kpis.previousPeriod, samePeriod);
+	trendGranularity = state.kpis.trendGranularity;
+	trendSeries = keep(trendSeries, state.kpis.trendSeries, (a, b) => sameItems(a, b, samePoint));
+	categoryShare = keep(categoryShare, state.kpis.categoryShare, (a, b) =>
+		sameItems(a, b, sameSlice)
+	);
+	kpisPending = state.kpisPending;
+});
+
+/**
+ * Runes view of `transactionsStore` split into independent reactive slices.
+ * Components read the getters inside `$derived`/markup and are invalidated
+ * only by the slices they touch: a KPI-only change leaves the table alone, and
+ * an add outside the active period touches nothing on screen.
+ */
+export const dashboard = {
+	get filteredEntries() {
+		return filteredEntries;
+	},
+	get filter() {
+		return filter;
+	},
+	get totals() {
+		return totals;
+	},
+	get previousPeriod() {
+		return previousPeriod;
+	},
+	get trendGranularity() {
+		return trendGranularity;
+	},
+	get trendSeries() {
+		return trendSeries;
+	},
+	get categoryShare() {
+		return categoryShare;
+	},
+	get kpisPending() {
+		return kpisPending;
+	}
+};
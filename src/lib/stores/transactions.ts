@@ -1,22 +1,53 @@
-import { writable } from 'svelte/store';
-import { addDays, format, parseISO, isValid as isValidDate, startOfWeek } from 'date-fns';
+import { get, writable } from 'svelte/store';
+import { addDays, format } from 'date-fns';
 
 import type {
 	KPIBundle,
 	PeriodFilter,
 	PeriodPreset,
+	PeriodTotals,
 	PrimaryCategory,
 	TransactionDraft,
 	TransactionEntry,
 	TransactionStoreState
 } from '$lib/types';
 import {
-	applyPresetToFilter,
-	compareEntriesByDateDesc,
-	dateIsWithinFilter,
-	resolvePresetRange
-} from '$lib/utils/filters';
-import { themeColor } from '$lib/utils/theme';
+	createDayRollups,
+	createKpiAccumulatorFromRollups,
+	sumDayRollups,
+	updateDayRollups,
+	type DayRollups
+} from '$lib/utils/dayRollups';
+import { entryAccent } from '$lib/utils/entryDisplay';
+import { applyPresetToFilter, resolvePresetRange } from '$lib/utils/filters';
+import { countEvent, measureStage } from '$lib/utils/instrumentation';
+import {
+	accumulateRow,
+	buildKpiBundle,
+	chooseTrendGranularity,
+	createKpiAccumulator,
+	createKpiAccumulatorFromColumns,
+	toCurrency,
+	type KpiAccumulator
+} from '$lib/utils/kpis';
+import {
+	copyLedgerColumns,
+	createColumnarLedger,
+	dayIsWithinRange,
+	findDateSpan,
+	findLedgerPosition,
+	insertIntoLedger,
+	precedingRange,
+	removeFromLedger,
+	toDayRange,
+	toEpochDay,
+	type ColumnarLedger,
+	type DayRange,
+	type LedgerSpan
+} from '$lib/utils/ledger';
+import { createLruCache } from '$lib/utils/lru';
+import type { LedgerPersistence } from '$lib/utils/persistence';
+import { createKpiAggregator, type KpiAggregator } from '$lib/workers/kpiAggregator';
 
 const DEFAULT_PRESET: PeriodPreset = 'this_month';
 
@@ -46,118 +77,320 @@ const generateId = (): string => {
 const deriveTransactionType = (category: PrimaryCategory) =>
 	category === 'income' ? 'income' : 'expense';
 
-const toCurrency = (value: number): number => Math.round((value + Number.EPSILON) * 100) / 100;
+const createEntry = (draft: TransactionDraft): TransactionEntry => ({
+	id: generateId(),
+	date: draft.date,
+	label: draft.label.trim(),
+	primaryCategory: draft.primaryCategory,
+	subCategory: draft.subCategory,
+	amount: toCurrency(draft.amount),
+	type: deriveTransactionType(draft.primaryCategory)
+});
+
+// Columnar, date-sorted view of `entries`; kept in step with the store on every mutation.
+let ledger: ColumnarLedger = createColumnarLedger([]);
+
+// Bumped on every row change and ledger replacement.
+let ledgerVersion = 0;
+
+// Bumped when the ledger is replaced by rows it did not evolve from (seed,
+// clear, restore), so range cache entries for the old rows can never match.
+let ledgerEpoch = 0;
+
+// Running totals for `filteredEntries`; rebuilt on filter changes, patched on add/remove.
+// Null while a large range waits for the worker to build the day rollups.
+let activeTotals: KpiAccumulator | null = createKpiAccumulator();
+
+// Ledgers at least this large build their day rollups on a worker when one
+// exists, and ranges this large wait for them rather than being scanned here.
+const WORKER_AGGREGATION_THRESHOLD = 20_000;
+
+let workerAggregation = true;
+let aggregator: KpiAggregator | null | undefined;
+
+const EMPTY_KPIS: KPIBundle = buildKpiBundle(createKpiAccumulator());
+
+// Saved rows outside the active range are read in batches this large.
+const BACKFILL_BATCH_SIZE = 10_000;
+
+// IndexedDB copy of the ledger, written through on every mutation once `restore` attaches it.
+let persistence: LedgerPersistence | null = null;
+
+// Bumped when the ledger is replaced wholesale, so an in-flight restore stops merging.
+let ledgerGeneration = 0;
+
+// Adds and removes made while a restore opens the database or reads from it, so
+// they are saved once it opens and its merges keep them.
+let restoreJournal: { added: Map<string, TransactionEntry>; removed: Set<string> } | null = null;
+
+/** Resolves once the write has finished or failed; callers need not wait for it. */
+const persist = (write: (target: LedgerPersistence) => Promise<void>): Promise<void> => {
+	const target = persistence;
+	if (!target) return Promise.resolve();
+
+	return write(target).catch(() => {
+		// Quota or eviction errors: carry on in memory rather than failing the mutation.
+		if (persistence !== target) return;
+		persistence = null;
+		target.close();
+	});
+};
+
+/** Marks a wholesale ledger replacement, so an in-flight restore stops merging into it. */
+const markReplaced = () => {
+	ledgerGeneration += 1;
+	restoreJournal = null;
+};
+
+/** Marks a wholesale ledger replacement and saves the new ledger in place of the old one. */
+const persistReplacement = () => {
+	markReplaced();
+	const entries = publishedEntries();
+	return persist((target) => target.replace(entries));
+};
+
+type RangeResult = {
+	range: DayRange;
+	filteredEntries: TransactionEntry[];
+	kpis: KPIBundle;
+	totals: KpiAccumulator;
+};
+
+// Results for recently shown date ranges, so flipping back to a preset is a
+// lookup. Keyed by ledger epoch and range; adds and removes, one at a time or
+// in bulk, drop only the ranges whose period or previous period contains a
+// changed day.
+const RANGE_CACHE_SIZE = 8;
+const rangeCache = createLruCache<string, RangeResult>(RANGE_CACHE_SIZE);
+
+const rangeKey = (range: DayRange) => `${ledgerEpoch}:${range.start}:${range.end}`;
+
+/** Caches a settled state's rows and KPIs under its filter range. */
+const rememberRange = (state: TransactionStoreState) => {
+	const range = toDayRange(state.filter.startDate, state.filter.endDate);
+	if (!range || state.kpisPending || !activeTotals) return;
+
+	rangeCache.set(rangeKey(range), {
+		range,
+		filteredEntries: state.filteredEntries,
+		kpis: state.kpis,
+		totals: activeTotals
+	});
+};
+
+const forgetRangesContaining = (day: number) => {
+	rangeCache.deleteWhere(
+		({ range }) => dayIsWithinRange(day, range) || dayIsWithinRange(day, precedingRange(range))
+	);
+};
+
+const getAggregator = (): KpiAggregator | null => {
+	if (!workerAggregation) return null;
+	if (aggregator === undefined) aggregator = createKpiAggregator();
+	return aggregator;
+};
+
+const disableWorkerAggregation = () => {
+	workerAggregation = false;
+	aggregator?.terminate();
+	aggregator = null;
+};
+
+const filterRange = (filter: PeriodFilter): DayRange | null =>
+	toDayRange(filter.startDate, filter.endDate);
+
+const filterSpan = (filter: PeriodFilter): LedgerSpan => findDateSpan(ledger, filterRange(filter));
+
+let snapshot: TransactionEntry[] = [];
+let snapshotVersion = -1;
+
+/**
+ * The ledger rows as an array later in-place edits cannot reach, copied at
+ * most once per ledger version. States hand this out, never `ledger.entries`.
+ */
+const publishedEntries = (): TransactionEntry[] => {
+	if (snapshotVersion !== ledgerVersion) {
+		snapshot = ledger.entries.slice();
+		snapshotVersion = ledgerVersion;
+	}
+	return snapshot;
+};
 
-const buildTrendSeries = (entries: TransactionEntry[]) => {
-	type TrendAccumulator = {
-		label: string;
-		startDate: Date;
-		income: number;
-		expenses: number;
+// Per-day Fenwick rollups of the whole ledger. Undefined until first needed
+// after the ledger is replaced; null when its dates span too many days.
+let dayRollups: DayRollups | null | undefined;
+let rollupsBuilding = false;
+
+/**
+ * Builds the rollups on the worker, then recalculates the current state from
+ * them. A ledger that changed meanwhile makes the result stale; it is dropped
+ * and the next query asks again.
+ */
+const buildRollupsOnWorker = (worker: KpiAggregator) => {
+	const version = ledgerVersion;
+	rollupsBuilding = true;
+	countEvent('workerAggregations');
+
+	const settle = () => {
+		rollupsBuilding = false;
+		// Ranges cached meanwhile were scanned without the previous-period totals.
+		rangeCache.clear();
+		update((state) => recalculateState(ledger, state.filter, state.kpis));
 	};
 
-	const buckets = entries.reduce<Map<string, TrendAccumulator>>((acc, entry) => {
-		const parsed = parseISO(entry.date);
-		if (!isValidDate(parsed)) return acc;
-
-		const bucketDate = startOfWeek(parsed, { weekStartsOn: 1 });
-		const key = bucketDate.toISOString().slice(0, 10);
-
-		const bucket =
-			acc.get(key) ??
-			acc
-				.set(key, {
-					label: format(bucketDate, 'MMM d'),
-					startDate: bucketDate,
-					income: 0,
-					expenses: 0
-				})
-				.get(key)!;
-
-		if (entry.type === 'income') {
-			bucket.income += entry.amount;
-		} else {
-			bucket.expenses += entry.amount;
+	worker.buildRollups(copyLedgerColumns(ledger, { from: 0, to: ledger.size })).then(
+		(rollups) => {
+			if (version === ledgerVersion) {
+				dayRollups = rollups && { ...rollups, categoryNames: ledger.categoryNames };
+			}
+			settle();
+		},
+		() => {
+			disableWorkerAggregation();
+			settle();
 		}
+	);
+};
 
-		return acc;
-	}, new Map());
+/** The rollups, or null when there are none or the worker is still building them. */
+const getDayRollups = (): DayRollups | null => {
+	if (dayRollups !== undefined || rollupsBuilding) return dayRollups ?? null;
 
-	return Array.from(buckets.values())
-		.sort((a, b) => a.startDate.getTime() - b.startDate.getTime())
-		.map(({ label, income, expenses }) => ({
-			label,
-			income: toCurrency(income),
-			expenses: toCurrency(expenses)
-		}));
+	const worker = ledger.size >= WORKER_AGGREGATION_THRESHOLD ? getAggregator() : null;
+	if (worker) {
+		buildRollupsOnWorker(worker);
+		return null;
+	}
+
+	countEvent('entriesScanned', ledger.size);
+	dayRollups = createDayRollups(ledger);
+	return dayRollups;
 };
 
-const buildCategoryShare = (entries: TransactionEntry[]) => {
-	const expenses = entries.filter((entry) => entry.type === 'expense');
-	const total = expenses.reduce((sum, entry) => sum + entry.amount, 0);
+/** Keeps the rollups in step with a row just added (1) or about to be removed (-1). */
+const updateRollups = (position: number, direction: 1 | -1) => {
+	if (dayRollups && !updateDayRollups(dayRollups, ledger, position, direction)) {
+		dayRollups = undefined;
+	}
+};
+
+/** Totals for the equally long period just before `range`, when rollups can answer. */
+const previousPeriodTotals = (range: DayRange | null): PeriodTotals | null => {
+	if (!range) return null;
+	const rollups = getDayRollups();
+	return rollups ? sumDayRollups(rollups, precedingRange(range)) : null;
+};
+
+/**
+ * Rebuilds `activeTotals` for `range`: from the day rollups when the ledger
+ * has them, otherwise from the ledger rows in range. Returns the new KPIs, or
+ * null when a large range waits for the worker's rollups, which arrive
+ * through a store update; until then the UI keeps showing the previous bundle.
+ */
+const rebuildTotals = (range: DayRange | null): KPIBundle | null => {
+	const granularity = chooseTrendGranularity(range);
+	const rollups = range ? getDayRollups() : null;
+
+	if (range && rollups) {
+		countEvent('rollupQueries');
+		const totals = measureStage('aggregateTotals', () =>
+			createKpiAccumulatorFromRollups(rollups, range)
+		);
+		activeTotals = totals;
+		return buildKpiBundle(totals, granularity, sumDayRollups(rollups, precedingRange(range)));
+	}
+
+	const span = findDateSpan(ledger, range);
+	if (rollupsBuilding && span.to - span.from >= WORKER_AGGREGATION_THRESHOLD) {
+		activeTotals = null;
+		return null;
+	}
+
+	countEvent('entriesScanned', span.to - span.from);
+	const totals = measureStage('aggregateTotals', () =>
+		createKpiAccumulatorFromColumns(ledger, span)
+	);
+	activeTotals = totals;
+	return buildKpiBundle(totals, granularity);
+};
 
-	if (total <= 0) {
-		return [];
+/**
+ * KPIs after an in-filter add/remove. The row has already been folded into
+ * `activeTotals`, and the previous period cannot have changed; if the range
+ * is still waiting for the worker's rollups, ask again instead.
+ */
+const refreshTotals = (
+	span: LedgerSpan,
+	range: DayRange | null,
+	previous: KPIBundle
+): Pick<TransactionStoreState, 'kpis' | 'kpisPending'> => {
+	if (activeTotals) {
+		countEvent('incrementalUpdates');
+		countEvent('entriesSkipped', span.to - span.from);
+		const granularity = chooseTrendGranularity(range);
+		return {
+			kpis: buildKpiBundle(activeTotals, granularity, previous.previousPeriod),
+			kpisPending: false
+		};
 	}
 
-	const bucket = expenses.reduce<Record<string, number>>((acc, entry) => {
-		const key = entry.subCategory || entry.primaryCategory;
-		acc[key] = (acc[key] ?? 0) + entry.amount;
-		return acc;
-	}, {});
-
-	return Object.entries(bucket)
-		.map(([category, value]) => ({
-			category,
-			value: toCurrency(value),
-			percentage: Math.round((value / total) * 1000) / 10
-		}))
-		.sort((a, b) => b.value - a.value);
+	const kpis = rebuildTotals(range);
+	return { kpis: kpis ?? previous, kpisPending: kpis === null };
+};
+
+/** Swaps in `next` as a revision of the current rows; cached ranges are left to the caller. */
+const reviseLedger = (next: ColumnarLedger) => {
+	ledger = next;
+	ledgerVersion += 1;
+	dayRollups = undefined;
 };
 
 const recalculateState = (
-	entries: TransactionEntry[],
+	next: ColumnarLedger,
 	filter: PeriodFilter,
+	previousKpis: KPIBundle = EMPTY_KPIS,
 	now = new Date()
-): TransactionStoreState => {
-	const normalizedFilter = applyPresetToFilter(filter, now);
-
-	const filteredEntries = entries
-		.filter((entry) => dateIsWithinFilter(entry.date, normalizedFilter))
-		.sort((a, b) => {
-			const byDate = compareEntriesByDateDesc(a.date, b.date);
-			if (byDate !== 0) return byDate;
-			return a.id > b.id ? -1 : 1;
-		});
+): TransactionStoreState =>
+	measureStage('recalculateState', () => {
+		const normalizedFilter = applyPresetToFilter(filter, now);
+
+		if (next !== ledger) {
+			ledgerEpoch += 1;
+			// Old entries cannot be hit any more; drop them rather than hold on to their rows.
+			rangeCache.clear();
+			reviseLedger(next);
+		}
 
-	const totalIncome = filteredEntries
-		.filter((entry) => entry.type === 'income')
-		.reduce((sum, entry) => sum + entry.amount, 0);
-
-	const totalExpenses = filteredEntries
-		.filter((entry) => entry.type === 'expense')
-		.reduce((sum, entry) => sum + entry.amount, 0);
-
-	const kpis: KPIBundle = {
-		totalIncome: toCurrency(totalIncome),
-		totalExpenses: toCurrency(totalExpenses),
-		amountSaved: toCurrency(totalIncome - totalExpenses),
-		leftoverBalance: toCurrency(totalIncome - totalExpenses),
-		trendSeries: buildTrendSeries(filteredEntries),
-		categoryShare: buildCategoryShare(filteredEntries)
-	};
+		const range = toDayRange(normalizedFilter.startDate, normalizedFilter.endDate);
+		const cached = range ? rangeCache.get(rangeKey(range)) : undefined;
+		if (cached) {
+			countEvent('rangeCacheHits');
+			activeTotals = cached.totals;
+			return {
+				entries: publishedEntries(),
+				filter: normalizedFilter,
+				filteredEntries: cached.filteredEntries,
+				kpis: cached.kpis,
+				kpisPending: false
+			};
+		}
 
-	return {
-		entries: entries.slice().sort((a, b) => {
-			const byDate = compareEntriesByDateDesc(a.date, b.date);
-			if (byDate !== 0) return byDate;
-			return a.id > b.id ? -1 : 1;
-		}),
-		filter: normalizedFilter,
-		filteredEntries,
-		kpis
-	};
-};
+		const span = findDateSpan(ledger, range);
+		const kpis = rebuildTotals(range);
+		const state: TransactionStoreState = {
+			entries: publishedEntries(),
+			filter: normalizedFilter,
+			filteredEntries: ledger.entries.slice(span.from, span.to),
+			kpis: kpis ?? previousKpis,
+			kpisPending: kpis === null
+		};
+
+		rememberRange(state);
+		return state;
+	});
+
+const isInFilter = (position: number, filter: PeriodFilter) =>
+	dayIsWithinRange(ledger.epochDays[position], filterRange(filter));
 
 const createDefaultEntries = (): TransactionEntry[] => {
 	const today = new Date();
@@ -192,81 +425,413 @@ const createDefaultEntries = (): TransactionEntry[] => {
 		}
 	];
 
-	return sample.sort((a, b) => compareEntriesByDateDesc(a.date, b.date));
+	return sample;
+};
+
+/**
+ * State after a row change outside the filter. Only the previous-period totals
+ * can move, and only when the row's day falls in that period.
+ */
+const changeOutsideFilter = (state: TransactionStoreState, day: number): TransactionStoreState => {
+	const range = filterRange(state.filter);
+	if (!range || !state.kpis.previousPeriod || !dayIsWithinRange(day, precedingRange(range))) {
+		return state;
+	}
+
+	const next = {
+		...state,
+		kpis: { ...state.kpis, previousPeriod: previousPeriodTotals(range) }
+	};
+	rememberRange(next);
+	return next;
+};
+
+/**
+ * Inserts one entry, patching the running totals when it lands inside the
+ * filter. Duplicate ids are ignored. Leaves `entries` for `applyMutations` to
+ * publish once per batch.
+ */
+const addToState = (
+	state: TransactionStoreState,
+	entry: TransactionEntry
+): TransactionStoreState => {
+	const position = insertIntoLedger(ledger, entry);
+	if (position === -1) return state;
+
+	ledgerVersion += 1;
+	const day = ledger.epochDays[position];
+	updateRollups(position, 1);
+	forgetRangesContaining(day);
+	if (!isInFilter(position, state.filter)) {
+		return changeOutsideFilter(state, day);
+	}
+
+	if (activeTotals) accumulateRow(activeTotals, ledger, position, 1);
+	const span = filterSpan(state.filter);
+	const next = {
+		...state,
+		filteredEntries: ledger.entries.slice(span.from, span.to),
+		...refreshTotals(span, filterRange(state.filter), state.kpis)
+	};
+	rememberRange(next);
+	return next;
+};
+
+const removeFromState = (state: TransactionStoreState, id: string): TransactionStoreState => {
+	const position = findLedgerPosition(ledger, id);
+	if (position === -1) return state;
+
+	const inFilter = isInFilter(position, state.filter);
+	const day = ledger.epochDays[position];
+	forgetRangesContaining(day);
+	// Fold the row out while its columns are still in place.
+	updateRollups(position, -1);
+	if (inFilter && activeTotals) accumulateRow(activeTotals, ledger, position, -1);
+	removeFromLedger(ledger, position);
+	ledgerVersion += 1;
+	if (!inFilter) {
+		return changeOutsideFilter(state, day);
+	}
+
+	const span = filterSpan(state.filter);
+	const next = {
+		...state,
+		filteredEntries: ledger.entries.slice(span.from, span.to),
+		...refreshTotals(span, filterRange(state.filter), state.kpis)
+	};
+	rememberRange(next);
+	return next;
+};
+
+type Mutation =
+	| { kind: 'add'; entries: TransactionEntry[] }
+	| { kind: 'remove'; ids: string[] }
+	| { kind: 'filter'; next: (filter: PeriodFilter) => PeriodFilter };
+
+// Up to this many added/removed rows per flush, each is patched into the ledger
+// and totals in place; past it, rebuilding the ledger once is cheaper.
+const INCREMENTAL_MUTATION_LIMIT = 16;
+
+/**
+ * Applies queued mutations as one state change. Filter changes only take
+ * effect before the next row change (or at the end), so a burst of preset
+ * clicks costs a single recalculation.
+ */
+const applyMutations = (
+	state: TransactionStoreState,
+	mutations: Mutation[]
+): TransactionStoreState => {
+	let rows = 0;
+	for (const mutation of mutations) {
+		if (mutation.kind === 'add') rows += mutation.entries.length;
+		if (mutation.kind === 'remove') rows += mutation.ids.length;
+	}
+
+	if (rows > INCREMENTAL_MUTATION_LIMIT) {
+		const added: TransactionEntry[] = [];
+		const removed = new Set<string>();
+		let filter = state.filter;
+
+		for (const mutation of mutations) {
+			if (mutation.kind === 'add') {
+				for (const entry of mutation.entries) added.push(entry);
+			} else if (mutation.kind === 'remove') {
+				for (const id of mutation.ids) removed.add(id);
+			} else {
+				filter = mutation.next(filter);
+			}
+		}
+
+		for (const entry of added) forgetRangesContaining(toEpochDay(entry.date));
+		for (const id of removed) {
+			const day = ledger.epochDayById.get(id);
+			if (day !== undefined) forgetRangesContaining(day);
+		}
+
+		const combined = ledger.entries.concat(added);
+		const kept = removed.size > 0 ? combined.filter((entry) => !removed.has(entry.id)) : combined;
+		// The rebuilt ledger holds the same rows in the same order outside the changed days.
+		reviseLedger(createColumnarLedger(kept));
+		return recalculateState(ledger, filter, state.kpis);
+	}
+
+	let current = state;
+	let pendingFilter: PeriodFilter | null = null;
+	const settleFilter = () => {
+		if (!pendingFilter) return;
+		current = recalculateState(ledger, pendingFilter, current.kpis);
+		pendingFilter = null;
+	};
+
+	for (const mutation of mutations) {
+		if (mutation.kind === 'filter') {
+			pendingFilter = mutation.next(pendingFilter ?? current.filter);
+			continue;
+		}
+
+		settleFilter();
+		if (mutation.kind === 'add') {
+			for (const entry of mutation.entries) current = addToState(current, entry);
+		} else {
+			for (const id of mutation.ids) current = removeFromState(current, id);
+		}
+	}
+
+	settleFilter();
+	return { ...current, entries: publishedEntries() };
 };
 
 const { subscribe, update, set } = writable<TransactionStoreState>(
-	recalculateState(createDefaultEntries(), initialFilter)
+	recalculateState(createColumnarLedger(createDefaultEntries()), initialFilter)
 );
 
+let queuedMutations: Mutation[] = [];
+let transactionDepth = 0;
+let frameScheduling = false;
+let frameRequest: number | null = null;
+
+/** Applies every queued mutation in a single store update. */
+const flushMutations = () => {
+	if (frameRequest !== null) {
+		cancelAnimationFrame(frameRequest);
+		frameRequest = null;
+	}
+	if (queuedMutations.length === 0) return;
+
+	const mutations = queuedMutations;
+	queuedMutations = [];
+	update((state) => applyMutations(state, mutations));
+};
+
+const enqueue = (mutation: Mutation) => {
+	queuedMutations.push(mutation);
+	if (transactionDepth > 0) return;
+
+	if (frameScheduling && typeof requestAnimationFrame !== 'undefined') {
+		frameRequest ??= requestAnimationFrame(() => {
+			frameRequest = null;
+			flushMutations();
+		});
+		return;
+	}
+
+	flushMutations();
+};
+
+const forgetInRestore = (ids: string[]) => {
+	if (!restoreJournal) return;
+	for (const id of ids) {
+		restoreJournal.added.delete(id);
+		restoreJournal.removed.add(id);
+	}
+};
+
 export const transactionsStore = {
 	subscribe,
 	addEntry(draft: TransactionDraft) {
-		update((state) => {
-			const entry: TransactionEntry = {
-				id: generateId(),
-				date: draft.date,
-				label: draft.label.trim(),
-				primaryCategory: draft.primaryCategory,
-				subCategory: draft.subCategory,
-				amount: toCurrency(draft.amount),
-				type: deriveTransactionType(draft.primaryCategory)
-			};
-
-			const entries = [entry, ...state.entries];
-			return recalculateState(entries, state.filter);
-		});
+		const entry = createEntry(draft);
+		enqueue({ kind: 'add', entries: [entry] });
+		restoreJournal?.added.set(entry.id, entry);
+		persist((target) => target.put([entry]));
+	},
+	/**
+	 * Adds many drafts in one store update and one KPI recalculation, rather
+	 * than one per entry. Returns the number added.
+	 */
+	addMany(drafts: TransactionDraft[]) {
+		if (drafts.length === 0) return 0;
+
+		const entries = drafts.map(createEntry);
+		enqueue({ kind: 'add', entries });
+		for (const entry of entries) restoreJournal?.added.set(entry.id, entry);
+		persist((target) => target.put(entries));
+		return entries.length;
 	},
 	removeEntry(id: string) {
-		update((state) => {
-			const entries = state.entries.filter((entry) => entry.id !== id);
-			return recalculateState(entries, state.filter);
-		});
+		forgetInRestore([id]);
+		persist((target) => target.remove([id]));
+		enqueue({ kind: 'remove', ids: [id] });
 	},
-	setPreset(preset: PeriodPreset) {
-		update((state) => {
-			const { start, end } = resolvePresetRange(preset);
-			const nextFilter: PeriodFilter = {
-				preset,
-				startDate: start,
-				endDate: end
-			};
+	/** Removes every entry in `ids` with one store update. */
+	removeMany(ids: string[]) {
+		if (ids.length === 0) return;
 
-			return recalculateState(state.entries, nextFilter);
+		forgetInRestore(ids);
+		persist((target) => target.remove(ids));
+		enqueue({ kind: 'remove', ids });
+	},
+	setPreset(preset: PeriodPreset) {
+		enqueue({
+			kind: 'filter',
+			next: () => {
+				const { start, end } = resolvePresetRange(preset);
+				return { preset, startDate: start, endDate: end };
+			}
 		});
 	},
 	setCustomRange(startDate: string, endDate: string) {
-		update((state) => {
-			const nextFilter: PeriodFilter = {
-				...state.filter,
-				preset: 'custom',
-				startDate,
-				endDate
-			};
-
-			return recalculateState(state.entries, nextFilter);
+		enqueue({
+			kind: 'filter',
+			next: (filter) => ({ ...filter, preset: 'custom', startDate, endDate })
 		});
 	},
+	/**
+	 * Runs `run` with store updates held back, then applies everything it did
+	 * as one recalculation and one subscriber notification. Nested calls flush
+	 * when the outermost one returns.
+	 */
+	transaction(run: () => void) {
+		transactionDepth += 1;
+		try {
+			run();
+		} finally {
+			transactionDepth -= 1;
+			if (transactionDepth === 0) flushMutations();
+		}
+	},
+	/**
+	 * With frame scheduling on, mutations made outside `transaction` are queued
+	 * and applied together on the next animation frame instead of one by one.
+	 * Reads through `get` see the previous state until then; `flush` applies
+	 * the queue right away.
+	 */
+	setFrameScheduling(enabled: boolean) {
+		frameScheduling = enabled;
+		if (!enabled) flushMutations();
+	},
+	flush() {
+		flushMutations();
+	},
+	/** Shows the sample entries under the default filter. Saved history is left alone. */
 	resetFilter() {
-		set(recalculateState(createDefaultEntries(), initialFilter));
+		flushMutations();
+		set(recalculateState(createColumnarLedger(createDefaultEntries()), initialFilter));
+		markReplaced();
 	},
-	clear() {
+	/**
+	 * Empties the ledger in memory. Saved history is only erased with
+	 * `erase: true`, which callers pass once the user has confirmed it.
+	 */
+	clear({ erase = false }: { erase?: boolean } = {}) {
+		flushMutations();
 		set(
-			recalculateState([], {
+			recalculateState(createColumnarLedger([]), {
 				preset: DEFAULT_PRESET,
 				startDate: initialFilter.startDate,
 				endDate: initialFilter.endDate
 			})
 		);
+		if (erase) {
+			persistReplacement();
+		} else {
+			markReplaced();
+		}
 	},
+	/** Replaces the ledger with `entries`; resolves once they are saved, if the ledger is. */
 	seed(entries: TransactionEntry[]) {
-		set(recalculateState(entries, initialFilter));
+		flushMutations();
+		update((state) => recalculateState(createColumnarLedger(entries), initialFilter, state.kpis));
+		return persistReplacement();
+	},
+	/**
+	 * Switches the ledger to the copy saved in IndexedDB and writes every later
+	 * mutation through to it. Rows in the active filter's range are read and
+	 * shown first, so the dashboard is usable right away; the rest of the
+	 * history is read in batches and merged in once, after the last one. With
+	 * nothing saved yet the current ledger becomes the saved one. Stops early
+	 * if the ledger is replaced meanwhile (seed, clear). Takes the database
+	 * while it is still opening: changes made before it is ready are journaled
+	 * and written once it is. Resolves with the rows restored.
+	 */
+	async restore(opening: Promise<LedgerPersistence | null>) {
+		const generation = ledgerGeneration;
+		const superseded = () => generation !== ledgerGeneration;
+		const journal = { added: new Map<string, TransactionEntry>(), removed: new Set<string>() };
+
+		restoreJournal = journal;
+
+		try {
+			const target = await opening;
+			if (!target) return 0;
+
+			persistence = target;
+			if (superseded()) return 0;
+
+			// Nothing was written through while the database opened; catch up now.
+			const added = Array.from(journal.added.values());
+			const removed = Array.from(journal.removed);
+			if (added.length > 0) persist((saved) => saved.put(added));
+			if (removed.length > 0) persist((saved) => saved.remove(removed));
+
+			if ((await target.count()) === 0) {
+				if (!superseded()) persistReplacement();
+				return 0;
+			}
+
+			const { filter } = get({ subscribe });
+			const active = await target.readRange(filter.startDate, filter.endDate);
+			if (superseded()) return 0;
+
+			const activeRows = active
+				.filter((entry) => !journal.removed.has(entry.id) && !journal.added.has(entry.id))
+				.concat(Array.from(journal.added.values()));
+			update((state) =>
+				recalculateState(createColumnarLedger(activeRows), state.filter, state.kpis)
+			);
+			let restored = active.length;
+
+			// Rebuilding the ledger per batch would re-sort everything read so far
+			// each time; the active range is already on screen, so build it once.
+			const backfill: TransactionEntry[] = [];
+			for await (const batch of target.readOutside(
+				filter.startDate,
+				filter.endDate,
+				BACKFILL_BATCH_SIZE
+			)) {
+				if (superseded()) return restored;
+				for (const entry of batch) backfill.push(entry);
+				restored += batch.length;
+			}
+			if (superseded()) return restored;
+
+			// Rows added meanwhile are already in the ledger and win over their saved copy.
+			const rows = backfill.filter(
+				(entry) => !ledger.epochDayById.has(entry.id) && !journal.removed.has(entry.id)
+			);
+			if (rows.length > 0) {
+				update((state) =>
+					recalculateState(
+						createColumnarLedger(ledger.entries.concat(rows)),
+						state.filter,
+						state.kpis
+					)
+				);
+			}
+
+			return restored;
+		} finally {
+			if (restoreJournal === journal) restoreJournal = null;
+		}
+	},
+	/** Large ledgers build their day rollups on a Web Worker unless this is switched off. */
+	setWorkerAggregation(enabled: boolean) {
+		if (enabled) {
+			workerAggregation = true;
+			// A terminated aggregator is replaced on the next large rollup build.
+			if (aggregator === null) aggregator = undefined;
+		} else {
+			disableWorkerAggregation();
+		}
+	},
+	/** Forgets every cached filter range, so benchmarks can time filter changes cold. */
+	clearRangeCache() {
+		rangeCache.clear();
 	},
 	getSubcategories(category: PrimaryCategory) {
 		return DEFAULT_SUBCATEGORIES[category] ?? [];
 	},
 	getAccentFor(entry: TransactionEntry) {
-		return entry.type === 'income' ? themeColor('positive') : themeColor('negative');
+		return entryAccent(entry);
 	}
 };
 
@@ -36,26 +36,41 @@ export interface TrendSeriesPoint {
 	expenses: number;
 }
 
+/** Span of one `TrendSeriesPoint`, picked from the length of the viewed range. */
+export type TrendGranularity = 'day' | 'week' | 'month';
+
 export interface CategoryShareSlice {
 	category: PrimaryCategory | string;
 	percentage: number;
 	value: number;
 }
 
+export interface PeriodTotals {
+	totalIncome: number;
+	totalExpenses: number;
+	amountSaved: number;
+}
+
 export interface KPIBundle {
 	totalIncome: number;
 	totalExpenses: number;
 	amountSaved: number;
 	leftoverBalance: number;
+	/** The equally long period just before the filter range, for period-over-period deltas. */
+	previousPeriod: PeriodTotals | null;
+	trendGranularity: TrendGranularity;
 	trendSeries: TrendSeriesPoint[];
 	categoryShare: CategoryShareSlice[];
 }
 
 export interface TransactionStoreState {
+	/** The ledger's own row array, updated in place by adds and removes; copy it to keep it. */
 	entries: TransactionEntry[];
 	filter: PeriodFilter;
 	filteredEntries: TransactionEntry[];
 	kpis: KPIBundle;
+	/** True while a worker recomputes `kpis`; the previous bundle stays visible meanwhile. */
+	kpisPending: boolean;
 }
 
 export const THEME_COLOR_TOKENS = [
@@ -0,0 +1,278 @@
+import type { PeriodTotals } from '$lib/types';
+import { createKpiAccumulator, toCurrency, type KpiAccumulator } from '$lib/utils/kpis';
+import {
+	INVALID_EPOCH_DAY,
+	type ColumnarLedger,
+	type DayRange,
+	type LedgerColumns
+} from '$lib/utils/ledger';
+
+// Past this many days between the oldest and newest entry the per-category
+// columns outweigh the scans they save; callers aggregate spans directly instead.
+const MAX_ROLLUP_DAYS = 366 * 20;
+
+// Spare days kept past the newest covered day when the rollups grow forward,
+// so entries added day by day toward today do not reallocate each time.
+const GROWTH_HEADROOM_DAYS = 31;
+
+/**
+ * Per-day sums for every day from the oldest to the newest dated entry. Each
+ * summed column is a Fenwick (binary indexed) tree over day offsets from
+ * `firstDay`, so the total for any day range is two O(log days) prefix
+ * lookups and an add or remove is an O(log days) point update. The raw
+ * `daily*` columns back trend buckets. Category columns are indexed by ledger
+ * category code and, like `categoryShare`, cover expenses only.
+ */
+export interface DayRollups {
+	firstDay: number;
+	days: number;
+	income: Float64Array;
+	expenses: Float64Array;
+	counts: Float64Array;
+	dailyIncome: Float64Array;
+	dailyExpenses: Float64Array;
+	dailyCounts: Uint32Array;
+	categoryValues: Float64Array[];
+	categoryCounts: Float64Array[];
+	/** The ledger's own array, so categories interned later resolve too. */
+	categoryNames: string[];
+}
+
+/** Turns values stored at 1..n into a Fenwick tree over them, in place and in O(n). */
+const toFenwick = (tree: Float64Array) => {
+	for (let index = 1; index < tree.length; index += 1) {
+		const parent = index + (index & -index);
+		if (parent < tree.length) tree[parent] += tree[index];
+	}
+	return tree;
+};
+
+/** Undoes `toFenwick`, leaving the per-day values at 1..n, in place and in O(n). */
+const fromFenwick = (tree: Float64Array) => {
+	for (let index = tree.length - 1; index > 0; index -= 1) {
+		const parent = index + (index & -index);
+		if (parent < tree.length) tree[parent] -= tree[index];
+	}
+	return tree;
+};
+
+/** A Fenwick tree over `days` day offsets, holding `values` from offset `at` on. */
+const buildTree = (values: ArrayLike<number>, days: number, at = 0) => {
+	const tree = new Float64Array(days + 1);
+	tree.set(values, at + 1);
+	return toFenwick(tree);
+};
+
+const addAt = (tree: Float64Array, offset: number, delta: number) => {
+	for (let index = offset + 1; index < tree.length; index += index & -index) {
+		tree[index] += delta;
+	}
+};
+
+/** Sum over day offsets `0..offset`. */
+const prefixSum = (tree: Float64Array, offset: number) => {
+	let sum = 0;
+	for (let index = Math.min(offset + 1, tree.length - 1); index > 0; index -= index & -index) {
+		sum += tree[index];
+	}
+	return sum;
+};
+
+const rangeSum = (tree: Float64Array, from: number, to: number) =>
+	prefixSum(tree, to) - (from > 0 ? prefixSum(tree, from - 1) : 0);
+
+/** Day offsets of `range` clipped to the covered days; `from > to` when they do not overlap. */
+const coveredOffsets = (rollups: DayRollups, range: DayRange) => ({
+	from: Math.max(range.start - rollups.firstDay, 0),
+	to: Math.min(range.end - rollups.firstDay, rollups.days - 1)
+});
+
+/**
+ * Rollups for the first `size` rows of `ledger` in one pass, or null when
+ * their dates span more than `MAX_ROLLUP_DAYS`. Takes plain columns too, so a
+ * worker can build them from a `copyLedgerColumns` copy.
+ */
+export const createDayRollups = (
+	ledger: LedgerColumns & Pick<ColumnarLedger, 'size'>
+): DayRollups | null => {
+	const { size, epochDays, amounts, incomeFlags, categoryCodes, categoryNames } = ledger;
+
+	// Newest first, with malformed dates sorted last: the valid run is `0..last`.
+	let last = size - 1;
+	while (last >= 0 && epochDays[last] === INVALID_EPOCH_DAY) last -= 1;
+
+	const firstDay = last >= 0 ? epochDays[last] : 0;
+	const days = last >= 0 ? epochDays[0] - firstDay + 1 : 0;
+	if (days > MAX_ROLLUP_DAYS) return null;
+
+	const dailyIncome = new Float64Array(days);
+	const dailyExpenses = new Float64Array(days);
+	const dailyCounts = new Uint32Array(days);
+	const categoryValues = categoryNames.map(() => new Float64Array(days + 1));
+	const categoryCounts = categoryNames.map(() => new Float64Array(days + 1));
+
+	for (let position = 0; position <= last; position += 1) {
+		const offset = epochDays[position] - firstDay;
+		const amount = amounts[position];
+
+		dailyCounts[offset] += 1;
+		if (incomeFlags[position] === 1) {
+			dailyIncome[offset] += amount;
+		} else {
+			dailyExpenses[offset] += amount;
+			const code = categoryCodes[position];
+			categoryValues[code][offset + 1] += amount;
+			categoryCounts[code][offset + 1] += 1;
+		}
+	}
+
+	return {
+		firstDay,
+		days,
+		income: buildTree(dailyIncome, days),
+		expenses: buildTree(dailyExpenses, days),
+		counts: buildTree(dailyCounts, days),
+		dailyIncome,
+		dailyExpenses,
+		dailyCounts,
+		categoryValues: categoryValues.map(toFenwick),
+		categoryCounts: categoryCounts.map(toFenwick),
+		categoryNames
+	};
+};
+
+/**
+ * Widens the covered days to take in `day`, moving every column into arrays
+ * of the new length in O(days). Growth toward newer days adds headroom.
+ * Returns false, changing nothing, when the span would exceed `MAX_ROLLUP_DAYS`.
+ */
+const coverDay = (rollups: DayRollups, day: number): boolean => {
+	const empty = rollups.days === 0;
+	const lastDay = rollups.firstDay + rollups.days - 1;
+	const firstDay = empty ? day : Math.min(rollups.firstDay, day);
+	const neededLastDay = empty ? day : Math.max(lastDay, day);
+	if (neededLastDay - firstDay + 1 > MAX_ROLLUP_DAYS) return false;
+
+	const headroom = empty || day > lastDay ? GROWTH_HEADROOM_DAYS : 0;
+	const days = Math.min(neededLastDay + headroom - firstDay + 1, MAX_ROLLUP_DAYS);
+	const at = empty ? 0 : rollups.firstDay - firstDay;
+
+	const dailyIncome = new Float64Array(days);
+	const dailyExpenses = new Float64Array(days);
+	const dailyCounts = new Uint32Array(days);
+	dailyIncome.set(rollups.dailyIncome, at);
+	dailyExpenses.set(rollups.dailyExpenses, at);
+	dailyCounts.set(rollups.dailyCounts, at);
+
+	// Category columns keep no per-day copy, so their trees are unwound first.
+	const move = (tree: Float64Array) => buildTree(fromFenwick(tree).subarray(1), days, at);
+
+	rollups.firstDay = firstDay;
+	rollups.days = days;
+	rollups.income = buildTree(dailyIncome, days);
+	rollups.expenses = buildTree(dailyExpenses, days);
+	rollups.counts = buildTree(dailyCounts, days);
+	rollups.dailyIncome = dailyIncome;
+	rollups.dailyExpenses = dailyExpenses;
+	rollups.dailyCounts = dailyCounts;
+	rollups.categoryValues = rollups.categoryValues.map(move);
+	rollups.categoryCounts = rollups.categoryCounts.map(move);
+	return true;
+};
+
+/**
+ * Folds the ledger row at `position` into (direction 1) or out of
+ * (direction -1) the rollups, first widening them when the row's day lies
+ * outside the covered days. Returns false, changing nothing, when that would
+ * span more than `MAX_ROLLUP_DAYS`; the rollups must then be rebuilt.
+ */
+export const updateDayRollups = (
+	rollups: DayRollups,
+	ledger: ColumnarLedger,
+	position: number,
+	direction: 1 | -1
+): boolean => {
+	const day = ledger.epochDays[position];
+	if (day === INVALID_EPOCH_DAY) return true;
+
+	const covered = day >= rollups.firstDay && day < rollups.firstDay + rollups.days;
+	if (!covered && !coverDay(rollups, day)) return false;
+
+	const offset = day - rollups.firstDay;
+
+	const delta = direction * ledger.amounts[position];
+	rollups.dailyCounts[offset] += direction;
+	addAt(rollups.counts, offset, direction);
+
+	if (ledger.incomeFlags[position] === 1) {
+		rollups.dailyIncome[offset] += delta;
+		addAt(rollups.income, offset, delta);
+		return true;
+	}
+
+	const code = ledger.categoryCodes[position];
+	rollups.categoryValues[code] ??= new Float64Array(rollups.days + 1);
+	rollups.categoryCounts[code] ??= new Float64Array(rollups.days + 1);
+
+	rollups.dailyExpenses[offset] += delta;
+	addAt(rollups.expenses, offset, delta);
+	addAt(rollups.categoryValues[code], offset, delta);
+	addAt(rollups.categoryCounts[code], offset, direction);
+	return true;
+};
+
+/** Income, expenses and net for `range` in O(log days). */
+export const sumDayRollups = (rollups: DayRollups, range: DayRange): PeriodTotals => {
+	const { from, to } = coveredOffsets(rollups, range);
+	const income = from <= to ? rangeSum(rollups.income, from, to) : 0;
+	const expenses = from <= to ? rangeSum(rollups.expenses, from, to) : 0;
+
+	return {
+		totalIncome: toCurrency(income),
+		totalExpenses: toCurrency(expenses),
+		amountSaved: toCurrency(income - expenses)
+	};
+};
+
+/**
+ * The running totals for `range` without touching ledger rows: totals and
+ * category buckets are O(log days) lookups per column, and only the day
+ * buckets walk the range, one step per day rather than per entry.
+ */
+export const createKpiAccumulatorFromRollups = (
+	rollups: DayRollups,
+	range: DayRange
+): KpiAccumulator => {
+	const accumulator = createKpiAccumulator();
+	const { from, to } = coveredOffsets(rollups, range);
+	if (from > to) return accumulator;
+
+	accumulator.count = rangeSum(rollups.counts, from, to);
+	accumulator.income = rangeSum(rollups.income, from, to);
+	accumulator.expenses = rangeSum(rollups.expenses, from, to);
+
+	rollups.categoryCounts.forEach((counts, code) => {
+		const count = rangeSum(counts, from, to);
+		if (count > 0) {
+			accumulator.categories.set(rollups.categoryNames[code], {
+				value: rangeSum(rollups.categoryValues[code], from, to),
+				count
+			});
+		}
+	});
+
+	for (let offset = from; offset <= to; offset += 1) {
+		const count = rollups.dailyCounts[offset];
+		if (count === 0) continue;
+
+		const startDay = rollups.firstDay + offset;
+		accumulator.days.set(startDay, {
+			startDay,
+			income: rollups.dailyIncome[offset],
+			expenses: rollups.dailyExpenses[offset],
+			count
+		});
+	}
+
+	return accumulator;
+};
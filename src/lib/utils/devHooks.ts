@@ -0,0 +1,39 @@
+import { dev } from '$app/environment';
+
+import { transactionsStore, type TransactionsStore } from '$lib/stores/transactions';
+import type { TransactionEntry } from '$lib/types';
+
+export interface ExpenseTrackerDevHooks {
+	/** Resolves with the number seeded once the IndexedDB copy is rewritten too. */
+	seed(entries: TransactionEntry[]): Promise<number>;
+	/** Empties the ledger; saved history is only erased with `erase: true`. */
+	clear(options?: { erase?: boolean }): void;
+	bench(): Promise<typeof import('$lib/bench')>;
+	/** The live store, so benchmarks can drive filters and mutations directly. */
+	store: TransactionsStore;
+}
+
+declare global {
+	interface Window {
+		__expenseTracker?: ExpenseTrackerDevHooks;
+	}
+}
+
+// Browser automation uses these to load large ledgers without typing into the form.
+export const installDevHooks = () => {
+	if (!dev || typeof window === 'undefined') return;
+
+	window.__expenseTracker = {
+		async seed(entries) {
+			await transactionsStore.seed(entries);
+			return entries.length;
+		},
+		clear(options) {
+			transactionsStore.clear(options);
+		},
+		bench() {
+			return import('$lib/bench');
+		},
+		store: transactionsStore
+	};
+};
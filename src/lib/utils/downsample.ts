@@ -0,0 +1,58 @@
+/**
+ * Largest-triangle-three-buckets downsampling. Keeps the first and last
+ * points and, from each of `threshold - 2` equal buckets in between, the point
+ * forming the largest triangle with the previously kept point and the average
+ * of the next bucket, so peaks and dips survive where stride sampling would
+ * drop them.
+ *
+ * `series` holds one y column per line drawn over the same x positions
+ * (point indices). Areas are summed across columns so a single pick serves
+ * every line. Returns the kept indices in ascending order; with `threshold`
+ * below 3 or at least the point count, every index is kept.
+ */
+export const downsampleLttb = (series: readonly (readonly number[])[], threshold: number) => {
+	const length = series[0]?.length ?? 0;
+	if (threshold < 3 || length <= threshold) {
+		return Array.from({ length }, (_, index) => index);
+	}
+
+	const kept = [0];
+	const bucketSize = (length - 2) / (threshold - 2);
+	let anchor = 0;
+
+	for (let bucket = 0; bucket < threshold - 2; bucket += 1) {
+		const from = Math.floor(bucket * bucketSize) + 1;
+		const to = Math.floor((bucket + 1) * bucketSize) + 1;
+		// The last bucket looks ahead to the final point alone.
+		const nextTo = Math.min(Math.floor((bucket + 2) * bucketSize) + 1, length);
+		const averageX = (to + nextTo - 1) / 2;
+		const averageYs = series.map((values) => {
+			let sum = 0;
+			for (let next = to; next < nextTo; next += 1) sum += values[next];
+			return sum / (nextTo - to);
+		});
+
+		let best = from;
+		let bestArea = -1;
+		for (let index = from; index < to; index += 1) {
+			let area = 0;
+			for (let line = 0; line < series.length; line += 1) {
+				const values = series[line];
+				area += Math.abs(
+					(anchor - averageX) * (values[index] - values[anchor]) -
+						(anchor - index) * (averageYs[line] - values[anchor])
+				);
+			}
+			if (area > bestArea) {
+				bestArea = area;
+				best = index;
+			}
+		}
+
+		kept.push(best);
+		anchor = best;
+	}
+
+	kept.push(length - 1);
+	return kept;
+};
@@ -0,0 +1,60 @@
+import type { TransactionEntry, TransactionKind } from '$lib/types';
+import { DEFAULT_LOCALE, formatCurrency, formatIsoDate } from '$lib/utils/format';
+import { themeColor } from '$lib/utils/theme';
+
+/** Everything `EntriesTable` prints for one row, formatted ahead of rendering. */
+export interface EntryDisplay {
+	date: string;
+	shortId: string;
+	category: string;
+	badgeStyle: string;
+	amountClass: string;
+	sign: '+' | '-';
+	amount: string;
+}
+
+export const entryAccent = (entry: Pick<TransactionEntry, 'type'>): string =>
+	entry.type === 'income' ? themeColor('positive') : themeColor('negative');
+
+const badgeStyleFor = (kind: TransactionKind) => {
+	const accent = entryAccent({ type: kind });
+	return `background: color-mix(in srgb, ${accent} 22%, transparent); color: ${accent}; border: 1px solid color-mix(in srgb, ${accent} 35%, transparent);`;
+};
+
+// Only two accents exist, so the badge CSS is built once per kind.
+const BADGE_STYLES: Record<TransactionKind, string> = {
+	income: badgeStyleFor('income'),
+	expense: badgeStyleFor('expense')
+};
+
+// Entries are never mutated in place, so the entry object stands in for its id
+// as the key; removed entries are garbage-collected along with their display.
+const displays = new Map<string, WeakMap<TransactionEntry, EntryDisplay>>();
+
+/**
+ * Display strings for `entry` in `locale`, built on first use and shared by
+ * every later render, so paging, scrolling and filter changes that bring a row
+ * back do no formatting work.
+ */
+export const getEntryDisplay = (entry: TransactionEntry, locale = DEFAULT_LOCALE): EntryDisplay => {
+	let byEntry = displays.get(locale);
+	if (!byEntry) {
+		byEntry = new WeakMap();
+		displays.set(locale, byEntry);
+	}
+
+	let display = byEntry.get(entry);
+	if (!display) {
+		display = {
+			date: formatIsoDate(entry.date),
+			shortId: `#${entry.id.slice(-6)}`,
+			category: entry.primaryCategory.replace('_', ' '),
+			badgeStyle: BADGE_STYLES[entry.type],
+			amountClass: entry.type === 'income' ? 'text-positive' : 'text-negative',
+			sign: entry.type === 'expense' ? '-' : '+',
+			amount: formatCurrency(entry.amount, locale)
+		};
+		byEntry.set(entry, display);
+	}
+	return display;
+};
@@ -0,0 +1,147 @@
+import type { TransactionEntry } from '$lib/types';
+
+export type ExportFormat = 'csv' | 'json';
+
+export const EXPORT_MIME_TYPES: Record<ExportFormat, string> = {
+	csv: 'text/csv',
+	json: 'application/json'
+};
+
+/** Rows serialized per chunk when slicing an in-memory list. */
+export const EXPORT_CHUNK_SIZE = 1000;
+
+// Header names the CSV importer recognizes, so an export re-imports as-is.
+const CSV_COLUMNS = [
+	'id',
+	'date',
+	'label',
+	'primaryCategory',
+	'subCategory',
+	'type',
+	'amount'
+] as const satisfies readonly (keyof TransactionEntry)[];
+
+const csvCell = (value: string | number) => {
+	const text = String(value);
+	return /[",\r\n]/.test(text) ? `"${text.replace(/"/g, '""')}"` : text;
+};
+
+const toCsvLines = (entries: TransactionEntry[]) =>
+	entries.map((entry) => CSV_COLUMNS.map((column) => csvCell(entry[column])).join(',')).join('\n');
+
+/** `entries` in consecutive slices of `size`, without copying the list up front. */
+export function* chunkEntries(
+	entries: TransactionEntry[],
+	size = EXPORT_CHUNK_SIZE
+): Generator<TransactionEntry[]> {
+	for (let start = 0; start < entries.length; start += size) {
+		yield entries.slice(start, start + size);
+	}
+}
+
+/**
+ * Serializes batches of entries into a CSV or JSON byte stream. One batch is
+ * encoded per pull, so only the chunk in flight is held as a string; with
+ * `yieldBetweenChunks` each pull first gives the event loop a turn so a long
+ * export does not block rendering or input.
+ */
+export const createExportStream = (
+	batches: Iterator<TransactionEntry[]>,
+	format: ExportFormat,
+	{ yieldBetweenChunks = false } = {}
+): ReadableStream<Uint8Array> => {
+	const encoder = new TextEncoder();
+	let started = false;
+	let wroteRow = false;
+
+	const open = () => (format === 'csv' ? `${CSV_COLUMNS.join(',')}\n` : '[');
+	const close = () => (format === 'csv' ? '' : wroteRow ? '\n]\n' : ']\n');
+
+	const encodeBatch = (batch: TransactionEntry[]) => {
+		if (format === 'csv') return `${toCsvLines(batch)}\n`;
+
+		const rows = batch.map((entry) => JSON.stringify(entry)).join(',\n');
+		const prefix = wroteRow ? ',\n' : '\n';
+		return prefix + rows;
+	};
+
+	return new ReadableStream<Uint8Array>({
+		async pull(controller) {
+			if (yieldBetweenChunks && started) {
+				await new Promise((resolve) => setTimeout(resolve, 0));
+			}
+
+			let text = started ? '' : open();
+			started = true;
+
+			const { value, done } = batches.next();
+			if (done) {
+				controller.enqueue(encoder.encode(text + close()));
+				controller.close();
+				return;
+			}
+
+			if (value.length > 0) {
+				text += encodeBatch(value);
+				wroteRow = true;
+			}
+			if (text) controller.enqueue(encoder.encode(text));
+		},
+		cancel() {
+			batches.return?.();
+		}
+	});
+};
+
+export const exportFileName = (format: ExportFormat, startDate: string, endDate: string) =>
+	`transactions_${startDate}_${endDate}.${format}`;
+
+type SaveFilePicker = (options: {
+	suggestedName: string;
+	types: { description: string; accept: Record<string, string[]> }[];
+}) => Promise<{ createWritable(): Promise<WritableStream<Uint8Array>> }>;
+
+/**
+ * Saves `stream` as a download. Where the File System Access API exists the
+ * bytes are piped straight to disk; elsewhere the browser collects them into
+ * a Blob (held by the browser, not as one JS string) behind an object URL.
+ * Resolves false if the user dismisses the save dialog.
+ */
+export const saveExportStream = async (
+	stream: ReadableStream<Uint8Array>,
+	fileName: string,
+	format: ExportFormat
+): Promise<boolean> => {
+	const picker = (window as Window & { showSaveFilePicker?: SaveFilePicker }).showSaveFilePicker;
+
+	if (picker) {
+		let handle: Awaited<ReturnType<SaveFilePicker>>;
+		try {
+			handle = await picker({
+				suggestedName: fileName,
+				types: [
+					{
+						description: format.toUpperCase(),
+						accept: { [EXPORT_MIME_TYPES[format]]: [`.${format}`] }
+					}
+				]
+			});
+		} catch {
+			await stream.cancel();
+			return false;
+		}
+		await stream.pipeTo(await handle.createWritable());
+		return true;
+	}
+
+	const blob = await new Response(stream, {
+		headers: { 'content-type': EXPORT_MIME_TYPES[format] }
+	}).blob();
+	const url = URL.createObjectURL(blob);
+	const link = document.createElement('a');
+	link.href = url;
+	link.download = fileName;
+	link.click();
+	setTimeout(() => URL.revokeObjectURL(url), 0);
+	return true;
+};
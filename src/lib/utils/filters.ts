@@ -3,9 +3,7 @@ import {
 	format,
 	formatISO,
 	isAfter,
-	isBefore,
 	isValid,
-	isWithinInterval,
 	parseISO,
 	startOfMonth,
 	startOfYear,
@@ -14,6 +12,7 @@ import {
 } from 'date-fns';
 
 import type { PeriodFilter, PeriodPreset } from '$lib/types';
+import { dayIsWithinRange, toDayRange, toEpochDay } from '$lib/utils/ledger';
 
 export type IsoDateRange = { start: string; end: string };
 
@@ -82,32 +81,16 @@ export const applyPresetToFilter = (filter: PeriodFilter, now = new Date()): Per
 	return { ...filter, startDate: start, endDate: end };
 };
 
-export const dateIsWithinFilter = (isoDate: string, filter: PeriodFilter): boolean => {
-	const date = parseISO(isoDate);
-	if (!isValid(date)) return false;
-
-	const start = parseISO(filter.startDate);
-	const end = parseISO(filter.endDate);
-
-	if (!isValid(start) || !isValid(end)) return false;
-
-	const normalizedStart = isBefore(start, end) ? start : end;
-	const normalizedEnd = isAfter(end, start) ? end : start;
-
-	return isWithinInterval(date, { start: normalizedStart, end: normalizedEnd });
-};
+export const dateIsWithinFilter = (isoDate: string, filter: PeriodFilter): boolean =>
+	dayIsWithinRange(toEpochDay(isoDate), toDayRange(filter.startDate, filter.endDate));
 
 export const compareEntriesByDateDesc = (a: string, b: string): number => {
-	const dateA = parseISO(a);
-	const dateB = parseISO(b);
-
-	if (!isValid(dateA) && !isValid(dateB)) return 0;
-	if (!isValid(dateA)) return 1;
-	if (!isValid(dateB)) return -1;
+	const dayA = toEpochDay(a);
+	const dayB = toEpochDay(b);
 
-	if (dateA.getTime() === dateB.getTime()) return 0;
+	if (dayA === dayB) return 0;
 
-	return dateA.getTime() > dateB.getTime() ? -1 : 1;
+	return dayA > dayB ? -1 : 1;
 };
 
 export const summarizePeriodRange = (filter: PeriodFilter) => {
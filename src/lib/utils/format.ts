@@ -1,18 +1,72 @@
 import { format, parseISO } from 'date-fns';
 
-const currencyFormatter = new Intl.NumberFormat('en-US', {
-	style: 'currency',
-	currency: 'USD',
-	minimumFractionDigits: 2
-});
+export const DEFAULT_LOCALE = 'en-US';
 
-export const formatCurrency = (value: number): string => currencyFormatter.format(value);
+const NUMBER_FORMATS = {
+	currency: { style: 'currency', currency: 'USD', minimumFractionDigits: 2 },
+	signedCurrency: {
+		style: 'currency',
+		currency: 'USD',
+		minimumFractionDigits: 2,
+		signDisplay: 'exceptZero'
+	},
+	compact: { notation: 'compact', maximumFractionDigits: 1 }
+} satisfies Record<string, Intl.NumberFormatOptions>;
+
+export type NumberFormatKind = keyof typeof NUMBER_FORMATS;
+
+// Building an `Intl.NumberFormat` costs far more than formatting with one, so
+// each (locale, kind) pair is constructed once and shared.
+const numberFormatters = new Map<string, Intl.NumberFormat>();
+
+export const getNumberFormatter = (
+	kind: NumberFormatKind,
+	locale = DEFAULT_LOCALE
+): Intl.NumberFormat => {
+	const key = `${locale}|${kind}`;
+	let formatter = numberFormatters.get(key);
+	if (!formatter) {
+		formatter = new Intl.NumberFormat(locale, NUMBER_FORMATS[kind]);
+		numberFormatters.set(key, formatter);
+	}
+	return formatter;
+};
+
+export const formatCurrency = (value: number, locale = DEFAULT_LOCALE): string =>
+	getNumberFormatter('currency', locale).format(value);
+
+export type PeriodChange = { label: string; direction: 'up' | 'down' | 'flat' };
+
+/** "+$120.00 vs previous period" for a KPI card, or null without a previous period. */
+export const describePeriodChange = (
+	current: number,
+	previous: number | undefined
+): PeriodChange | null => {
+	if (previous === undefined) return null;
+
+	const change = Math.round((current - previous) * 100) / 100;
+	return {
+		label: `${getNumberFormatter('signedCurrency').format(change)} vs previous period`,
+		direction: change > 0 ? 'up' : change < 0 ? 'down' : 'flat'
+	};
+};
+
+// Ledgers repeat the same few hundred dates, so each label is parsed and formatted once.
+const MAX_CACHED_DATE_LABELS = 2048;
+const dateLabels = new Map<string, string>();
 
 export const formatIsoDate = (isoDate: string, pattern = 'MMM d, yyyy'): string => {
+	const key = `${pattern}|${isoDate}`;
+	const cached = dateLabels.get(key);
+	if (cached !== undefined) return cached;
+
 	const parsed = parseISO(isoDate);
-	if (Number.isNaN(parsed.getTime())) return isoDate;
-	return format(parsed, pattern);
+	const label = Number.isNaN(parsed.getTime()) ? isoDate : format(parsed, pattern);
+
+	if (dateLabels.size >= MAX_CACHED_DATE_LABELS) dateLabels.clear();
+	dateLabels.set(key, label);
+	return label;
 };
 
-export const formatCompactNumber = (value: number): string =>
-	new Intl.NumberFormat('en-US', { notation: 'compact', maximumFractionDigits: 1 }).format(value);
+export const formatCompactNumber = (value: number, locale = DEFAULT_LOCALE): string =>
+	getNumberFormatter('compact', locale).format(value);
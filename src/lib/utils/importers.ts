@@ -0,0 +1,336 @@
+import { format } from 'date-fns';
+
+import {
+	CATEGORY_LABELS,
+	PRIMARY_CATEGORIES,
+	type PrimaryCategory,
+	type TransactionDraft
+} from '$lib/types';
+import { toEpochDay } from '$lib/utils/ledger';
+import { parseTransactionFields, type TransactionFields } from '$lib/utils/validation';
+
+export type ImportFormat = 'csv' | 'ofx';
+
+export interface ImportError {
+	/** 1-based data row (CSV) or transaction (OFX) number. */
+	record: number;
+	message: string;
+}
+
+export interface ImportResult {
+	drafts: TransactionDraft[];
+	rejected: number;
+	/** The first `maxErrors` rejections; `rejected` has the full count. */
+	errors: ImportError[];
+}
+
+export interface ImportOptions {
+	/** Subcategory for rows that do not carry one, e.g. the form's first option. */
+	subcategoryFor: (category: PrimaryCategory) => string;
+	maxErrors?: number;
+}
+
+const DEFAULT_MAX_ERRORS = 20;
+
+export const detectImportFormat = (fileName: string): ImportFormat | null => {
+	const extension = fileName.toLowerCase().split('.').pop();
+	if (extension === 'csv') return 'csv';
+	if (extension === 'ofx' || extension === 'qfx') return 'ofx';
+	return null;
+};
+
+/**
+ * Splits CSV text into records of fields, chunk by chunk. Handles quoted
+ * fields with embedded commas, newlines and doubled quotes, and CRLF line
+ * ends, even when any of them straddle a chunk boundary.
+ */
+export const createCsvRecordStream = (): TransformStream<string, string[]> => {
+	let field = '';
+	let record: string[] = [];
+	let quoted = false;
+	// Last char of the previous chunk was a quote inside a quoted field.
+	let pendingQuote = false;
+
+	const endRecord = (controller: TransformStreamDefaultController<string[]>) => {
+		record.push(field);
+		field = '';
+		if (record.length > 1 || record[0] !== '') controller.enqueue(record);
+		record = [];
+	};
+
+	return new TransformStream({
+		transform(chunk, controller) {
+			let start = 0;
+
+			for (let index = 0; index < chunk.length; index += 1) {
+				const char = chunk[index];
+
+				if (pendingQuote) {
+					pendingQuote = false;
+					if (char === '"') {
+						field += '"';
+						start = index + 1;
+						continue;
+					}
+					quoted = false;
+				}
+
+				if (quoted) {
+					if (char !== '"') continue;
+					field += chunk.slice(start, index);
+					start = index + 1;
+					if (index + 1 === chunk.length) {
+						pendingQuote = true;
+					} else if (chunk[index + 1] === '"') {
+						field += '"';
+						index += 1;
+						start = index + 1;
+					} else {
+						quoted = false;
+					}
+					continue;
+				}
+
+				if (char === '"') {
+					field += chunk.slice(start, index);
+					quoted = true;
+					start = index + 1;
+				} else if (char === ',') {
+					record.push(field + chunk.slice(start, index));
+					field = '';
+					start = index + 1;
+				} else if (char === '\n' || char === '\r') {
+					field += chunk.slice(start, index);
+					if (char === '\n' || chunk[index + 1] !== '\n') endRecord(controller);
+					start = index + 1;
+				}
+			}
+
+			field += chunk.slice(start);
+		},
+		flush(controller) {
+			if (field !== '' || record.length > 0) endRecord(controller);
+		}
+	});
+};
+
+const OFX_TRANSACTION_START = '<STMTTRN>';
+const OFX_TRANSACTION_END = '</STMTTRN>';
+const OFX_LEAF = /<([A-Z0-9.]+)>([^<\r\n]*)/g;
+
+const NAMED_ENTITIES: Record<string, string> = { amp: '&', lt: '<', gt: '>', quot: '"', apos: "'" };
+const ENTITY = /&(?:#(\d+)|#x([\da-f]+)|(amp|lt|gt|quot|apos));/gi;
+
+// Named XML entities and numeric character references; anything else is left as written.
+const decodeEntities = (value: string) =>
+	value.replace(ENTITY, (match, decimal?: string, hex?: string, name?: string) => {
+		if (name) return NAMED_ENTITIES[name.toLowerCase()];
+		const code = decimal ? Number(decimal) : Number.parseInt(hex ?? '', 16);
+		return code > 0 && code <= 0x10ffff ? String.fromCodePoint(code) : match;
+	});
+
+/**
+ * Emits each `<STMTTRN>` block of an OFX/QFX statement as a map of its leaf
+ * elements. Works for both SGML (OFX 1.x, unclosed leaves) and XML (OFX 2.x).
+ * Only the unfinished block is buffered between chunks.
+ */
+export const createOfxRecordStream = (): TransformStream<string, Record<string, string>> => {
+	let buffer = '';
+
+	return new TransformStream({
+		transform(chunk, controller) {
+			buffer += chunk;
+			let from = 0;
+			let end = buffer.indexOf(OFX_TRANSACTION_END, from);
+
+			while (end !== -1) {
+				const start = buffer.lastIndexOf(OFX_TRANSACTION_START, end);
+				if (start >= from) {
+					const record: Record<string, string> = {};
+					for (const [, tag, value] of buffer.slice(start, end).matchAll(OFX_LEAF)) {
+						if (value.trim()) record[tag] = decodeEntities(value.trim());
+					}
+					controller.enqueue(record);
+				}
+
+				from = end + OFX_TRANSACTION_END.length;
+				end = buffer.indexOf(OFX_TRANSACTION_END, from);
+			}
+
+			// Keep only what could still belong to an open transaction or a split start tag.
+			const open = buffer.indexOf(OFX_TRANSACTION_START, from);
+			buffer =
+				open === -1
+					? buffer.slice(Math.max(from, buffer.length - OFX_TRANSACTION_START.length))
+					: buffer.slice(open);
+		}
+	});
+};
+
+const CATEGORY_BY_NAME = new Map<string, PrimaryCategory>(
+	PRIMARY_CATEGORIES.flatMap((category) => [
+		[category, category],
+		[CATEGORY_LABELS[category].toLowerCase(), category]
+	])
+);
+
+const CSV_COLUMNS: Record<keyof TransactionFields, string[]> = {
+	date: ['date', 'posted', 'transaction date', 'posting date', 'posted date'],
+	label: ['label', 'description', 'payee', 'name', 'memo'],
+	amount: ['amount'],
+	primaryCategory: ['primarycategory', 'primary category', 'category'],
+	subCategory: ['subcategory', 'sub category']
+};
+
+const normalizeHeader = (header: string) => header.trim().toLowerCase().replace(/[_-]/g, ' ');
+
+// An optional sign and `$`, digits with optional thousands commas, optional
+// decimals. Accounting exports write debits in parentheses instead: (12.50).
+const BANK_AMOUNT_PATTERN = /^(\()?([-+])?\$?((?:\d{1,3}(?:,\d{3})+|\d+)(?:\.\d+)?|\.\d+)(\))?$/;
+
+/** The signed value of a bank amount, or NaN unless the whole token is one. */
+const parseBankAmount = (rawAmount: string): number => {
+	const match = BANK_AMOUNT_PATTERN.exec(rawAmount.replace(/\s/g, ''));
+	if (!match) return Number.NaN;
+
+	const [, open, sign, digits, close] = match;
+	if (Boolean(open) !== Boolean(close) || (open && sign)) return Number.NaN;
+
+	const value = Number(digits.replace(/,/g, ''));
+	return open || sign === '-' ? -value : value;
+};
+
+/**
+ * Signed bank amounts: credits become income and debits variable expenses
+ * unless the row names its own category. An amount that does not parse is
+ * passed through as written so validation rejects the row.
+ */
+const toFields = (
+	date: string,
+	label: string,
+	rawAmount: string,
+	rawCategory: string,
+	subCategory: string,
+	options: ImportOptions
+): TransactionFields => {
+	const amount = parseBankAmount(rawAmount);
+	const named = rawCategory.trim();
+	const known = named
+		? CATEGORY_BY_NAME.get(named.toLowerCase())
+		: amount < 0
+			? 'variable_expense'
+			: 'income';
+
+	return {
+		date,
+		label,
+		// An unknown category name is passed through so validation reports it.
+		primaryCategory: known ?? named,
+		subCategory: subCategory.trim() || (known ? options.subcategoryFor(known) : ''),
+		amount: Number.isNaN(amount) ? rawAmount.trim() : Math.abs(amount)
+	};
+};
+
+const csvFieldsReader = (options: ImportOptions) => {
+	let columns: Partial<Record<keyof TransactionFields, number>> | null = null;
+
+	return (record: string[]): TransactionFields | null => {
+		if (!columns) {
+			const headers = record.map(normalizeHeader);
+			columns = {};
+			for (const [key, aliases] of Object.entries(CSV_COLUMNS)) {
+				const index = headers.findIndex((header) => aliases.includes(header));
+				if (index !== -1) columns[key as keyof TransactionFields] = index;
+			}
+			return null;
+		}
+
+		const read = (key: keyof TransactionFields) => {
+			const index = columns?.[key];
+			return index === undefined ? '' : (record[index] ?? '').trim();
+		};
+
+		return toFields(
+			read('date'),
+			read('label'),
+			read('amount'),
+			read('primaryCategory'),
+			read('subCategory'),
+			options
+		);
+	};
+};
+
+// OFX dates are `yyyyMMdd[HHmmss[.XXX]][[tz]]`; only the calendar date matters here.
+const toIsoDate = (ofxDate = '') =>
+	/^\d{8}/.test(ofxDate)
+		? `${ofxDate.slice(0, 4)}-${ofxDate.slice(4, 6)}-${ofxDate.slice(6, 8)}`
+		: ofxDate;
+
+const ofxFields = (record: Record<string, string>, options: ImportOptions): TransactionFields =>
+	toFields(
+		toIsoDate(record.DTPOSTED),
+		record.NAME ?? record.MEMO ?? record.PAYEE ?? '',
+		record.TRNAMT ?? '',
+		'',
+		'',
+		options
+	);
+
+// Reader loop rather than `for await`, which not every browser supports on streams yet.
+const forEachChunk = async <T>(stream: ReadableStream<T>, visit: (value: T) => void) => {
+	const reader = stream.getReader();
+	try {
+		while (true) {
+			const { value, done } = await reader.read();
+			if (done) return;
+			visit(value);
+		}
+	} finally {
+		reader.releaseLock();
+	}
+};
+
+/**
+ * Streams a bank export through the matching parser and validates each row
+ * with the form's rules. Only accepted drafts and the first few errors are
+ * kept, so memory tracks the imported rows rather than the file text.
+ */
+export const importTransactions = async (
+	source: ReadableStream<Uint8Array>,
+	importFormat: ImportFormat,
+	options: ImportOptions
+): Promise<ImportResult> => {
+	const maxErrors = options.maxErrors ?? DEFAULT_MAX_ERRORS;
+	const today = toEpochDay(format(new Date(), 'yyyy-MM-dd'));
+	const result: ImportResult = { drafts: [], rejected: 0, errors: [] };
+	const text = source.pipeThrough(new TextDecoderStream());
+
+	const accept = (record: number, fields: TransactionFields) => {
+		const { draft, errors } = parseTransactionFields(fields, today);
+		if (draft) {
+			result.drafts.push(draft);
+			return;
+		}
+
+		result.rejected += 1;
+		if (result.errors.length < maxErrors) {
+			result.errors.push({ record, message: Object.values(errors).join(' ') });
+		}
+	};
+
+	let record = 0;
+	if (importFormat === 'csv') {
+		const readFields = csvFieldsReader(options);
+		await forEachChunk(text.pipeThrough(createCsvRecordStream()), (row) => {
+			const fields = readFields(row);
+			if (fields) accept(++record, fields);
+		});
+	} else {
+		await forEachChunk(text.pipeThrough(createOfxRecordStream()), (transaction) => {
+			accept(++record, ofxFields(transaction, options));
+		});
+	}
+
+	return result;
+};
@@ -0,0 +1,186 @@
+/**
+ * Opt-in timing and counters for the dashboard's hot paths. Off by default:
+ * every hook is a single boolean check until `setInstrumentationEnabled(true)`
+ * (or `?instrument` / the `expense-tracker:instrumentation` localStorage key,
+ * see `installInstrumentation`). While enabled, each stage is recorded as a
+ * `performance.measure` named `expense-tracker:<stage>` and summed into the
+ * snapshot that `window.__expenseTrackerInstrumentation.snapshot()` returns.
+ */
+
+export const INSTRUMENTATION_STAGES = [
+	'recalculateState',
+	'aggregateTotals',
+	'buildTrendSeries',
+	'buildCategoryShare',
+	'entriesTableRender'
+] as const;
+export type InstrumentationStage = (typeof INSTRUMENTATION_STAGES)[number];
+
+export const INSTRUMENTATION_COUNTERS = [
+	/** Ledger rows folded by a full aggregation pass. */
+	'entriesScanned',
+	/** Filtered rows an incremental add/remove did not have to rescan. */
+	'entriesSkipped',
+	/** Adds/removes patched into the running totals instead of a rebuild. */
+	'incrementalUpdates',
+	/** Day rollup builds handed to the KPI worker. */
+	'workerAggregations',
+	/** Trend bucket labels served from the cache instead of a date-fns `format`. */
+	'trendLabelsReused',
+	/** Filter changes answered from the range cache without touching the ledger. */
+	'rangeCacheHits',
+	/** Totals answered by the per-day Fenwick rollups instead of a scan of the range. */
+	'rollupQueries'
+] as const;
+export type InstrumentationCounter = (typeof INSTRUMENTATION_COUNTERS)[number];
+
+export type StageStats = {
+	count: number;
+	totalMs: number;
+	maxMs: number;
+	lastMs: number;
+};
+
+export interface InstrumentationSnapshot {
+	enabled: boolean;
+	stages: Record<InstrumentationStage, StageStats>;
+	counters: Record<InstrumentationCounter, number>;
+	/** Updates per component, from `countRender`. */
+	renders: Record<string, number>;
+}
+
+export interface InstrumentationHooks {
+	enable(): void;
+	disable(): void;
+	reset(): void;
+	snapshot(): InstrumentationSnapshot;
+}
+
+declare global {
+	interface Window {
+		__expenseTrackerInstrumentation?: InstrumentationHooks;
+	}
+}
+
+export const INSTRUMENTATION_STORAGE_KEY = 'expense-tracker:instrumentation';
+const MEASURE_PREFIX = 'expense-tracker:';
+
+const emptyStage = (): StageStats => ({ count: 0, totalMs: 0, maxMs: 0, lastMs: 0 });
+
+const createStages = () =>
+	Object.fromEntries(INSTRUMENTATION_STAGES.map((stage) => [stage, emptyStage()])) as Record<
+		InstrumentationStage,
+		StageStats
+	>;
+
+const createCounters = () =>
+	Object.fromEntries(INSTRUMENTATION_COUNTERS.map((counter) => [counter, 0])) as Record<
+		InstrumentationCounter,
+		number
+	>;
+
+let enabled = false;
+let stages = createStages();
+let counters = createCounters();
+let renders: Record<string, number> = {};
+
+export const isInstrumentationEnabled = () => enabled;
+
+export const setInstrumentationEnabled = (next: boolean) => {
+	enabled = next;
+};
+
+/** Start time for `endStage`, or -1 while instrumentation is off. */
+export const startStage = (): number => (enabled ? performance.now() : -1);
+
+export const endStage = (stage: InstrumentationStage, started: number) => {
+	if (!enabled || started < 0) return;
+
+	const end = performance.now();
+	const duration = end - started;
+	performance.measure(MEASURE_PREFIX + stage, { start: started, end });
+
+	const stats = stages[stage];
+	stats.count += 1;
+	stats.totalMs += duration;
+	stats.lastMs = duration;
+	if (duration > stats.maxMs) stats.maxMs = duration;
+};
+
+/** Runs `run` and records it under `stage` when instrumentation is on. */
+export const measureStage = <T>(stage: InstrumentationStage, run: () => T): T => {
+	if (!enabled) return run();
+
+	const started = performance.now();
+	try {
+		return run();
+	} finally {
+		endStage(stage, started);
+	}
+};
+
+export const countEvent = (counter: InstrumentationCounter, amount = 1) => {
+	if (enabled) counters[counter] += amount;
+};
+
+/** Called from a component's `$effect.pre` over the inputs it renders from. */
+export const countRender = (component: string) => {
+	if (enabled) renders[component] = (renders[component] ?? 0) + 1;
+};
+
+const round = (value: number) => Math.round(value * 1000) / 1000;
+
+export const getInstrumentationSnapshot = (): InstrumentationSnapshot => ({
+	enabled,
+	stages: Object.fromEntries(
+		INSTRUMENTATION_STAGES.map((stage) => {
+			const { count, totalMs, maxMs, lastMs } = stages[stage];
+			return [
+				stage,
+				{ count, totalMs: round(totalMs), maxMs: round(maxMs), lastMs: round(lastMs) }
+			];
+		})
+	) as Record<InstrumentationStage, StageStats>,
+	counters: { ...counters },
+	renders: { ...renders }
+});
+
+export const resetInstrumentation = () => {
+	stages = createStages();
+	counters = createCounters();
+	renders = {};
+	for (const stage of INSTRUMENTATION_STAGES) {
+		performance.clearMeasures(MEASURE_PREFIX + stage);
+	}
+};
+
+const requestedByEnvironment = (): boolean => {
+	if (new URLSearchParams(window.location.search).has('instrument')) return true;
+	try {
+		return window.localStorage.getItem(INSTRUMENTATION_STORAGE_KEY) === 'on';
+	} catch {
+		return false;
+	}
+};
+
+/**
+ * Exposes `window.__expenseTrackerInstrumentation` in every build so a
+ * production session can be inspected from the console or `page.evaluate`,
+ * and turns recording on when the URL or localStorage asks for it.
+ */
+export const installInstrumentation = () => {
+	if (typeof window === 'undefined') return;
+
+	if (requestedByEnvironment()) setInstrumentationEnabled(true);
+
+	window.__expenseTrackerInstrumentation = {
+		enable() {
+			setInstrumentationEnabled(true);
+		},
+		disable() {
+			setInstrumentationEnabled(false);
+		},
+		reset: resetInstrumentation,
+		snapshot: getInstrumentationSnapshot
+	};
+};
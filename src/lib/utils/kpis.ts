@@ -0,0 +1,365 @@
+import { format } from 'date-fns';
+
+import type {
+	CategoryShareSlice,
+	KPIBundle,
+	PeriodTotals,
+	TrendGranularity,
+	TrendSeriesPoint
+} from '$lib/types';
+import { countEvent, measureStage } from '$lib/utils/instrumentation';
+import {
+	epochDayToDate,
+	INVALID_EPOCH_DAY,
+	toMonthStartDay,
+	toWeekStartDay,
+	type DayRange,
+	type LedgerColumns,
+	type LedgerSpan
+} from '$lib/utils/ledger';
+
+type DayBucket = {
+	startDay: number;
+	income: number;
+	expenses: number;
+	count: number;
+};
+
+type CategoryBucket = {
+	value: number;
+	count: number;
+};
+
+/**
+ * Running totals for the entries inside the active filter. Entries are folded
+ * in or out one at a time, so a single add/remove costs O(1) instead of a
+ * rescan of the whole ledger.
+ */
+export interface KpiAccumulator {
+	count: number;
+	income: number;
+	expenses: number;
+	/** Keyed by epoch day; `buildKpiBundle` regroups them into trend buckets. */
+	days: Map<number, DayBucket>;
+	categories: Map<string, CategoryBucket>;
+}
+
+export const toCurrency = (value: number): number =>
+	Math.round((value + Number.EPSILON) * 100) / 100;
+
+export const createKpiAccumulator = (): KpiAccumulator => ({
+	count: 0,
+	income: 0,
+	expenses: 0,
+	days: new Map(),
+	categories: new Map()
+});
+
+// Ranges up to this many days are charted per day, up to the next per week, longer ones per month.
+const DAILY_TREND_MAX_DAYS = 62;
+const WEEKLY_TREND_MAX_DAYS = 366;
+
+/**
+ * Trend bucket size for a date range, so the series stays between roughly
+ * one and a few dozen points per screen whatever the range length.
+ */
+export const chooseTrendGranularity = (range: DayRange | null): TrendGranularity => {
+	if (!range) return 'week';
+
+	const days = range.end - range.start + 1;
+	if (days <= DAILY_TREND_MAX_DAYS) return 'day';
+	return days <= WEEKLY_TREND_MAX_DAYS ? 'week' : 'month';
+};
+
+/** First epoch day of the trend bucket containing `day`. */
+export const toTrendBucketStart = (day: number, granularity: TrendGranularity): number => {
+	if (granularity === 'week') return toWeekStartDay(day);
+	if (granularity === 'month') return toMonthStartDay(day);
+	return day;
+};
+
+const TREND_LABEL_FORMATS: Record<TrendGranularity, string> = {
+	day: 'MMM d',
+	week: 'MMM d',
+	month: 'MMM yyyy'
+};
+
+// Bucket labels only change with the bucket itself, so format each one once.
+const trendLabels: Record<TrendGranularity, Map<number, string>> = {
+	day: new Map(),
+	week: new Map(),
+	month: new Map()
+};
+
+const trendLabel = (startDay: number, granularity: TrendGranularity): string => {
+	const labels = trendLabels[granularity];
+	let label = labels.get(startDay);
+	if (label === undefined) {
+		label = format(epochDayToDate(startDay), TREND_LABEL_FORMATS[granularity]);
+		labels.set(startDay, label);
+	} else {
+		countEvent('trendLabelsReused');
+	}
+	return label;
+};
+
+const accumulateDay = (
+	accumulator: KpiAccumulator,
+	day: number,
+	isIncome: boolean,
+	delta: number,
+	count: number
+) => {
+	if (day === INVALID_EPOCH_DAY) return;
+
+	let bucket = accumulator.days.get(day);
+	if (!bucket) {
+		bucket = { startDay: day, income: 0, expenses: 0, count: 0 };
+		accumulator.days.set(day, bucket);
+	}
+
+	bucket.count += count;
+	if (isIncome) {
+		bucket.income += delta;
+	} else {
+		bucket.expenses += delta;
+	}
+
+	if (bucket.count <= 0) {
+		accumulator.days.delete(day);
+	}
+};
+
+const accumulateCategory = (
+	accumulator: KpiAccumulator,
+	category: string,
+	delta: number,
+	count: number
+) => {
+	let bucket = accumulator.categories.get(category);
+	if (!bucket) {
+		bucket = { value: 0, count: 0 };
+		accumulator.categories.set(category, bucket);
+	}
+
+	bucket.count += count;
+	bucket.value += delta;
+
+	if (bucket.count <= 0) {
+		accumulator.categories.delete(category);
+	}
+};
+
+/**
+ * Folds the ledger row at `position` into (direction 1) or out of
+ * (direction -1) the running totals.
+ */
+export const accumulateRow = (
+	accumulator: KpiAccumulator,
+	columns: LedgerColumns,
+	position: number,
+	direction: 1 | -1 = 1
+) => {
+	accumulator.count += direction;
+
+	if (accumulator.count <= 0) {
+		// Reset instead of subtracting so float drift never leaves a ghost total behind.
+		accumulator.count = 0;
+		accumulator.income = 0;
+		accumulator.expenses = 0;
+		accumulator.days.clear();
+		accumulator.categories.clear();
+		return;
+	}
+
+	const isIncome = columns.incomeFlags[position] === 1;
+	const delta = direction * columns.amounts[position];
+
+	if (isIncome) {
+		accumulator.income += delta;
+	} else {
+		accumulator.expenses += delta;
+		accumulateCategory(
+			accumulator,
+			columns.categoryNames[columns.categoryCodes[position]],
+			delta,
+			direction
+		);
+	}
+
+	accumulateDay(accumulator, columns.epochDays[position], isIncome, delta, direction);
+};
+
+/**
+ * A pre-summed group of entries sharing a kind, a category and a day (or the
+ * first day of a coarser trend bucket), e.g. a rollup row.
+ */
+export type KpiRollup = {
+	startDay: number;
+	isIncome: boolean;
+	category: string;
+	amount: number;
+	count: number;
+};
+
+/** Folds a whole rollup group into the totals at once. */
+export const accumulateRollup = (accumulator: KpiAccumulator, rollup: KpiRollup) => {
+	const { startDay, isIncome, category, amount, count } = rollup;
+	accumulator.count += count;
+
+	if (isIncome) {
+		accumulator.income += amount;
+	} else {
+		accumulator.expenses += amount;
+		accumulateCategory(accumulator, category, amount, count);
+	}
+
+	accumulateDay(accumulator, startDay, isIncome, amount, count);
+};
+
+/**
+ * Totals for the rows in `span` in one fused pass over the typed columns:
+ * income, expenses, day buckets and category buckets are filled together.
+ * Rows are date-sorted, so a day's rows are contiguous and the current bucket
+ * is reused without a map lookup; category sums go into arrays indexed by
+ * category code and become map entries once at the end.
+ */
+export const createKpiAccumulatorFromColumns = (
+	columns: LedgerColumns,
+	span: LedgerSpan = { from: 0, to: columns.amounts.length }
+): KpiAccumulator => {
+	const accumulator = createKpiAccumulator();
+	const { epochDays, amounts, incomeFlags, categoryCodes, categoryNames } = columns;
+	const categoryValues = new Float64Array(categoryNames.length);
+	const categoryCounts = new Uint32Array(categoryNames.length);
+
+	let income = 0;
+	let expenses = 0;
+	let currentDay = INVALID_EPOCH_DAY;
+	let bucket: DayBucket | undefined;
+
+	for (let position = span.from; position < span.to; position += 1) {
+		const amount = amounts[position];
+		const isIncome = incomeFlags[position] === 1;
+
+		if (isIncome) {
+			income += amount;
+		} else {
+			expenses += amount;
+			const code = categoryCodes[position];
+			categoryValues[code] += amount;
+			categoryCounts[code] += 1;
+		}
+
+		const day = epochDays[position];
+		if (day === INVALID_EPOCH_DAY) continue;
+
+		if (day !== currentDay || !bucket) {
+			currentDay = day;
+			bucket = accumulator.days.get(day);
+			if (!bucket) {
+				bucket = { startDay: day, income: 0, expenses: 0, count: 0 };
+				accumulator.days.set(day, bucket);
+			}
+		}
+
+		bucket.count += 1;
+		if (isIncome) {
+			bucket.income += amount;
+		} else {
+			bucket.expenses += amount;
+		}
+	}
+
+	for (let code = 0; code < categoryNames.length; code += 1) {
+		if (categoryCounts[code] > 0) {
+			accumulator.categories.set(categoryNames[code], {
+				value: categoryValues[code],
+				count: categoryCounts[code]
+			});
+		}
+	}
+
+	accumulator.count = Math.max(span.to - span.from, 0);
+	accumulator.income = income;
+	accumulator.expenses = expenses;
+
+	return accumulator;
+};
+
+const buildTrendSeries = (
+	accumulator: KpiAccumulator,
+	granularity: TrendGranularity
+): TrendSeriesPoint[] => {
+	const buckets = new Map<number, { income: number; expenses: number }>();
+	for (const { startDay, income, expenses } of accumulator.days.values()) {
+		const start = toTrendBucketStart(startDay, granularity);
+		const bucket = buckets.get(start);
+		if (bucket) {
+			bucket.income += income;
+			bucket.expenses += expenses;
+		} else {
+			buckets.set(start, { income, expenses });
+		}
+	}
+
+	return Array.from(buckets)
+		.sort((a, b) => a[0] - b[0])
+		.map(([start, { income, expenses }]) => ({
+			label: trendLabel(start, granularity),
+			income: toCurrency(income),
+			expenses: toCurrency(expenses)
+		}));
+};
+
+/** Granularity for the days the accumulator actually holds, when no filter range applies. */
+const dataGranularity = (accumulator: KpiAccumulator): TrendGranularity => {
+	let start = Infinity;
+	let end = -Infinity;
+	for (const day of accumulator.days.keys()) {
+		if (day < start) start = day;
+		if (day > end) end = day;
+	}
+	return chooseTrendGranularity(start <= end ? { start, end } : null);
+};
+
+const buildCategoryShare = (accumulator: KpiAccumulator): CategoryShareSlice[] => {
+	const total = accumulator.expenses;
+
+	if (total <= 0) {
+		return [];
+	}
+
+	return Array.from(accumulator.categories, ([category, { value }]) => ({
+		category,
+		value: toCurrency(value),
+		percentage: Math.round((value / total) * 1000) / 10
+	})).sort((a, b) => b.value - a.value);
+};
+
+/**
+ * Cost is proportional to the number of day and category buckets, not
+ * entries. Pass the granularity chosen for the filter range so the trend
+ * matches what is being viewed; it defaults to one fitting the data.
+ * `previousPeriod` is passed through for callers that can total it cheaply.
+ */
+export const buildKpiBundle = (
+	accumulator: KpiAccumulator,
+	granularity: TrendGranularity = dataGranularity(accumulator),
+	previousPeriod: PeriodTotals | null = null
+): KPIBundle => {
+	const totalIncome = toCurrency(accumulator.income);
+	const totalExpenses = toCurrency(accumulator.expenses);
+	const net = toCurrency(accumulator.income - accumulator.expenses);
+
+	return {
+		totalIncome,
+		totalExpenses,
+		amountSaved: net,
+		leftoverBalance: net,
+		previousPeriod,
+		trendGranularity: granularity,
+		trendSeries: measureStage('buildTrendSeries', () => buildTrendSeries(accumulator, granularity)),
+		categoryShare: measureStage('buildCategoryShare', () => buildCategoryShare(accumulator))
+	};
+};
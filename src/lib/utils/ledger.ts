@@ -0,0 +1,276 @@
+import type { TransactionEntry } from '$lib/types';
+
+const MS_PER_DAY = 86_400_000;
+const ISO_DATE_PATTERN = /^(\d{4})-(\d{2})-(\d{2})$/;
+const DAYS_PER_MONTH = [31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31];
+const MIN_CAPACITY = 64;
+
+/** Sorts after every real date so malformed rows sink to the end, and fits in an Int32. */
+export const INVALID_EPOCH_DAY = -(2 ** 31);
+
+const isLeapYear = (year: number) => (year % 4 === 0 && year % 100 !== 0) || year % 400 === 0;
+
+/** Days since 1970-01-01 for a `yyyy-MM-dd` string, or `INVALID_EPOCH_DAY`. */
+export const toEpochDay = (isoDate: string): number => {
+	const match = ISO_DATE_PATTERN.exec(isoDate);
+	if (!match) return INVALID_EPOCH_DAY;
+
+	const year = Number(match[1]);
+	const month = Number(match[2]) - 1;
+	const day = Number(match[3]);
+	const monthLength = month === 1 && isLeapYear(year) ? 29 : DAYS_PER_MONTH[month];
+
+	if (monthLength === undefined || day < 1 || day > monthLength) {
+		return INVALID_EPOCH_DAY;
+	}
+
+	return Math.round(Date.UTC(year, month, day) / MS_PER_DAY);
+};
+
+/** Epoch day of the Monday that opens the ISO week containing `day`. */
+export const toWeekStartDay = (day: number): number => {
+	if (day === INVALID_EPOCH_DAY) return INVALID_EPOCH_DAY;
+	// 1970-01-01 was a Thursday, three days after the Monday that starts its week.
+	return day - ((((day + 3) % 7) + 7) % 7);
+};
+
+/** Epoch day of the first of the month containing `day`. */
+export const toMonthStartDay = (day: number): number => {
+	if (day === INVALID_EPOCH_DAY) return INVALID_EPOCH_DAY;
+	const date = new Date(day * MS_PER_DAY);
+	return Math.round(Date.UTC(date.getUTCFullYear(), date.getUTCMonth(), 1) / MS_PER_DAY);
+};
+
+/** Local-midnight `Date` for an epoch day, for handing to date-fns formatters. */
+export const epochDayToDate = (day: number): Date => {
+	const utc = new Date(day * MS_PER_DAY);
+	return new Date(utc.getUTCFullYear(), utc.getUTCMonth(), utc.getUTCDate());
+};
+
+/**
+ * The numeric inputs KPI aggregation needs, one typed-array slot per entry.
+ * Category keys (`subCategory || primaryCategory`) are interned into
+ * `categoryNames` and referenced by code.
+ */
+export interface LedgerColumns {
+	epochDays: Int32Array;
+	amounts: Float64Array;
+	incomeFlags: Uint8Array;
+	categoryCodes: Uint32Array;
+	categoryNames: string[];
+}
+
+/**
+ * Columnar ledger kept newest-first. Dates are parsed once into `epochDays`
+ * when a row arrives, so range lookups are binary searches over an Int32Array
+ * and aggregation is a tight loop over typed arrays. Arrays grow by doubling;
+ * only the first `size` slots are live. `entries` holds the original row
+ * objects in the same order for rendering and is updated in place, so hand
+ * out copies of it. Ids are unique; `epochDayById` lets a row be found by id
+ * with the same binary search.
+ */
+export interface ColumnarLedger extends LedgerColumns {
+	size: number;
+	entries: TransactionEntry[];
+	categoryCodeByName: Map<string, number>;
+	epochDayById: Map<string, number>;
+}
+
+const allocate = (capacity: number): ColumnarLedger => ({
+	size: 0,
+	entries: [],
+	epochDays: new Int32Array(capacity),
+	amounts: new Float64Array(capacity),
+	incomeFlags: new Uint8Array(capacity),
+	categoryCodes: new Uint32Array(capacity),
+	categoryNames: [],
+	categoryCodeByName: new Map(),
+	epochDayById: new Map()
+});
+
+const grow = <T extends Int32Array | Float64Array | Uint8Array | Uint32Array>(
+	column: T,
+	capacity: number
+): T => {
+	const next = new (column.constructor as new (length: number) => T)(capacity);
+	next.set(column);
+	return next;
+};
+
+const ensureCapacity = (ledger: ColumnarLedger, needed: number) => {
+	if (needed <= ledger.epochDays.length) return;
+
+	const capacity = Math.max(MIN_CAPACITY, ledger.epochDays.length * 2, needed);
+	ledger.epochDays = grow(ledger.epochDays, capacity);
+	ledger.amounts = grow(ledger.amounts, capacity);
+	ledger.incomeFlags = grow(ledger.incomeFlags, capacity);
+	ledger.categoryCodes = grow(ledger.categoryCodes, capacity);
+};
+
+const internCategory = (ledger: ColumnarLedger, entry: TransactionEntry): number => {
+	const name = entry.subCategory || entry.primaryCategory;
+	let code = ledger.categoryCodeByName.get(name);
+	if (code === undefined) {
+		code = ledger.categoryNames.push(name) - 1;
+		ledger.categoryCodeByName.set(name, code);
+	}
+	return code;
+};
+
+const writeRow = (
+	ledger: ColumnarLedger,
+	position: number,
+	entry: TransactionEntry,
+	day: number
+) => {
+	ledger.epochDays[position] = day;
+	ledger.amounts[position] = entry.amount;
+	ledger.incomeFlags[position] = entry.type === 'income' ? 1 : 0;
+	ledger.categoryCodes[position] = internCategory(ledger, entry);
+	ledger.epochDayById.set(entry.id, day);
+};
+
+const shiftColumns = (ledger: ColumnarLedger, target: number, start: number, end: number) => {
+	ledger.epochDays.copyWithin(target, start, end);
+	ledger.amounts.copyWithin(target, start, end);
+	ledger.incomeFlags.copyWithin(target, start, end);
+	ledger.categoryCodes.copyWithin(target, start, end);
+};
+
+/** Builds a ledger from `rows`; of rows sharing an id, only the first is kept. */
+export const createColumnarLedger = (input: TransactionEntry[]): ColumnarLedger => {
+	const seen = new Set<string>();
+	const rows = input.filter((row) => !seen.has(row.id) && seen.add(row.id));
+	const days = rows.map((row) => toEpochDay(row.date));
+	const order = rows.map((_, index) => index);
+	order.sort((a, b) => {
+		if (days[a] !== days[b]) return days[b] - days[a];
+		return rows[a].id > rows[b].id ? -1 : 1;
+	});
+
+	const ledger = allocate(Math.max(MIN_CAPACITY, rows.length));
+	ledger.entries = order.map((index, position) => {
+		writeRow(ledger, position, rows[index], days[index]);
+		return rows[index];
+	});
+	ledger.size = rows.length;
+
+	return ledger;
+};
+
+/** Slot that keeps (day, id) descending; O(log n). */
+const insertionPoint = (ledger: ColumnarLedger, day: number, id: string): number => {
+	let low = 0;
+	let high = ledger.size;
+
+	while (low < high) {
+		const mid = (low + high) >>> 1;
+		const midDay = ledger.epochDays[mid];
+		const before = midDay !== day ? midDay > day : ledger.entries[mid].id > id;
+		if (before) {
+			low = mid + 1;
+		} else {
+			high = mid;
+		}
+	}
+
+	return low;
+};
+
+/**
+ * Inserts `entry` in date order and returns its position, or -1 when a row
+ * with its id is already present. Every column shifts in place.
+ */
+export const insertIntoLedger = (ledger: ColumnarLedger, entry: TransactionEntry): number => {
+	if (ledger.epochDayById.has(entry.id)) return -1;
+
+	const day = toEpochDay(entry.date);
+	const position = insertionPoint(ledger, day, entry.id);
+
+	ensureCapacity(ledger, ledger.size + 1);
+	shiftColumns(ledger, position + 1, position, ledger.size);
+	writeRow(ledger, position, entry, day);
+	ledger.entries.splice(position, 0, entry);
+	ledger.size += 1;
+
+	return position;
+};
+
+/** Position of the row with `id`, or -1; O(log n). */
+export const findLedgerPosition = (ledger: ColumnarLedger, id: string): number => {
+	const day = ledger.epochDayById.get(id);
+	if (day === undefined) return -1;
+
+	const position = insertionPoint(ledger, day, id);
+	return position < ledger.size && ledger.entries[position].id === id ? position : -1;
+};
+
+export const removeFromLedger = (ledger: ColumnarLedger, position: number): TransactionEntry => {
+	const [removed] = ledger.entries.splice(position, 1);
+
+	shiftColumns(ledger, position, position + 1, ledger.size);
+	ledger.epochDayById.delete(removed.id);
+	ledger.size -= 1;
+
+	return removed;
+};
+
+/** First position whose day is at or below `day` (days are descending). */
+const firstAtOrBefore = (ledger: ColumnarLedger, day: number): number => {
+	let low = 0;
+	let high = ledger.size;
+
+	while (low < high) {
+		const mid = (low + high) >>> 1;
+		if (ledger.epochDays[mid] > day) {
+			low = mid + 1;
+		} else {
+			high = mid;
+		}
+	}
+
+	return low;
+};
+
+export type DayRange = { start: number; end: number };
+
+/** Half-open `[from, to)` run of ledger positions. */
+export type LedgerSpan = { from: number; to: number };
+
+/** Inclusive epoch-day bounds for two ISO dates, in either order; null if invalid. */
+export const toDayRange = (startDate: string, endDate: string): DayRange | null => {
+	const start = toEpochDay(startDate);
+	const end = toEpochDay(endDate);
+
+	if (start === INVALID_EPOCH_DAY || end === INVALID_EPOCH_DAY) return null;
+
+	return start <= end ? { start, end } : { start: end, end: start };
+};
+
+/** The range of equal length ending the day before `range` starts. */
+export const precedingRange = ({ start, end }: DayRange): DayRange => ({
+	start: start - (end - start + 1),
+	end: start - 1
+});
+
+export const dayIsWithinRange = (day: number, range: DayRange | null): boolean =>
+	range !== null && day >= range.start && day <= range.end;
+
+/** Positions of the rows inside `range`, via two binary searches. */
+export const findDateSpan = (ledger: ColumnarLedger, range: DayRange | null): LedgerSpan => {
+	if (!range) return { from: 0, to: 0 };
+
+	return {
+		from: firstAtOrBefore(ledger, range.end),
+		to: firstAtOrBefore(ledger, range.start - 1)
+	};
+};
+
+/** Standalone copies of the KPI columns for `span`, safe to transfer to a worker. */
+export const copyLedgerColumns = (ledger: ColumnarLedger, span: LedgerSpan): LedgerColumns => ({
+	epochDays: ledger.epochDays.slice(span.from, span.to),
+	amounts: ledger.amounts.slice(span.from, span.to),
+	incomeFlags: ledger.incomeFlags.slice(span.from, span.to),
+	categoryCodes: ledger.categoryCodes.slice(span.from, span.to),
+	categoryNames: ledger.categoryNames.slice()
+});
@@ -0,0 +1,49 @@
+/**
+ * Small least-recently-used cache on top of `Map` insertion order: reads move
+ * a key to the back, writes past `capacity` drop the front.
+ */
+export interface LruCache<K, V> {
+	readonly size: number;
+	get(key: K): V | undefined;
+	set(key: K, value: V): void;
+	delete(key: K): boolean;
+	/** Drops every entry for which `predicate` returns true. */
+	deleteWhere(predicate: (value: V, key: K) => boolean): void;
+	clear(): void;
+}
+
+export const createLruCache = <K, V>(capacity: number): LruCache<K, V> => {
+	const entries = new Map<K, V>();
+
+	return {
+		get size() {
+			return entries.size;
+		},
+		get(key) {
+			const value = entries.get(key);
+			if (value === undefined) return undefined;
+
+			entries.delete(key);
+			entries.set(key, value);
+			return value;
+		},
+		set(key, value) {
+			entries.delete(key);
+			entries.set(key, value);
+			if (entries.size > capacity) {
+				entries.delete(entries.keys().next().value as K);
+			}
+		},
+		delete(key) {
+			return entries.delete(key);
+		},
+		deleteWhere(predicate) {
+			for (const [key, value] of entries) {
+				if (predicate(value, key)) entries.delete(key);
+			}
+		},
+		clear() {
+			entries.clear();
+		}
+	};
+};
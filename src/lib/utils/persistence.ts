@@ -0,0 +1,146 @@
+import type { TransactionEntry } from '$lib/types';
+
+const DATABASE_NAME = 'expense-tracker';
+const DATABASE_VERSION = 1;
+const STORE_NAME = 'transactions';
+// Compound (date, id) keys are unique, so range reads can page with an exclusive lower bound.
+const DATE_INDEX = 'by_date';
+
+const MIN_DATE = '0000-01-01';
+const MAX_DATE = '9999-12-31';
+const MAX_ID = '\uffff';
+
+/**
+ * The ledger as saved in this browser's IndexedDB: one record per entry,
+ * keyed by `id`, with a `(date, id)` index for date-range reads.
+ */
+export interface LedgerPersistence {
+	count(): Promise<number>;
+	put(entries: TransactionEntry[]): Promise<void>;
+	remove(ids: string[]): Promise<void>;
+	/** Clears the store and writes `entries` in one transaction. */
+	replace(entries: TransactionEntry[]): Promise<void>;
+	/** Entries dated within `[startDate, endDate]` (ISO dates, inclusive). */
+	readRange(startDate: string, endDate: string): Promise<TransactionEntry[]>;
+	/** Every entry outside `[startDate, endDate]`, in batches of at most `batchSize`. */
+	readOutside(
+		startDate: string,
+		endDate: string,
+		batchSize: number
+	): AsyncGenerator<TransactionEntry[]>;
+	close(): void;
+}
+
+const requestResult = <T>(request: IDBRequest<T>): Promise<T> =>
+	new Promise((resolve, reject) => {
+		request.onsuccess = () => resolve(request.result);
+		request.onerror = () => reject(request.error);
+	});
+
+const transactionDone = (transaction: IDBTransaction): Promise<void> =>
+	new Promise((resolve, reject) => {
+		transaction.oncomplete = () => resolve();
+		transaction.onerror = () => reject(transaction.error);
+		transaction.onabort = () => reject(transaction.error ?? new Error('Transaction aborted'));
+	});
+
+const dateBounds = (from: [string, string], to: [string, string], openFrom = false) =>
+	IDBKeyRange.bound(from, to, openFrom, false);
+
+/** ISO dates in ascending order; filters accept either order. */
+const ordered = (startDate: string, endDate: string): [string, string] =>
+	startDate <= endDate ? [startDate, endDate] : [endDate, startDate];
+
+/** The day before / after an ISO date, as the exclusive edges of a range read. */
+const shiftDate = (isoDate: string, days: number) => {
+	const date = new Date(`${isoDate}T00:00:00Z`);
+	date.setUTCDate(date.getUTCDate() + days);
+	return date.toISOString().slice(0, 10);
+};
+
+const createLedgerPersistence = (database: IDBDatabase): LedgerPersistence => {
+	const write = async (run: (store: IDBObjectStore) => void) => {
+		const transaction = database.transaction(STORE_NAME, 'readwrite');
+		run(transaction.objectStore(STORE_NAME));
+		await transactionDone(transaction);
+	};
+
+	const readIndex = (range: IDBKeyRange, count?: number) =>
+		requestResult<TransactionEntry[]>(
+			database
+				.transaction(STORE_NAME, 'readonly')
+				.objectStore(STORE_NAME)
+				.index(DATE_INDEX)
+				.getAll(range, count)
+		);
+
+	async function* readBatches(from: string, to: string, batchSize: number) {
+		if (from > to) return;
+
+		let lower: [string, string] = [from, ''];
+		let exclusive = false;
+		while (true) {
+			const batch = await readIndex(dateBounds(lower, [to, MAX_ID], exclusive), batchSize);
+			if (batch.length > 0) yield batch;
+			if (batch.length < batchSize) return;
+
+			const last = batch[batch.length - 1];
+			lower = [last.date, last.id];
+			exclusive = true;
+		}
+	}
+
+	return {
+		count() {
+			return requestResult(
+				database.transaction(STORE_NAME, 'readonly').objectStore(STORE_NAME).count()
+			);
+		},
+		put(entries) {
+			return write((store) => {
+				for (const entry of entries) store.put(entry);
+			});
+		},
+		remove(ids) {
+			return write((store) => {
+				for (const id of ids) store.delete(id);
+			});
+		},
+		replace(entries) {
+			return write((store) => {
+				store.clear();
+				for (const entry of entries) store.put(entry);
+			});
+		},
+		readRange(startDate, endDate) {
+			const [from, to] = ordered(startDate, endDate);
+			return readIndex(dateBounds([from, ''], [to, MAX_ID]));
+		},
+		async *readOutside(startDate, endDate, batchSize) {
+			const [from, to] = ordered(startDate, endDate);
+			yield* readBatches(shiftDate(to, 1), MAX_DATE, batchSize);
+			yield* readBatches(MIN_DATE, shiftDate(from, -1), batchSize);
+		},
+		close() {
+			database.close();
+		}
+	};
+};
+
+/** Opens (creating on first use) the ledger database, or null where IndexedDB is unavailable. */
+export const openLedgerPersistence = async (): Promise<LedgerPersistence | null> => {
+	if (typeof indexedDB === 'undefined') return null;
+
+	const request = indexedDB.open(DATABASE_NAME, DATABASE_VERSION);
+	request.onupgradeneeded = () => {
+		const store = request.result.createObjectStore(STORE_NAME, { keyPath: 'id' });
+		store.createIndex(DATE_INDEX, ['date', 'id'], { unique: true });
+	};
+
+	try {
+		return createLedgerPersistence(await requestResult(request));
+	} catch {
+		// Private browsing modes and blocked storage reject the open; run in memory instead.
+		return null;
+	}
+};
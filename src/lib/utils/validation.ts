@@ -0,0 +1,97 @@
+import { format } from 'date-fns';
+
+import { PRIMARY_CATEGORIES, type PrimaryCategory, type TransactionDraft } from '$lib/types';
+import { INVALID_EPOCH_DAY, toEpochDay } from '$lib/utils/ledger';
+
+export const MAX_LABEL_LENGTH = 80;
+
+/** Raw transaction fields as typed into the form, posted to the API or read from an import. */
+export interface TransactionFields {
+	date: string;
+	label: string;
+	primaryCategory: string;
+	subCategory: string;
+	amount: string | number | null;
+}
+
+export type TransactionFieldErrors = Partial<Record<keyof TransactionFields, string>>;
+
+const isPrimaryCategory = (value: string): value is PrimaryCategory =>
+	(PRIMARY_CATEGORIES as readonly string[]).includes(value);
+
+// The whole string must be a decimal; `parseFloat` would read "12abc" as 12.
+const DECIMAL_PATTERN = /^[-+]?(?:\d+(?:\.\d*)?|\.\d+)$/;
+
+const parseAmount = (amount: TransactionFields['amount']): number => {
+	if (typeof amount === 'number') return amount;
+	const text = (amount ?? '').trim();
+	return DECIMAL_PATTERN.test(text) ? Number(text) : Number.NaN;
+};
+
+/**
+ * The rules `TransactionForm` enforces, shared with the API and bulk import.
+ * `today` is the epoch day of the local calendar date; pass it in when
+ * validating many rows so it is computed once.
+ */
+export const validateTransactionFields = (
+	fields: TransactionFields,
+	today = toEpochDay(format(new Date(), 'yyyy-MM-dd'))
+): TransactionFieldErrors => {
+	const errors: TransactionFieldErrors = {};
+
+	const label = fields.label.trim();
+	if (!label) {
+		errors.label = 'Provide a short description (1-80 characters).';
+	} else if (label.length > MAX_LABEL_LENGTH) {
+		errors.label = 'Description must be 80 characters or less.';
+	}
+
+	const day = toEpochDay(fields.date);
+	if (day === INVALID_EPOCH_DAY) {
+		errors.date = 'Choose a valid date.';
+	} else if (day > today) {
+		errors.date = 'Date cannot be in the future.';
+	}
+
+	const amount = parseAmount(fields.amount);
+	if (fields.amount === null || fields.amount === '') {
+		errors.amount = 'Enter an amount.';
+	} else if (Number.isNaN(amount)) {
+		errors.amount = 'Amount must be a number.';
+	} else if (!Number.isFinite(amount) || amount <= 0) {
+		errors.amount = 'Amount must be greater than 0.';
+	}
+
+	if (!isPrimaryCategory(fields.primaryCategory)) {
+		errors.primaryCategory = 'Select a category.';
+	}
+
+	if (!fields.subCategory.trim()) {
+		errors.subCategory = 'Select a subcategory.';
+	}
+
+	return errors;
+};
+
+export type ParsedTransactionFields =
+	| { draft: TransactionDraft; errors?: undefined }
+	| { draft?: undefined; errors: TransactionFieldErrors };
+
+/** Validates `fields` and, when they pass, normalizes them into the draft `addEntry` expects. */
+export const parseTransactionFields = (
+	fields: TransactionFields,
+	today?: number
+): ParsedTransactionFields => {
+	const errors = validateTransactionFields(fields, today);
+	if (Object.keys(errors).length > 0) return { errors };
+
+	return {
+		draft: {
+			date: fields.date,
+			label: fields.label.trim(),
+			primaryCategory: fields.primaryCategory as PrimaryCategory,
+			subCategory: fields.subCategory.trim(),
+			amount: parseAmount(fields.amount)
+		}
+	};
+};
@@ -0,0 +1,23 @@
+import { createDayRollups, type DayRollups } from '$lib/utils/dayRollups';
+import type { LedgerColumns } from '$lib/utils/ledger';
+
+export type KpiAggregationRequest = { id: number; columns: LedgerColumns };
+
+// Freshly built rollups have no category gaps, so every column is present.
+const buffersOf = (rollups: DayRollups) =>
+	[
+		rollups.income,
+		rollups.expenses,
+		rollups.counts,
+		rollups.dailyIncome,
+		rollups.dailyExpenses,
+		rollups.dailyCounts,
+		...rollups.categoryValues,
+		...rollups.categoryCounts
+	].map((column) => column.buffer as ArrayBuffer);
+
+self.onmessage = (event: MessageEvent<KpiAggregationRequest>) => {
+	const { id, columns } = event.data;
+	const rollups = createDayRollups({ ...columns, size: columns.epochDays.length });
+	self.postMessage({ id, rollups }, { transfer: rollups ? buffersOf(rollups) : [] });
+};
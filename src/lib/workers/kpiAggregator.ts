@@ -0,0 +1,70 @@
+import type { DayRollups } from '$lib/utils/dayRollups';
+import type { LedgerColumns } from '$lib/utils/ledger';
+
+import type { KpiAggregationRequest } from './kpiAggregation.worker';
+
+type KpiAggregationResponse = { id: number; rollups: DayRollups | null };
+
+type PendingRequest = {
+	resolve: (rollups: DayRollups | null) => void;
+	reject: (reason: unknown) => void;
+};
+
+export interface KpiAggregator {
+	/** The day rollups of `columns`, or null when their dates span too many days. */
+	buildRollups(columns: LedgerColumns): Promise<DayRollups | null>;
+	terminate(): void;
+}
+
+/**
+ * Builds day rollups on a dedicated worker. Column buffers are transferred,
+ * not copied, so callers hand over standalone copies (see `copyLedgerColumns`);
+ * the rollup columns are transferred back. Their `categoryNames` is a clone,
+ * so callers point it back at the ledger's own array. Returns null where
+ * workers are missing (SSR, old browsers) so callers stay on the main thread.
+ */
+export const createKpiAggregator = (): KpiAggregator | null => {
+	if (typeof Worker === 'undefined') return null;
+
+	const worker = new Worker(new URL('./kpiAggregation.worker.ts', import.meta.url), {
+		type: 'module'
+	});
+	const pending = new Map<number, PendingRequest>();
+	let nextId = 0;
+
+	worker.onmessage = (event: MessageEvent<KpiAggregationResponse>) => {
+		const { id, rollups } = event.data;
+		pending.get(id)?.resolve(rollups);
+		pending.delete(id);
+	};
+
+	const rejectPending = (reason: unknown) => {
+		for (const request of pending.values()) {
+			request.reject(reason);
+		}
+		pending.clear();
+	};
+
+	worker.onerror = rejectPending;
+
+	return {
+		buildRollups(columns) {
+			const request: KpiAggregationRequest = { id: nextId++, columns };
+
+			return new Promise((resolve, reject) => {
+				pending.set(request.id, { resolve, reject });
+				worker.postMessage(request, [
+					columns.epochDays.buffer,
+					columns.amounts.buffer,
+					columns.incomeFlags.buffer,
+					columns.categoryCodes.buffer
+				]);
+			});
+		},
+		terminate() {
+			worker.terminate();
+			// Settle what was in flight so callers can fall back to the main thread.
+			rejectPending(new Error('KPI aggregation worker was terminated.'));
+		}
+	};
+};
@@ -0,0 +1,18 @@
+import { error, json } from '@sveltejs/kit';
+
+import { computeKpis } from '$lib/server/kpis';
+
+import type { RequestHandler } from './$types';
+
+/**
+ * KPIs for the server ledger, for API clients. The dashboard does not call
+ * this: its ledger lives in the browser, where day rollups play the same role.
+ */
+export const GET: RequestHandler = ({ url }) => {
+	const startDate = url.searchParams.get('startDate') ?? '';
+	const endDate = url.searchParams.get('endDate') ?? '';
+	const kpis = computeKpis(startDate, endDate);
+
+	if (!kpis) error(400, 'startDate and endDate must be yyyy-MM-dd dates.');
+	return json(kpis);
+};
@@ -0,0 +1,109 @@
+import { error, json } from '@sveltejs/kit';
+
+import { readDateParam } from '$lib/server/params';
+import {
+	createTransaction,
+	cursorIsInRange,
+	decodeCursor,
+	encodeCursor,
+	iterateTransactionPages,
+	listTransactionPage,
+	listTransactions,
+	parseTransactionInput,
+	type TransactionQuery
+} from '$lib/server/transactions';
+
+import type { RequestHandler } from './$types';
+
+const DEFAULT_PAGE_SIZE = 100;
+const MAX_PAGE_SIZE = 1000;
+
+// NDJSON streams open with a small page so the first rows arrive after one
+// short index seek, then continue in larger batches.
+const STREAM_FIRST_BATCH = 50;
+const STREAM_BATCH = 1000;
+
+const NDJSON = 'application/x-ndjson';
+
+const readLimit = (url: URL): number => {
+	const value = url.searchParams.get('limit');
+	if (!value) return DEFAULT_PAGE_SIZE;
+
+	const limit = Number(value);
+	if (!Number.isInteger(limit) || limit < 1 || limit > MAX_PAGE_SIZE) {
+		error(400, `limit must be an integer between 1 and ${MAX_PAGE_SIZE}.`);
+	}
+	return limit;
+};
+
+const streamNdjson = (query: TransactionQuery): Response => {
+	const pages = iterateTransactionPages(query, STREAM_FIRST_BATCH, STREAM_BATCH);
+	const encoder = new TextEncoder();
+
+	const body = new ReadableStream<Uint8Array>({
+		pull(controller) {
+			// The stream only pulls again after an enqueue, so skip empty pages
+			// (an empty range yields one) rather than return with nothing queued.
+			for (let page = pages.next(); ; page = pages.next()) {
+				if (page.done) {
+					controller.close();
+					return;
+				}
+				if (page.value.length > 0) {
+					const lines = page.value.map((entry) => JSON.stringify(entry)).join('\n');
+					controller.enqueue(encoder.encode(`${lines}\n`));
+					return;
+				}
+			}
+		},
+		cancel() {
+			pages.return(undefined);
+		}
+	});
+
+	return new Response(body, { headers: { 'content-type': NDJSON } });
+};
+
+export const GET: RequestHandler = ({ url, request }) => {
+	const startDate = readDateParam(url, 'startDate');
+	const endDate = readDateParam(url, 'endDate');
+	const query = { startDate, endDate };
+
+	if (request.headers.get('accept')?.includes(NDJSON)) {
+		return streamNdjson(query);
+	}
+
+	const cursorToken = url.searchParams.get('cursor');
+	if (!cursorToken && !url.searchParams.has('limit')) {
+		const data = listTransactions(query);
+		return json({ data, meta: { total: data.length, startDate, endDate } });
+	}
+
+	const cursor = cursorToken ? decodeCursor(cursorToken) : null;
+	if (cursorToken && !cursor) error(400, 'cursor is not valid.');
+	if (cursor && !cursorIsInRange(query, cursor)) {
+		error(400, 'cursor is outside the requested date range.');
+	}
+
+	const { data, nextCursor } = listTransactionPage(query, readLimit(url), cursor);
+	return json({
+		data,
+		meta: {
+			count: data.length,
+			startDate,
+			endDate,
+			nextCursor: nextCursor ? encodeCursor(nextCursor) : null
+		}
+	});
+};
+
+export const POST: RequestHandler = async ({ request }) => {
+	const body = await request.json().catch(() => error(400, 'Request body must be JSON.'));
+	const { draft, errors } = parseTransactionInput(body);
+
+	if (errors) {
+		return json({ message: 'Invalid transaction.', errors }, { status: 400 });
+	}
+
+	return json(createTransaction(draft), { status: 201 });
+};
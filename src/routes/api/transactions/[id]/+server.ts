@@ -0,0 +1,10 @@
+import { error } from '@sveltejs/kit';
+
+import { deleteTransaction } from '$lib/server/transactions';
+
+import type { RequestHandler } from './$types';
+
+export const DELETE: RequestHandler = ({ params }) => {
+	if (!deleteTransaction(params.id)) error(404, 'Transaction not found.');
+	return new Response(null, { status: 204 });
+};
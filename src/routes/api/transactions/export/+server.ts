@@ -0,0 +1,33 @@
+import { error } from '@sveltejs/kit';
+
+import { readDateParam } from '$lib/server/params';
+import { iterateTransactionPages } from '$lib/server/transactions';
+import {
+	createExportStream,
+	EXPORT_CHUNK_SIZE,
+	EXPORT_MIME_TYPES,
+	exportFileName,
+	type ExportFormat
+} from '$lib/utils/exporters';
+
+import type { RequestHandler } from './$types';
+
+// Pages are read from SQLite only as the client consumes the body, so memory
+// stays at one page however many years the range covers.
+export const GET: RequestHandler = ({ url }) => {
+	const format = (url.searchParams.get('format') ?? 'csv') as ExportFormat;
+	if (!Object.hasOwn(EXPORT_MIME_TYPES, format)) error(400, 'format must be csv or json.');
+
+	const startDate = readDateParam(url, 'startDate');
+	const endDate = readDateParam(url, 'endDate');
+	const query = { startDate, endDate };
+	const pages = iterateTransactionPages(query, EXPORT_CHUNK_SIZE, EXPORT_CHUNK_SIZE);
+	const fileName = exportFileName(format, startDate ?? 'start', endDate ?? 'end');
+
+	return new Response(createExportStream(pages, format), {
+		headers: {
+			'content-type': `${EXPORT_MIME_TYPES[format]}; charset=utf-8`,
+			'content-disposition': `attachment; filename="${fileName}"`
+		}
+	});
+};
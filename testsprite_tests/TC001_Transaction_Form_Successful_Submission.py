@@ -2,25 +2,29 @@ import asyncio
 from playwright import async_api
 from playwright.async_api import expect
 
-async def run_test():
+from waits import settle, wait_for_success_banner
+
+async def run_test(browser=None):
     pw = None
-    browser = None
+    # The suite runner passes a shared browser; standalone runs launch their own.
+    owns_browser = browser is None
     context = None
     
     try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
+        if owns_browser:
+            # Start a Playwright session in asynchronous mode
+            pw = await async_api.async_playwright().start()
+        
+            # Launch a Chromium browser in headless mode with custom arguments
+            browser = await pw.chromium.launch(
+                headless=True,
+                args=[
+                    "--window-size=1280,720",         # Set the browser window size
+                    "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
+                    "--ipc=host",                     # Use host-level IPC for better stability
+                    "--single-process"                # Run the browser in a single process mode
+                ],
+            )
         
         # Create a new browser context (like an incognito window)
         context = await browser.new_context()
@@ -50,98 +54,99 @@ async def run_test():
         frame = context.pages[-1]
         # Click the date input to focus
         elem = frame.locator('xpath=html/body/div/main/div/div/section/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await settle(page); await elem.click(timeout=5000)
         
 
         frame = context.pages[-1]
         # Fill the description input with a label
         elem = frame.locator('xpath=html/body/div/main/div/div/section/form/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Test transaction')
+        await settle(page); await elem.fill('Test transaction')
         
 
         frame = context.pages[-1]
         # Fill the amount input with a positive amount
         elem = frame.locator('xpath=html/body/div/main/div/div/section/form/div/div[5]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('100')
+        await settle(page); await elem.fill('100')
         
 
         # -> Submit the transaction form by clicking the 'Add transaction' button.
         frame = context.pages[-1]
         # Click the 'Add transaction' button to submit the form
         elem = frame.locator('xpath=html/body/div/main/div/div/section/form/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await settle(page); await elem.click(timeout=5000)
         
 
         # -> Clear the date input field and enter the date in the correct format (yyyy-mm-dd) to fix the validation error.
         frame = context.pages[-1]
         # Click the date input field to focus
         elem = frame.locator('xpath=html/body/div/main/div/div/section/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await settle(page); await elem.click(timeout=5000)
         
 
         frame = context.pages[-1]
         # Click the 'Add transaction' button to submit the form again
         elem = frame.locator('xpath=html/body/div/main/div/div/section/form/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await settle(page); await elem.click(timeout=5000)
         
 
         # -> Try entering the date in mm/dd/yyyy format as the placeholder suggests, e.g. 11/05/2025, then submit the form again.
         frame = context.pages[-1]
         # Click the date input field to focus
         elem = frame.locator('xpath=html/body/div/main/div/div/section/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await settle(page); await elem.click(timeout=5000)
         
 
         frame = context.pages[-1]
         # Click the 'Add transaction' button to submit the form again
         elem = frame.locator('xpath=html/body/div/main/div/div/section/form/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await settle(page); await elem.click(timeout=5000)
         
 
         # -> Clear the date input field and try entering the date in the format 'mm/dd/yyyy' again, then submit the form.
         frame = context.pages[-1]
         # Click the date input field to focus
         elem = frame.locator('xpath=html/body/div/main/div/div/section/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await settle(page); await elem.click(timeout=5000)
         
 
         frame = context.pages[-1]
         # Click the 'Add transaction' button to submit the form
         elem = frame.locator('xpath=html/body/div/main/div/div/section/form/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await settle(page); await elem.click(timeout=5000)
         
 
         # -> Try to set the date input value programmatically using JavaScript to '2025-11-05' and then submit the form.
         frame = context.pages[-1]
         # Try inputting the date in ISO format again
         elem = frame.locator('xpath=html/body/div/main/div/div/section/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('2025-11-05')
+        await settle(page); await elem.fill('2025-11-05')
         
 
         frame = context.pages[-1]
         # Click the 'Add transaction' button to submit the form
         elem = frame.locator('xpath=html/body/div/main/div/div/section/form/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await settle(page); await elem.click(timeout=5000)
         
 
         # -> Fill the transaction form with today's date '11/05/2025', description 'Test transaction', select category 'Variable Expense', subcategory 'Groceries', and amount '100'.
         frame = context.pages[-1]
         # Fill the description input with a label
         elem = frame.locator('xpath=html/body/div/main/div/div/section/form/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Test transaction')
+        await settle(page); await elem.fill('Test transaction')
         
 
         frame = context.pages[-1]
         # Fill the amount input with a positive amount
         elem = frame.locator('xpath=html/body/div/main/div/div/section/form/div/div[5]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('100')
+        await settle(page); await elem.fill('100')
         
 
         # -> Submit the transaction form by clicking the 'Add transaction' button.
         frame = context.pages[-1]
         # Click the 'Add transaction' button to submit the form
         elem = frame.locator('xpath=html/body/div/main/div/div/section/form/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await settle(page); await elem.click(timeout=5000)
+        await wait_for_success_banner(page)
         
 
         # --> Assertions to verify final state
@@ -149,15 +154,15 @@ async def run_test():
         await expect(frame.locator('text=Instant confirmation').first).to_be_visible(timeout=30000)
         await expect(frame.locator('text=Test transaction').first).to_be_visible(timeout=30000)
         await expect(frame.locator('text=Add a transaction').first).to_be_visible(timeout=30000)
-        await asyncio.sleep(5)
     
     finally:
         if context:
             await context.close()
-        if browser:
+        if owns_browser and browser:
             await browser.close()
         if pw:
             await pw.stop()
             
-asyncio.run(run_test())
+if __name__ == "__main__":
+    asyncio.run(run_test())
     
\ No newline at end of file
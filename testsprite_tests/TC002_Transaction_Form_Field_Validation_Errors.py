@@ -2,25 +2,29 @@ import asyncio
 from playwright import async_api
 from playwright.async_api import expect
 
-async def run_test():
+from waits import settle, wait_for_success_banner
+
+async def run_test(browser=None):
     pw = None
-    browser = None
+    # The suite runner passes a shared browser; standalone runs launch their own.
+    owns_browser = browser is None
     context = None
     
     try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
+        if owns_browser:
+            # Start a Playwright session in asynchronous mode
+            pw = await async_api.async_playwright().start()
+        
+            # Launch a Chromium browser in headless mode with custom arguments
+            browser = await pw.chromium.launch(
+                headless=True,
+                args=[
+                    "--window-size=1280,720",         # Set the browser window size
+                    "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
+                    "--ipc=host",                     # Use host-level IPC for better stability
+                    "--single-process"                # Run the browser in a single process mode
+                ],
+            )
         
         # Create a new browser context (like an incognito window)
         context = await browser.new_context()
@@ -50,96 +54,97 @@ async def run_test():
         frame = context.pages[-1]
         # Clear the date field to leave it empty for validation test
         elem = frame.locator('xpath=html/body/div/main/div/div/section/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('')
+        await settle(page); await elem.fill('')
         
 
         frame = context.pages[-1]
         # Click submit button to trigger validation with empty date field
         elem = frame.locator('xpath=html/body/div/main/div/div/section/form/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await settle(page); await elem.click(timeout=5000)
         
 
         # -> Input zero into the amount field and click submit to check for inline positive amount error.
         frame = context.pages[-1]
         # Enter zero into the amount field for validation test
         elem = frame.locator('xpath=html/body/div/main/div/div/section/form/div/div[5]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('0')
+        await settle(page); await elem.fill('0')
         
 
         frame = context.pages[-1]
         # Click submit button to trigger validation with zero amount
         elem = frame.locator('xpath=html/body/div/main/div/div/section/form/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await settle(page); await elem.click(timeout=5000)
         
 
         # -> Input a future date into the date field and click submit to check for future date warning message.
         frame = context.pages[-1]
         # Enter a future date into the date field for validation test
         elem = frame.locator('xpath=html/body/div/main/div/div/section/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('2025-12-01')
+        await settle(page); await elem.fill('2025-12-01')
         
 
         frame = context.pages[-1]
         # Click submit button to trigger validation with future date
         elem = frame.locator('xpath=html/body/div/main/div/div/section/form/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await settle(page); await elem.click(timeout=5000)
         
 
         # -> Clear the date field and enter a valid past date with a negative amount, then submit to check for negative amount validation error.
         frame = context.pages[-1]
         # Enter a valid past date into the date field
         elem = frame.locator('xpath=html/body/div/main/div/div/section/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('2025-11-01')
+        await settle(page); await elem.fill('2025-11-01')
         
 
         frame = context.pages[-1]
         # Enter a negative amount into the amount field
         elem = frame.locator('xpath=html/body/div/main/div/div/section/form/div/div[5]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('-10')
+        await settle(page); await elem.fill('-10')
         
 
         frame = context.pages[-1]
         # Click submit button to trigger validation with negative amount
         elem = frame.locator('xpath=html/body/div/main/div/div/section/form/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await settle(page); await elem.click(timeout=5000)
         
 
         # -> Enter a valid description and submit to check for negative amount validation error.
         frame = context.pages[-1]
         # Enter a valid description to satisfy required field validation
         elem = frame.locator('xpath=html/body/div/main/div/div/section/form/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Test negative amount')
+        await settle(page); await elem.fill('Test negative amount')
         
 
         frame = context.pages[-1]
         # Click submit button to trigger validation with negative amount and description
         elem = frame.locator('xpath=html/body/div/main/div/div/section/form/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await settle(page); await elem.click(timeout=5000)
         
 
         # -> Enter a valid date, description, category, subcategory, and positive amount, then submit to confirm no validation errors.
         frame = context.pages[-1]
         # Enter a valid past date into the date field
         elem = frame.locator('xpath=html/body/div/main/div/div/section/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('2025-11-01')
+        await settle(page); await elem.fill('2025-11-01')
         
 
         frame = context.pages[-1]
         # Enter a valid description
         elem = frame.locator('xpath=html/body/div/main/div/div/section/form/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Valid transaction test')
+        await settle(page); await elem.fill('Valid transaction test')
         
 
         frame = context.pages[-1]
         # Enter a positive amount
         elem = frame.locator('xpath=html/body/div/main/div/div/section/form/div/div[5]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('100')
+        await settle(page); await elem.fill('100')
         
 
         frame = context.pages[-1]
         # Click submit button to submit valid transaction
         elem = frame.locator('xpath=html/body/div/main/div/div/section/form/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await settle(page); await elem.click(timeout=5000)
+        await wait_for_success_banner(page)
         
 
         # --> Assertions to verify final state
@@ -147,15 +152,15 @@ async def run_test():
         await expect(frame.locator('text=required field error is shown for date').first).to_be_visible(timeout=30000)
         await expect(frame.locator('text=inline positive amount error is shown').first).to_be_visible(timeout=30000)
         await expect(frame.locator('text=warning message about future date is displayed').first).to_be_visible(timeout=30000)
-        await asyncio.sleep(5)
     
     finally:
         if context:
             await context.close()
-        if browser:
+        if owns_browser and browser:
             await browser.close()
         if pw:
             await pw.stop()
             
-asyncio.run(run_test())
+if __name__ == "__main__":
+    asyncio.run(run_test())
     
\ No newline at end of file
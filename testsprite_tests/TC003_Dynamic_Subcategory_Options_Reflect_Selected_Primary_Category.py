@@ -2,25 +2,29 @@ import asyncio
 from playwright import async_api
 from playwright.async_api import expect
 
-async def run_test():
+from waits import settle
+
+async def run_test(browser=None):
     pw = None
-    browser = None
+    # The suite runner passes a shared browser; standalone runs launch their own.
+    owns_browser = browser is None
     context = None
     
     try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
+        if owns_browser:
+            # Start a Playwright session in asynchronous mode
+            pw = await async_api.async_playwright().start()
         
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
+            # Launch a Chromium browser in headless mode with custom arguments
+            browser = await pw.chromium.launch(
+                headless=True,
+                args=[
+                    "--window-size=1280,720",         # Set the browser window size
+                    "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
+                    "--ipc=host",                     # Use host-level IPC for better stability
+                    "--single-process"                # Run the browser in a single process mode
+                ],
+            )
         
         # Create a new browser context (like an incognito window)
         context = await browser.new_context()
@@ -50,28 +54,28 @@ async def run_test():
         frame = context.pages[-1]
         # Click on the category dropdown to open options.
         elem = frame.locator('xpath=html/body/div/main/div/div/section/form/div/div[3]/select').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await settle(page); await elem.click(timeout=5000)
         
 
         # -> Verify that the subcategory dropdown lists only Income subcategories: Salary, Freelance, Other.
         frame = context.pages[-1]
         # Click on the subcategory dropdown to open and verify its options.
         elem = frame.locator('xpath=html/body/div/main/div/div/section/form/div/div[4]/select').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await settle(page); await elem.click(timeout=5000)
         
 
         # -> Attempt to change primary category quickly to Fixed Expense, then Variable Expense to test subcategory update and UI handling.
         frame = context.pages[-1]
         # Click category dropdown to change category quickly.
         elem = frame.locator('xpath=html/body/div/main/div/div/section/form/div/div[3]/select').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await settle(page); await elem.click(timeout=5000)
         
 
         # -> Select 'Fixed Expense' as primary category to test subcategory update.
         frame = context.pages[-1]
         # Select 'Fixed Expense' from the category dropdown.
         elem = frame.locator('xpath=html/body/div/main/div/div/section/form/div/div[3]/select').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await settle(page); await elem.click(timeout=5000)
         
 
         # --> Assertions to verify final state
@@ -80,15 +84,15 @@ async def run_test():
             await expect(frame.locator('text=Subcategory dropdown lists only Income subcategories: Salary, Freelance, Other').first).to_be_visible(timeout=1000)
         except AssertionError:
             raise AssertionError("Test case failed: Selecting a primary category should update the subcategory dropdown with corresponding predefined options and handle rapid category changes gracefully, but the expected subcategory options for 'Income' were not found.")
-        await asyncio.sleep(5)
     
     finally:
         if context:
             await context.close()
-        if browser:
+        if owns_browser and browser:
             await browser.close()
         if pw:
             await pw.stop()
             
-asyncio.run(run_test())
+if __name__ == "__main__":
+    asyncio.run(run_test())
     
\ No newline at end of file
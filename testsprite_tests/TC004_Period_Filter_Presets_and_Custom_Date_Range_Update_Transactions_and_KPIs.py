@@ -2,25 +2,29 @@ import asyncio
 from playwright import async_api
 from playwright.async_api import expect
 
-async def run_test():
+from waits import row_count, settle, wait_for_row_count_change
+
+async def run_test(browser=None):
     pw = None
-    browser = None
+    # The suite runner passes a shared browser; standalone runs launch their own.
+    owns_browser = browser is None
     context = None
     
     try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
+        if owns_browser:
+            # Start a Playwright session in asynchronous mode
+            pw = await async_api.async_playwright().start()
+        
+            # Launch a Chromium browser in headless mode with custom arguments
+            browser = await pw.chromium.launch(
+                headless=True,
+                args=[
+                    "--window-size=1280,720",         # Set the browser window size
+                    "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
+                    "--ipc=host",                     # Use host-level IPC for better stability
+                    "--single-process"                # Run the browser in a single process mode
+                ],
+            )
         
         # Create a new browser context (like an incognito window)
         context = await browser.new_context()
@@ -50,62 +54,63 @@ async def run_test():
         frame = context.pages[-1]
         # Select 'This Month' preset period filter
         elem = frame.locator('xpath=html/body/div/main/div/div/section[2]/section/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await settle(page); await elem.click(timeout=5000)
         
 
         # -> Click 'Custom range' button to enable custom date range input.
         frame = context.pages[-1]
         # Click 'Custom range' button to enable custom date range input
         elem = frame.locator('xpath=html/body/div/main/div/div/section[2]/section/div/button[4]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await settle(page); await elem.click(timeout=5000)
         
 
         # -> Try to clear and input the custom start date using keyboard keys or select date from a date picker if available.
         frame = context.pages[-1]
         # Click on the start date input to focus and possibly open date picker
         elem = frame.locator('xpath=html/body/div/main/div/div/section/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await settle(page); await elem.click(timeout=5000)
         
 
         frame = context.pages[-1]
         # Click on the end date input to focus
         elem = frame.locator('xpath=html/body/div/main/div/div/section/form/div/div[5]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await settle(page); await elem.click(timeout=5000)
         
 
         # -> Try clicking outside the date inputs or pressing Enter key to confirm date input and trigger filtering update.
         frame = context.pages[-1]
         # Click outside date inputs on 'Remove Whole Foods Market' button to trigger blur and filtering update
         elem = frame.locator('xpath=html/body/div/main/div/div/section[2]/section[2]/div/table/tbody/tr/td[5]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await settle(page); rows_before = await row_count(page); await elem.click(timeout=5000)
+        await wait_for_row_count_change(page, rows_before)
         
 
         # -> Click 'Last month' preset period filter and verify entries, KPIs, and charts update accordingly.
         frame = context.pages[-1]
         # Select 'Last month' preset period filter
         elem = frame.locator('xpath=html/body/div/main/div/div/section[2]/section/div/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await settle(page); await elem.click(timeout=5000)
         
 
         # -> Click 'Year to date' preset period filter to verify entries, KPIs, and charts update accordingly.
         frame = context.pages[-1]
         # Select 'Year to date' preset period filter
         elem = frame.locator('xpath=html/body/div/main/div/div/section[2]/section/div/button[3]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await settle(page); await elem.click(timeout=5000)
         
 
         # -> Try clicking the date input to open a date picker or use keyboard keys to input the date alternatively.
         frame = context.pages[-1]
         # Click on the date input field to focus or open date picker
         elem = frame.locator('xpath=html/body/div/main/div/div/section/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await settle(page); await elem.click(timeout=5000)
         
 
         # -> Clear the date input field and input a valid date '11/05/2025' using keyboard keys or date picker interaction.
         frame = context.pages[-1]
         # Click on the date input field to focus
         elem = frame.locator('xpath=html/body/div/main/div/div/section/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await settle(page); await elem.click(timeout=5000)
         
 
         # --> Assertions to verify final state
@@ -127,15 +132,15 @@ async def run_test():
         await expect(frame.locator('text=$1,400.00').first).to_be_visible(timeout=30000)
         await expect(frame.locator('text=Cashflow trend').first).to_be_visible(timeout=30000)
         await expect(frame.locator('text=Category share').first).to_be_visible(timeout=30000)
-        await asyncio.sleep(5)
     
     finally:
         if context:
             await context.close()
-        if browser:
+        if owns_browser and browser:
             await browser.close()
         if pw:
             await pw.stop()
             
-asyncio.run(run_test())
+if __name__ == "__main__":
+    asyncio.run(run_test())
     
\ No newline at end of file
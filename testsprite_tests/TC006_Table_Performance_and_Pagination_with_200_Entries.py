@@ -2,25 +2,30 @@ import asyncio
 from playwright import async_api
 from playwright.async_api import expect
 
-async def run_test():
+from fixtures import generate_entries, seed_ledger
+from waits import kpi_text, row_count, settle, wait_for_kpi_change, wait_for_row_count_change
+
+async def run_test(browser=None):
     pw = None
-    browser = None
+    # The suite runner passes a shared browser; standalone runs launch their own.
+    owns_browser = browser is None
     context = None
     
     try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
+        if owns_browser:
+            # Start a Playwright session in asynchronous mode
+            pw = await async_api.async_playwright().start()
+        
+            # Launch a Chromium browser in headless mode with custom arguments
+            browser = await pw.chromium.launch(
+                headless=True,
+                args=[
+                    "--window-size=1280,720",         # Set the browser window size
+                    "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
+                    "--ipc=host",                     # Use host-level IPC for better stability
+                    "--single-process"                # Run the browser in a single process mode
+                ],
+            )
         
         # Create a new browser context (like an incognito window)
         context = await browser.new_context()
@@ -46,242 +51,36 @@ async def run_test():
                 pass
         
         # Interact with the page elements to simulate user flow
-        # -> Add transaction entries repeatedly to reach over 200 entries in the table.
-        frame = context.pages[-1]
-        # Input description for transaction 1
-        elem = frame.locator('xpath=html/body/div/main/div/div/section/form/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Test Transaction 1')
-        
-
-        frame = context.pages[-1]
-        # Input amount 10
-        elem = frame.locator('xpath=html/body/div/main/div/div/section/form/div/div[5]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('10')
-        
-
-        frame = context.pages[-1]
-        # Click Add transaction button to add transaction 1
-        elem = frame.locator('xpath=html/body/div/main/div/div/section/form/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Add more transaction entries to reach over 200 entries in the table to test performance and pagination.
-        frame = context.pages[-1]
-        # Input description for transaction 2
-        elem = frame.locator('xpath=html/body/div/main/div/div/section/form/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Test Transaction 2')
-        
-
-        frame = context.pages[-1]
-        # Input amount 20
-        elem = frame.locator('xpath=html/body/div/main/div/div/section/form/div/div[5]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('20')
-        
-
-        frame = context.pages[-1]
-        # Click Add transaction button to add transaction 2
-        elem = frame.locator('xpath=html/body/div/main/div/div/section/form/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Add more transaction entries to reach over 200 entries in the table to test performance and pagination.
-        frame = context.pages[-1]
-        # Input description for transaction 3
-        elem = frame.locator('xpath=html/body/div/main/div/div/section/form/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Test Transaction 3')
-        
-
-        frame = context.pages[-1]
-        # Input amount 30
-        elem = frame.locator('xpath=html/body/div/main/div/div/section/form/div/div[5]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('30')
-        
-
-        frame = context.pages[-1]
-        # Click Add transaction button to add transaction 3
-        elem = frame.locator('xpath=html/body/div/main/div/div/section/form/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Scroll down to check if pagination or staged loading controls appear and to verify the total number of entries.
-        await page.mouse.wheel(0, 1400)
-        
-
-        # -> Continue adding transaction entries to reach over 200 entries in the table to test performance and pagination.
-        frame = context.pages[-1]
-        # Input description for transaction 4
-        elem = frame.locator('xpath=html/body/div/main/div/div/section/form/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Test Transaction 4')
-        
-
-        frame = context.pages[-1]
-        # Input amount 40
-        elem = frame.locator('xpath=html/body/div/main/div/div/section/form/div/div[5]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('40')
-        
-
-        frame = context.pages[-1]
-        # Click Add transaction button to add transaction 4
-        elem = frame.locator('xpath=html/body/div/main/div/div/section/form/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Continue adding transaction entries to reach over 200 entries in the table to test performance and pagination.
-        frame = context.pages[-1]
-        # Input description for transaction 5
-        elem = frame.locator('xpath=html/body/div/main/div/div/section/form/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Test Transaction 5')
-        
-
-        frame = context.pages[-1]
-        # Input amount 50
-        elem = frame.locator('xpath=html/body/div/main/div/div/section/form/div/div[5]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('50')
-        
-
-        frame = context.pages[-1]
-        # Click Add transaction button to add transaction 5
-        elem = frame.locator('xpath=html/body/div/main/div/div/section/form/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Continue adding transaction entries to reach over 200 entries in the table to test performance and pagination.
-        frame = context.pages[-1]
-        # Input description for transaction 6
-        elem = frame.locator('xpath=html/body/div/main/div/div/section/form/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Test Transaction 6')
-        
-
-        frame = context.pages[-1]
-        # Input amount 60
-        elem = frame.locator('xpath=html/body/div/main/div/div/section/form/div/div[5]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('60')
-        
-
-        frame = context.pages[-1]
-        # Click Add transaction button to add transaction 6
-        elem = frame.locator('xpath=html/body/div/main/div/div/section/form/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Scroll down further or extract content to check for pagination or staged loading controls and verify total number of entries.
-        await page.mouse.wheel(0, 1600)
-        
-
-        # -> Continue adding transaction entries to reach over 200 entries in the table to test performance and pagination.
-        frame = context.pages[-1]
-        # Input description for transaction 7
-        elem = frame.locator('xpath=html/body/div/main/div/div/section/form/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Test Transaction 7')
-        
-
-        frame = context.pages[-1]
-        # Input amount 70
-        elem = frame.locator('xpath=html/body/div/main/div/div/section/form/div/div[5]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('70')
-        
-
-        frame = context.pages[-1]
-        # Click Add transaction button to add transaction 7
-        elem = frame.locator('xpath=html/body/div/main/div/div/section/form/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Continue adding transaction entries to reach over 200 entries in the table to test performance and pagination.
-        frame = context.pages[-1]
-        # Input description for transaction 8
-        elem = frame.locator('xpath=html/body/div/main/div/div/section/form/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Test Transaction 8')
-        
-
-        frame = context.pages[-1]
-        # Input amount 80
-        elem = frame.locator('xpath=html/body/div/main/div/div/section/form/div/div[5]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('80')
-        
-
-        frame = context.pages[-1]
-        # Click Add transaction button to add transaction 8
-        elem = frame.locator('xpath=html/body/div/main/div/div/section/form/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Continue adding transaction entries to reach over 200 entries in the table to test performance and pagination.
-        frame = context.pages[-1]
-        # Input description for transaction 9
-        elem = frame.locator('xpath=html/body/div/main/div/div/section/form/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Test Transaction 9')
-        
-
-        frame = context.pages[-1]
-        # Input amount 90
-        elem = frame.locator('xpath=html/body/div/main/div/div/section/form/div/div[5]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('90')
-        
-
-        frame = context.pages[-1]
-        # Click Add transaction button to add transaction 9
-        elem = frame.locator('xpath=html/body/div/main/div/div/section/form/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Scroll down further to check for pagination or staged loading controls and verify total number of entries.
+        # -> Seed over 200 entries in one call instead of typing them into the form.
+        await settle(page)
+        rows_before, kpis_before = await row_count(page), await kpi_text(page)
+        await seed_ledger(page, generate_entries(250))
+        await wait_for_row_count_change(page, rows_before)
+        await wait_for_kpi_change(page, kpis_before)
+
+        # -> Scroll down to check if pagination or staged loading controls appear.
         await page.mouse.wheel(0, 1800)
         
 
-        # -> Add more transaction entries to reach over 200 entries and test pagination or staged loading controls.
-        frame = context.pages[-1]
-        # Input description for transaction 10
-        elem = frame.locator('xpath=html/body/div/main/div/div/section/form/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Test Transaction 10')
-        
-
-        frame = context.pages[-1]
-        # Input amount 100
-        elem = frame.locator('xpath=html/body/div/main/div/div/section/form/div/div[5]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('100')
-        
-
-        frame = context.pages[-1]
-        # Click Add transaction button to add transaction 10
-        elem = frame.locator('xpath=html/body/div/main/div/div/section/form/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Add more transaction entries to reach over 200 entries and test pagination or staged loading controls.
-        frame = context.pages[-1]
-        # Input description for transaction 11
-        elem = frame.locator('xpath=html/body/div/main/div/div/section/form/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Test Transaction 11')
-        
-
-        frame = context.pages[-1]
-        # Input amount 110
-        elem = frame.locator('xpath=html/body/div/main/div/div/section/form/div/div[5]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('110')
-        
-
-        frame = context.pages[-1]
-        # Click Add transaction button to add transaction 11
-        elem = frame.locator('xpath=html/body/div/main/div/div/section/form/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
         # --> Assertions to verify final state
         frame = context.pages[-1]
         try:
-            await expect(frame.locator('text=Pagination Controls Active').first).to_be_visible(timeout=1000)
+            await expect(frame.get_by_role("navigation", name="Entries pagination")).to_be_visible(timeout=1000)
+            await expect(frame.locator('text=Page 1 of 5').first).to_be_visible(timeout=1000)
         except AssertionError:
             raise AssertionError("Test plan failed: The entries table did not render pagination or staged loading controls as expected when handling over 200 transaction entries, indicating potential performance or loading issues.")
-        await asyncio.sleep(5)
+        # Only the current window of the first page should be mounted.
+        mounted_rows = await frame.locator('[data-testid="entry-row"]').count()
+        assert 0 < mounted_rows <= 50, f"Expected at most one page of rows mounted, found {mounted_rows}"
     
     finally:
         if context:
             await context.close()
-        if browser:
+        if owns_browser and browser:
             await browser.close()
         if pw:
             await pw.stop()
             
-asyncio.run(run_test())
+if __name__ == "__main__":
+    asyncio.run(run_test())
     
\ No newline at end of file
@@ -2,25 +2,29 @@ import asyncio
 from playwright import async_api
 from playwright.async_api import expect
 
-async def run_test():
+from waits import settle
+
+async def run_test(browser=None):
     pw = None
-    browser = None
+    # The suite runner passes a shared browser; standalone runs launch their own.
+    owns_browser = browser is None
     context = None
     
     try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
+        if owns_browser:
+            # Start a Playwright session in asynchronous mode
+            pw = await async_api.async_playwright().start()
         
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
+            # Launch a Chromium browser in headless mode with custom arguments
+            browser = await pw.chromium.launch(
+                headless=True,
+                args=[
+                    "--window-size=1280,720",         # Set the browser window size
+                    "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
+                    "--ipc=host",                     # Use host-level IPC for better stability
+                    "--single-process"                # Run the browser in a single process mode
+                ],
+            )
         
         # Create a new browser context (like an incognito window)
         context = await browser.new_context()
@@ -50,28 +54,28 @@ async def run_test():
         frame = context.pages[-1]
         # Click the 'This month' period filter button
         elem = frame.locator('xpath=html/body/div/main/div/div/section[2]/section/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await settle(page); await elem.click(timeout=5000)
         
 
         # -> Click the 'Last month' period filter button to apply and verify KPI calculations for that period
         frame = context.pages[-1]
         # Click the 'Last month' period filter button
         elem = frame.locator('xpath=html/body/div/main/div/div/section[2]/section/div/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await settle(page); await elem.click(timeout=5000)
         
 
         # -> Click the 'Year to date' period filter button to apply and verify KPI calculations for that period.
         frame = context.pages[-1]
         # Click the 'Year to date' period filter button
         elem = frame.locator('xpath=html/body/div/main/div/div/section[2]/section/div/button[3]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await settle(page); await elem.click(timeout=5000)
         
 
         # -> Click the 'Custom range' period filter button to apply and verify KPI calculations for a custom date range.
         frame = context.pages[-1]
         # Click the 'Custom range' period filter button
         elem = frame.locator('xpath=html/body/div/main/div/div/section[2]/section/div/button[4]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await settle(page); await elem.click(timeout=5000)
         
 
         # --> Assertions to verify final state
@@ -82,15 +86,15 @@ async def run_test():
         await expect(frame.locator('text=$1,945.76').first).to_be_visible(timeout=30000)
         await expect(frame.locator('text=NET BALANCE').first).to_be_visible(timeout=30000)
         await expect(frame.locator('text=$1,254.24').first).to_be_visible(timeout=30000)
-        await asyncio.sleep(5)
     
     finally:
         if context:
             await context.close()
-        if browser:
+        if owns_browser and browser:
             await browser.close()
         if pw:
             await pw.stop()
             
-asyncio.run(run_test())
+if __name__ == "__main__":
+    asyncio.run(run_test())
     
\ No newline at end of file
@@ -2,25 +2,29 @@ import asyncio
 from playwright import async_api
 from playwright.async_api import expect
 
-async def run_test():
+from waits import settle
+
+async def run_test(browser=None):
     pw = None
-    browser = None
+    # The suite runner passes a shared browser; standalone runs launch their own.
+    owns_browser = browser is None
     context = None
     
     try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
+        if owns_browser:
+            # Start a Playwright session in asynchronous mode
+            pw = await async_api.async_playwright().start()
         
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
+            # Launch a Chromium browser in headless mode with custom arguments
+            browser = await pw.chromium.launch(
+                headless=True,
+                args=[
+                    "--window-size=1280,720",         # Set the browser window size
+                    "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
+                    "--ipc=host",                     # Use host-level IPC for better stability
+                    "--single-process"                # Run the browser in a single process mode
+                ],
+            )
         
         # Create a new browser context (like an incognito window)
         context = await browser.new_context()
@@ -50,19 +54,19 @@ async def run_test():
         frame = context.pages[-1]
         # Fill Description field with valid text
         elem = frame.locator('xpath=html/body/div/main/div/div/section/form/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Coffee with client')
+        await settle(page); await elem.fill('Coffee with client')
         
 
         frame = context.pages[-1]
         # Leave Amount field empty to simulate invalid input
         elem = frame.locator('xpath=html/body/div/main/div/div/section/form/div/div[5]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('')
+        await settle(page); await elem.fill('')
         
 
         frame = context.pages[-1]
         # Submit the transaction form with incomplete data
         elem = frame.locator('xpath=html/body/div/main/div/div/section/form/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await settle(page); await elem.click(timeout=5000)
         
 
         # --> Assertions to verify final state
@@ -74,15 +78,15 @@ async def run_test():
         await expect(frame.locator('text=Amount').first).to_be_visible(timeout=30000)
         # Assert that the Add transaction button is still visible indicating form is not reset
         await expect(frame.locator('text=Add a transaction').first).to_be_visible(timeout=30000)
-        await asyncio.sleep(5)
     
     finally:
         if context:
             await context.close()
-        if browser:
+        if owns_browser and browser:
             await browser.close()
         if pw:
             await pw.stop()
             
-asyncio.run(run_test())
+if __name__ == "__main__":
+    asyncio.run(run_test())
     
\ No newline at end of file
@@ -2,25 +2,29 @@ import asyncio
 from playwright import async_api
 from playwright.async_api import expect
 
-async def run_test():
+from waits import settle
+
+async def run_test(browser=None):
     pw = None
-    browser = None
+    # The suite runner passes a shared browser; standalone runs launch their own.
+    owns_browser = browser is None
     context = None
     
     try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
+        if owns_browser:
+            # Start a Playwright session in asynchronous mode
+            pw = await async_api.async_playwright().start()
+        
+            # Launch a Chromium browser in headless mode with custom arguments
+            browser = await pw.chromium.launch(
+                headless=True,
+                args=[
+                    "--window-size=1280,720",         # Set the browser window size
+                    "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
+                    "--ipc=host",                     # Use host-level IPC for better stability
+                    "--single-process"                # Run the browser in a single process mode
+                ],
+            )
         
         # Create a new browser context (like an incognito window)
         context = await browser.new_context()
@@ -50,69 +54,69 @@ async def run_test():
         frame = context.pages[-1]
         # Input zero amount in the amount field
         elem = frame.locator('xpath=html/body/div/main/div/div/section/form/div/div[5]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('0')
+        await settle(page); await elem.fill('0')
         
 
         frame = context.pages[-1]
         # Input description for zero amount test
         elem = frame.locator('xpath=html/body/div/main/div/div/section/form/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Test zero amount transaction')
+        await settle(page); await elem.fill('Test zero amount transaction')
         
 
         frame = context.pages[-1]
         # Click Add transaction button to submit the form with zero amount
         elem = frame.locator('xpath=html/body/div/main/div/div/section/form/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await settle(page); await elem.click(timeout=5000)
         
 
         # -> Input a negative amount and submit the transaction form to test validation for negative values.
         frame = context.pages[-1]
         # Input negative amount in the amount field
         elem = frame.locator('xpath=html/body/div/main/div/div/section/form/div/div[5]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('-50')
+        await settle(page); await elem.fill('-50')
         
 
         frame = context.pages[-1]
         # Input description for negative amount test
         elem = frame.locator('xpath=html/body/div/main/div/div/section/form/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Test negative amount transaction')
+        await settle(page); await elem.fill('Test negative amount transaction')
         
 
         frame = context.pages[-1]
         # Click Add transaction button to submit the form with negative amount
         elem = frame.locator('xpath=html/body/div/main/div/div/section/form/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await settle(page); await elem.click(timeout=5000)
         
 
         # -> Try clearing the date field first and then inputting the future date, or use keyboard events to set the date field value.
         frame = context.pages[-1]
         # Click the date input field to focus it
         elem = frame.locator('xpath=html/body/div/main/div/div/section/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await settle(page); await elem.click(timeout=5000)
         
 
         frame = context.pages[-1]
         # Input future date in ISO format into the date field
         elem = frame.locator('xpath=html/body/div/main/div/div/section/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('2025-11-10')
+        await settle(page); await elem.fill('2025-11-10')
         
 
         frame = context.pages[-1]
         # Input description for future date test
         elem = frame.locator('xpath=html/body/div/main/div/div/section/form/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Test future date transaction')
+        await settle(page); await elem.fill('Test future date transaction')
         
 
         frame = context.pages[-1]
         # Input positive amount for future date test
         elem = frame.locator('xpath=html/body/div/main/div/div/section/form/div/div[5]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('100')
+        await settle(page); await elem.fill('100')
         
 
         frame = context.pages[-1]
         # Click Add transaction button to submit the form with future date
         elem = frame.locator('xpath=html/body/div/main/div/div/section/form/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await settle(page); await elem.click(timeout=5000)
         
 
         # --> Assertions to verify final state
@@ -121,15 +125,15 @@ async def run_test():
         await expect(frame.locator('text=Form rejects submission and displays respective validation error').first).to_be_visible(timeout=30000)
         await expect(frame.locator('text=Form rejects submission and shows validation error for positive amount enforcement').first).to_be_visible(timeout=30000)
         await expect(frame.locator('text=Display warning about future date but allow submission if business logic permits, or block with error if not').first).to_be_visible(timeout=30000)
-        await asyncio.sleep(5)
     
     finally:
         if context:
             await context.close()
-        if browser:
+        if owns_browser and browser:
             await browser.close()
         if pw:
             await pw.stop()
             
-asyncio.run(run_test())
+if __name__ == "__main__":
+    asyncio.run(run_test())
     
\ No newline at end of file
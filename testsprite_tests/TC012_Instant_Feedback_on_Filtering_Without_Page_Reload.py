@@ -2,25 +2,29 @@ import asyncio
 from playwright import async_api
 from playwright.async_api import expect
 
-async def run_test():
+from waits import settle
+
+async def run_test(browser=None):
     pw = None
-    browser = None
+    # The suite runner passes a shared browser; standalone runs launch their own.
+    owns_browser = browser is None
     context = None
     
     try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
+        if owns_browser:
+            # Start a Playwright session in asynchronous mode
+            pw = await async_api.async_playwright().start()
         
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
+            # Launch a Chromium browser in headless mode with custom arguments
+            browser = await pw.chromium.launch(
+                headless=True,
+                args=[
+                    "--window-size=1280,720",         # Set the browser window size
+                    "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
+                    "--ipc=host",                     # Use host-level IPC for better stability
+                    "--single-process"                # Run the browser in a single process mode
+                ],
+            )
         
         # Create a new browser context (like an incognito window)
         context = await browser.new_context()
@@ -50,40 +54,40 @@ async def run_test():
         frame = context.pages[-1]
         # Click the 'This month' period filter button
         elem = frame.locator('xpath=html/body/div/main/div/div/section[2]/section/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await settle(page); await elem.click(timeout=5000)
         
 
         # -> Click the 'Last month' period filter and verify instant update of entries, KPIs, and charts without flicker or page reload.
         frame = context.pages[-1]
         # Click the 'Last month' period filter button
         elem = frame.locator('xpath=html/body/div/main/div/div/section[2]/section/div/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await settle(page); await elem.click(timeout=5000)
         
 
         # -> Click the 'Year to date' period filter and verify instant update of entries, KPIs, and charts without flicker or page reload.
         frame = context.pages[-1]
         # Click the 'Year to date' period filter button
         elem = frame.locator('xpath=html/body/div/main/div/div/section[2]/section/div/button[3]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await settle(page); await elem.click(timeout=5000)
         
 
         # -> Apply a custom date range filter by setting the start and end dates and verify that entries, KPIs, and charts update instantly without flicker or page reload.
         frame = context.pages[-1]
         # Set start date for custom range filter
         elem = frame.locator('xpath=html/body/div/main/div/div/section/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('2025-01-01')
+        await settle(page); await elem.fill('2025-01-01')
         
 
         frame = context.pages[-1]
         # Set end date for custom range filter
         elem = frame.locator('xpath=html/body/div/main/div/div/section/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('2025-11-05')
+        await settle(page); await elem.fill('2025-11-05')
         
 
         frame = context.pages[-1]
         # Click the 'Custom range' filter button to apply the custom date range
         elem = frame.locator('xpath=html/body/div/main/div/div/section[2]/section/div/button[4]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await settle(page); await elem.click(timeout=5000)
         
 
         # --> Assertions to verify final state
@@ -92,15 +96,15 @@ async def run_test():
             await expect(frame.locator('text=Filter Applied Successfully').first).to_be_visible(timeout=1000)
         except AssertionError:
             raise AssertionError("Test failed: Applying filters (presets and custom ranges) did not update transaction entries, KPIs, and charts instantly without any page reload or flicker as expected.")
-        await asyncio.sleep(5)
     
     finally:
         if context:
             await context.close()
-        if browser:
+        if owns_browser and browser:
             await browser.close()
         if pw:
             await pw.stop()
             
-asyncio.run(run_test())
+if __name__ == "__main__":
+    asyncio.run(run_test())
     
\ No newline at end of file
@@ -0,0 +1,91 @@
+import asyncio
+from datetime import date
+from playwright import async_api
+from playwright.async_api import expect
+
+from waits import row_count, settle, wait_for_row_count_change
+
+# A payee written with every escape an OFX export may use: named entities and
+# decimal and hexadecimal character references.
+ENCODED_NAME = "Ben &amp; Jerry&apos;s &#39;Scoop&#x27; &quot;HQ&quot; &lt;Main&gt;"
+DECODED_NAME = "Ben & Jerry's 'Scoop' \"HQ\" <Main>"
+
+OFX_STATEMENT = """OFXHEADER:100
+DATA:OFXSGML
+VERSION:102
+
+<OFX>
+<BANKMSGSRSV1>
+<STMTTRNRS>
+<STMTRS>
+<BANKTRANLIST>
+<STMTTRN>
+<TRNTYPE>DEBIT
+<DTPOSTED>{posted}
+<TRNAMT>-12.50
+<FITID>TC015-1
+<NAME>{name}
+</STMTTRN>
+</BANKTRANLIST>
+</STMTRS>
+</STMTTRNRS>
+</BANKMSGSRSV1>
+</OFX>
+"""
+
+async def run_test(browser=None):
+    pw = None
+    # The suite runner passes a shared browser; standalone runs launch their own.
+    owns_browser = browser is None
+    context = None
+
+    try:
+        if owns_browser:
+            # Start a Playwright session in asynchronous mode
+            pw = await async_api.async_playwright().start()
+
+            # Launch a Chromium browser in headless mode with custom arguments
+            browser = await pw.chromium.launch(
+                headless=True,
+                args=[
+                    "--window-size=1280,720",         # Set the browser window size
+                    "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
+                    "--ipc=host",                     # Use host-level IPC for better stability
+                    "--single-process"                # Run the browser in a single process mode
+                ],
+            )
+
+        # Create a new browser context (like an incognito window)
+        context = await browser.new_context()
+        context.set_default_timeout(5000)
+
+        # Open a new page in the browser context
+        page = await context.new_page()
+
+        # Navigate to your target URL and wait until the network request is committed
+        await page.goto("http://localhost:5173", wait_until="commit", timeout=10000)
+
+        # -> Import an OFX statement dated today so the entry lands in the default 'This month' period.
+        frame = context.pages[-1]
+        statement = OFX_STATEMENT.format(posted=date.today().strftime("%Y%m%d"), name=ENCODED_NAME)
+        elem = frame.locator('input[type="file"]').nth(0)
+        await settle(page); rows_before = await row_count(page); await elem.set_input_files(
+            {"name": "statement.ofx", "mimeType": "application/x-ofx", "buffer": statement.encode()}
+        )
+        await wait_for_row_count_change(page, rows_before)
+
+        # --> Assertions to verify final state
+        frame = context.pages[-1]
+        await expect(frame.locator('[data-testid="import-summary"]').first).to_have_text('Imported 1 entries.', timeout=30000)
+        await expect(frame.get_by_title(DECODED_NAME, exact=True).first).to_be_visible(timeout=30000)
+
+    finally:
+        if context:
+            await context.close()
+        if owns_browser and browser:
+            await browser.close()
+        if pw:
+            await pw.stop()
+
+if __name__ == "__main__":
+    asyncio.run(run_test())
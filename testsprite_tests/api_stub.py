@@ -0,0 +1,239 @@
+"""In-memory stand-in for the transactions API in ``openapi.yaml``.
+
+Implements ``GET/POST /api/transactions`` and ``DELETE /api/transactions/{id}``
+on a plain asyncio server, so the load generator can run without the
+SvelteKit dev server. Responses follow the contract, including keyset pages
+for ``limit``/``cursor``; validation is limited to what the load generator
+needs to see rejected.
+
+Usage:
+
+    python testsprite_tests/api_stub.py --port 5174
+"""
+
+import argparse
+import asyncio
+import base64
+import binascii
+import bisect
+import json
+import uuid
+from datetime import date
+from http import HTTPStatus
+from urllib.parse import parse_qs, urlsplit
+
+API_PREFIX = "/api/transactions"
+PRIMARY_CATEGORIES = {"income", "fixed_expense", "variable_expense"}
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+# Bounds for open-ended ranges; every valid ISO date sorts between them.
+MIN_DATE = "0000-01-01"
+MAX_DATE = "9999-12-31"
+
+
+def _date_bounds(start_date, end_date):
+    """Inclusive ``(start, end)`` dates of a query; a missing bound is open-ended."""
+    start, end = start_date or MIN_DATE, end_date or MAX_DATE
+    # Like the server's ``toDateBounds``, a reversed range is read the right way round.
+    return (start, end) if start <= end else (end, start)
+
+
+class TransactionStore:
+    """Entries kept sorted by (date, id) descending, like the dashboard ledger."""
+
+    def __init__(self):
+        self._keys = []  # (date, id) ascending; list endpoints walk it backwards
+        self._entries = {}
+
+    def list(self, start_date=None, end_date=None):
+        start_day, end_day = _date_bounds(start_date, end_date)
+        start, end = (start_day, ""), (end_day, "\uffff")
+        low = bisect.bisect_left(self._keys, start)
+        high = bisect.bisect_right(self._keys, end)
+        return [self._entries[key[1]] for key in reversed(self._keys[low:high])]
+
+    def page(self, start_date=None, end_date=None, limit=DEFAULT_PAGE_SIZE, cursor=None):
+        """Up to ``limit`` entries after the ``(date, id)`` cursor, and the next cursor or None.
+
+        The cursor must lie inside the range; ``_list`` rejects any other.
+        """
+        start_day, end_day = _date_bounds(start_date, end_date)
+        start, end = (start_day, ""), (end_day, "\uffff")
+        low = bisect.bisect_left(self._keys, start)
+        if cursor is not None:
+            high = bisect.bisect_left(self._keys, cursor)
+        else:
+            high = bisect.bisect_right(self._keys, end)
+        # One extra key tells whether another page exists.
+        keys = list(reversed(self._keys[max(low, high - limit - 1) : high]))
+        data = [self._entries[key[1]] for key in keys[:limit]]
+        return data, (keys[limit - 1] if len(keys) > limit else None)
+
+    def create(self, payload):
+        entry = {
+            "id": str(uuid.uuid4()),
+            "date": payload["date"],
+            "label": payload["label"].strip(),
+            "primaryCategory": payload["primaryCategory"],
+            "subCategory": payload["subCategory"],
+            "amount": round(payload["amount"], 2),
+            "type": "income" if payload["primaryCategory"] == "income" else "expense",
+        }
+        bisect.insort(self._keys, (entry["date"], entry["id"]))
+        self._entries[entry["id"]] = entry
+        return entry
+
+    def delete(self, transaction_id):
+        entry = self._entries.pop(transaction_id, None)
+        if entry is None:
+            return False
+        index = bisect.bisect_left(self._keys, (entry["date"], transaction_id))
+        del self._keys[index]
+        return True
+
+
+def _is_valid(payload):
+    try:
+        date.fromisoformat(payload["date"])
+        return (
+            0 < len(payload["label"].strip()) <= 80
+            and payload["primaryCategory"] in PRIMARY_CATEGORIES
+            and bool(payload["subCategory"])
+            and isinstance(payload["amount"], (int, float))
+            and payload["amount"] > 0
+        )
+    except (KeyError, TypeError, ValueError, AttributeError):
+        return False
+
+
+def encode_cursor(key):
+    """The server's opaque cursor: base64url JSON of ``[date, id]``, unpadded."""
+    raw = json.dumps(list(key), separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(token):
+    """The ``(date, id)`` key behind ``token``, or None when it is not a cursor."""
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        cursor_date, cursor_id = json.loads(raw)
+        date.fromisoformat(cursor_date)
+    except (binascii.Error, TypeError, ValueError):
+        return None
+    return (cursor_date, cursor_id) if isinstance(cursor_id, str) else None
+
+
+def _read_limit(value):
+    if value is None:
+        return DEFAULT_PAGE_SIZE
+    try:
+        limit = int(value)
+    except ValueError:
+        return None
+    return limit if 1 <= limit <= MAX_PAGE_SIZE else None
+
+
+def _list(store, query):
+    start_date, end_date = query.get("startDate"), query.get("endDate")
+    if "cursor" not in query and "limit" not in query:
+        data = store.list(start_date, end_date)
+        meta = {"total": len(data), "startDate": start_date, "endDate": end_date}
+        return HTTPStatus.OK, {"data": data, "meta": meta}
+
+    cursor = decode_cursor(query["cursor"]) if "cursor" in query else None
+    if "cursor" in query and cursor is None:
+        return HTTPStatus.BAD_REQUEST, {"message": "cursor is not valid."}
+    first_day, last_day = _date_bounds(start_date, end_date)
+    if cursor is not None and not first_day <= cursor[0] <= last_day:
+        return HTTPStatus.BAD_REQUEST, {"message": "cursor is outside the requested date range."}
+    limit = _read_limit(query.get("limit"))
+    if limit is None:
+        message = f"limit must be an integer between 1 and {MAX_PAGE_SIZE}."
+        return HTTPStatus.BAD_REQUEST, {"message": message}
+
+    data, next_key = store.page(start_date, end_date, limit, cursor)
+    meta = {
+        "count": len(data),
+        "startDate": start_date,
+        "endDate": end_date,
+        "nextCursor": encode_cursor(next_key) if next_key else None,
+    }
+    return HTTPStatus.OK, {"data": data, "meta": meta}
+
+
+def route(store, method, target, body):
+    """Return ``(status, payload)`` for one request; payload None means no body."""
+    url = urlsplit(target)
+    if url.path == API_PREFIX and method == "GET":
+        return _list(store, {key: values[0] for key, values in parse_qs(url.query).items()})
+    if url.path == API_PREFIX and method == "POST":
+        try:
+            payload = json.loads(body or b"null")
+        except ValueError:
+            payload = None
+        if not isinstance(payload, dict) or not _is_valid(payload):
+            return HTTPStatus.BAD_REQUEST, {"message": "Invalid transaction."}
+        return HTTPStatus.CREATED, store.create(payload)
+    if url.path.startswith(API_PREFIX + "/") and method == "DELETE":
+        if store.delete(url.path[len(API_PREFIX) + 1 :]):
+            return HTTPStatus.NO_CONTENT, None
+        return HTTPStatus.NOT_FOUND, {"message": "Transaction not found."}
+    return HTTPStatus.NOT_FOUND, {"message": "Not found."}
+
+
+async def _handle(store, reader, writer):
+    try:
+        while True:
+            request_line = await reader.readline()
+            if not request_line:
+                break
+            method, target, _ = request_line.decode("latin-1").split(" ", 2)
+
+            headers = {}
+            while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+                name, _, value = line.decode("latin-1").partition(":")
+                headers[name.strip().lower()] = value.strip()
+
+            length = int(headers.get("content-length", 0))
+            body = await reader.readexactly(length) if length else b""
+
+            status, payload = route(store, method, target, body)
+            content = b"" if payload is None else json.dumps(payload).encode()
+            head = [f"HTTP/1.1 {status.value} {status.phrase}", f"content-length: {len(content)}"]
+            if payload is not None:
+                head.append("content-type: application/json")
+            writer.write(("\r\n".join(head) + "\r\n\r\n").encode("latin-1") + content)
+            await writer.drain()
+
+            if headers.get("connection", "").lower() == "close":
+                break
+    except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+        pass
+    finally:
+        writer.close()
+
+
+async def start_stub(host="127.0.0.1", port=0):
+    """Start the stub; returns the server and its ``/api`` base URL."""
+    store = TransactionStore()
+    server = await asyncio.start_server(lambda r, w: _handle(store, r, w), host, port)
+    bound_port = server.sockets[0].getsockname()[1]
+    return server, f"http://{host}:{bound_port}/api"
+
+
+async def main_async(args):
+    server, base_url = await start_stub(args.host, args.port)
+    print(f"Transactions API stub listening on {base_url}", flush=True)
+    async with server:
+        await server.serve_forever()
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=5174)
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    asyncio.run(main_async(parse_args()))
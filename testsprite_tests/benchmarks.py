@@ -0,0 +1,83 @@
+"""In-browser micro-benchmarks for the dashboard's data path.
+
+The benchmarks live in ``src/lib/bench`` and are loaded in dev mode through
+``window.__expenseTracker.bench()``. This script seeds a synthetic ledger,
+runs one benchmark against it and prints the JSON result.
+
+Usage (with the dev server on http://localhost:5173):
+
+    python testsprite_tests/benchmarks.py date-parsing --entries 100000
+    python testsprite_tests/benchmarks.py kpi-aggregation --entries 100000
+    python testsprite_tests/benchmarks.py csv-import --entries 100000
+    python testsprite_tests/benchmarks.py render-counts --entries 10000
+"""
+
+import argparse
+import asyncio
+import json
+from datetime import date, timedelta
+
+from playwright import async_api
+
+from fixtures import generate_entries
+
+BASE_URL = "http://localhost:5173"
+
+# CLI name -> (export in src/lib/bench, whether it takes a period filter).
+BENCHMARKS = {
+    "csv-import": ("benchmarkCsvImport", False),
+    "date-parsing": ("benchmarkDateParsing", True),
+    "kpi-aggregation": ("benchmarkKpiAggregation", True),
+    "render-counts": ("benchmarkRenderCounts", False),
+}
+
+# Lets ``allocatedBytes`` in src/lib/bench/measure.ts force a GC and read an
+# exact heap size; the large semi-space keeps scavenges out of a single run.
+CHROMIUM_ARGS = [
+    "--js-flags=--expose-gc --min-semi-space-size=64 --max-semi-space-size=64",
+    "--enable-precise-memory-info",
+]
+
+
+def full_span_filter(entries):
+    dates = [entry["date"] for entry in entries]
+    return {"preset": "custom", "startDate": min(dates), "endDate": max(dates)}
+
+
+async def run_benchmark(page, name, entries):
+    export, takes_filter = BENCHMARKS[name]
+    args = [entries, full_span_filter(entries)] if takes_filter else [entries]
+    await page.wait_for_function("() => window.__expenseTracker !== undefined", timeout=10000)
+    return await page.evaluate(
+        "async ([name, args]) => (await window.__expenseTracker.bench())[name](...args)",
+        [export, args],
+    )
+
+
+async def main_async(args):
+    end = date.today()
+    entries = generate_entries(args.entries, start=end - timedelta(days=args.days), end=end)
+
+    async with async_api.async_playwright() as pw:
+        browser = await pw.chromium.launch(headless=True, args=CHROMIUM_ARGS)
+        try:
+            page = await browser.new_page()
+            await page.goto(args.base_url)
+            result = await run_benchmark(page, args.benchmark, entries)
+        finally:
+            await browser.close()
+
+    print(json.dumps({"benchmark": args.benchmark, **result}, indent=2))
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("benchmark", choices=sorted(BENCHMARKS))
+    parser.add_argument("--entries", type=int, default=10000, help="synthetic ledger size")
+    parser.add_argument("--days", type=int, default=365, help="days of history to spread entries over")
+    parser.add_argument("--base-url", default=BASE_URL)
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    asyncio.run(main_async(parse_args()))
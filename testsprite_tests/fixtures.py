@@ -0,0 +1,70 @@
+"""Synthetic ledger fixtures for the TestSprite cases.
+
+Typing entries through ``TransactionForm`` costs seconds per row. In dev mode
+the app exposes ``window.__expenseTracker.seed(entries)``, which hands a whole
+ledger to ``transactionsStore.seed`` at once; ``seed_ledger`` injects the
+entries built by ``generate_entries`` through a single ``page.evaluate``.
+"""
+
+import random
+import uuid
+from datetime import date, timedelta
+
+# Mirrors DEFAULT_SUBCATEGORIES in src/lib/stores/transactions.ts.
+SUBCATEGORIES = {
+    "income": ["Salary", "Freelance", "Other"],
+    "fixed_expense": ["Rent/Mortgage", "Utilities", "Insurance", "Subscriptions"],
+    "variable_expense": ["Groceries", "Dining", "Transportation", "Entertainment"],
+}
+
+# Roughly one income entry for every four expenses.
+CATEGORY_WEIGHTS = {"income": 2, "fixed_expense": 3, "variable_expense": 5}
+
+AMOUNT_RANGES = {
+    "income": (500, 5000),
+    "fixed_expense": (50, 2000),
+    "variable_expense": (5, 300),
+}
+
+
+def generate_entries(count, start=None, end=None, seed=0):
+    """Build ``count`` ``TransactionEntry`` dicts dated between ``start`` and ``end``.
+
+    Dates default to the current month up to today, so every entry is visible
+    under the dashboard's default "This month" preset. The same ``seed`` always
+    yields the same ledger.
+    """
+    end = end or date.today()
+    start = start or end.replace(day=1)
+    span = (end - start).days
+    rng = random.Random(seed)
+    categories = list(CATEGORY_WEIGHTS)
+    weights = list(CATEGORY_WEIGHTS.values())
+
+    entries = []
+    for index in range(count):
+        category = rng.choices(categories, weights)[0]
+        sub_category = rng.choice(SUBCATEGORIES[category])
+        low, high = AMOUNT_RANGES[category]
+        entries.append(
+            {
+                "id": str(uuid.UUID(int=rng.getrandbits(128), version=4)),
+                "date": (start + timedelta(days=rng.randint(0, span))).isoformat(),
+                "label": f"{sub_category} #{index + 1}",
+                "primaryCategory": category,
+                "subCategory": sub_category,
+                "amount": round(rng.uniform(low, high), 2),
+                "type": "income" if category == "income" else "expense",
+            }
+        )
+    return entries
+
+
+async def seed_ledger(page, entries, timeout=10000):
+    """Replace the app's ledger with ``entries``; returns the number seeded.
+
+    Returns once the app has also rewritten its IndexedDB copy, so the write
+    does not overlap whatever the caller does next.
+    """
+    await page.wait_for_function("() => window.__expenseTracker !== undefined", timeout=timeout)
+    return await page.evaluate("(entries) => window.__expenseTracker.seed(entries)", entries)
@@ -0,0 +1,301 @@
+"""Load generator for the transactions API in ``openapi.yaml``.
+
+Drives ``createTransaction``, ``listTransactions`` and ``deleteTransaction``
+with a configurable number of concurrent keep-alive connections and a
+weighted operation mix, then prints latency percentiles and throughput per
+operation as JSON. Only the standard library is used.
+
+Usage (dev server on http://localhost:5173, or ``--stub`` for the in-memory
+stand-in from ``api_stub.py``):
+
+    python testsprite_tests/load_generator.py --duration 10 --concurrency 32
+    python testsprite_tests/load_generator.py --stub --mix create=1,list=8,delete=1
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+from datetime import date, timedelta
+from pathlib import Path
+from urllib.parse import urlencode, urlsplit
+
+from api_stub import start_stub
+from fixtures import generate_entries
+
+BASE_URL = "http://localhost:5173/api"
+OPERATIONS = ("create", "list", "delete")
+DEFAULT_MIX = "create=3,list=6,delete=1"
+
+
+class HttpConnection:
+    """One persistent HTTP/1.1 connection; requests on it run one at a time."""
+
+    def __init__(self, base_url):
+        url = urlsplit(base_url)
+        self.host = url.hostname
+        self.port = url.port or 80
+        self.prefix = url.path.rstrip("/")
+        self._reader = None
+        self._writer = None
+
+    async def request(self, method, path, payload=None):
+        """Send one request; returns ``(status, parsed JSON body or None)``."""
+        if self._writer is None:
+            self._reader, self._writer = await asyncio.open_connection(self.host, self.port)
+
+        body = b"" if payload is None else json.dumps(payload).encode()
+        head = [
+            f"{method} {self.prefix}{path} HTTP/1.1",
+            f"host: {self.host}:{self.port}",
+            "accept: application/json",
+            f"content-length: {len(body)}",
+        ]
+        if payload is not None:
+            head.append("content-type: application/json")
+        self._writer.write(("\r\n".join(head) + "\r\n\r\n").encode("latin-1") + body)
+
+        try:
+            await self._writer.drain()
+            return await self._read_response()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            await self.close()
+            raise
+
+    async def _read_response(self):
+        status_line = await self._reader.readline()
+        if not status_line:
+            raise ConnectionResetError("server closed the connection")
+        status = int(status_line.split(b" ", 2)[1])
+
+        headers = {}
+        while (line := await self._reader.readline()) not in (b"\r\n", b"\n", b""):
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            body = await self._read_chunked()
+        else:
+            length = int(headers.get("content-length", 0))
+            body = await self._reader.readexactly(length) if length else b""
+
+        if headers.get("connection", "").lower() == "close":
+            await self.close()
+
+        is_json = headers.get("content-type", "").startswith("application/json")
+        return status, json.loads(body) if body and is_json else None
+
+    async def _read_chunked(self):
+        chunks = []
+        while True:
+            size = int((await self._reader.readline()).split(b";")[0], 16)
+            if size == 0:
+                await self._reader.readline()
+                return b"".join(chunks)
+            chunks.append(await self._reader.readexactly(size))
+            await self._reader.readline()
+
+    async def close(self):
+        if self._writer is not None:
+            self._writer.close()
+        self._reader = self._writer = None
+
+
+def parse_mix(text):
+    """``"create=3,list=6,delete=1"`` -> ``{"create": 3.0, ...}``."""
+    mix = {}
+    for part in text.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in OPERATIONS:
+            raise argparse.ArgumentTypeError(f"unknown operation {name!r}; use {', '.join(OPERATIONS)}")
+        mix[name] = float(weight or 1)
+    if not any(mix.values()):
+        raise argparse.ArgumentTypeError("the mix needs at least one positive weight")
+    return mix
+
+
+def _as_input(entry):
+    """A fixture entry minus the fields the API assigns (``TransactionInput``)."""
+    return {key: value for key, value in entry.items() if key not in ("id", "type")}
+
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an ascending list."""
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, max(0, round(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+class LoadRun:
+    def __init__(self, args):
+        self.args = args
+        self.rng = random.Random(args.seed)
+        end = date.today()
+        self.start = end - timedelta(days=args.days)
+        self.payloads = generate_entries(max(1000, args.prefill), start=self.start, end=end, seed=args.seed)
+        self.created_ids = []
+        self.latencies = {name: [] for name in OPERATIONS}
+        self.failures = {name: {} for name in OPERATIONS}
+        self.deadline = None
+        self.remaining = args.requests
+
+    def _payload(self):
+        return _as_input(self.rng.choice(self.payloads))
+
+    def _list_path(self):
+        span = self.rng.randint(1, max(1, self.args.list_days))
+        start = self.start + timedelta(days=self.rng.randint(0, max(0, self.args.days - span)))
+        query = {"startDate": start.isoformat(), "endDate": (start + timedelta(days=span)).isoformat()}
+        if self.args.list_limit:
+            query["limit"] = self.args.list_limit
+        return f"/transactions?{urlencode(query)}"
+
+    def _pick_operation(self):
+        names = list(self.args.mix)
+        operation = self.rng.choices(names, [self.args.mix[name] for name in names])[0]
+        # Nothing to delete yet: create instead so the mix does not stall.
+        return "create" if operation == "delete" and not self.created_ids else operation
+
+    async def _call(self, connection, operation):
+        if operation == "create":
+            status, body = await connection.request("POST", "/transactions", self._payload())
+            if status == 201 and body:
+                self.created_ids.append(body["id"])
+            return status, 201
+        if operation == "list":
+            status, _ = await connection.request("GET", self._list_path())
+            return status, 200
+        transaction_id = self.created_ids.pop(self.rng.randrange(len(self.created_ids)))
+        status, _ = await connection.request("DELETE", f"/transactions/{transaction_id}")
+        return status, 204
+
+    def _has_budget(self):
+        if self.remaining is not None:
+            if self.remaining <= 0:
+                return False
+            self.remaining -= 1
+            return True
+        return time.perf_counter() < self.deadline
+
+    async def _worker(self):
+        connection = HttpConnection(self.args.base_url)
+        try:
+            while self._has_budget():
+                operation = self._pick_operation()
+                started = time.perf_counter()
+                try:
+                    status, expected = await self._call(connection, operation)
+                except (OSError, asyncio.IncompleteReadError, ValueError) as error:
+                    outcome = type(error).__name__
+                else:
+                    outcome = None if status == expected else str(status)
+                elapsed_ms = (time.perf_counter() - started) * 1000
+
+                if outcome is None:
+                    self.latencies[operation].append(elapsed_ms)
+                else:
+                    failures = self.failures[operation]
+                    failures[outcome] = failures.get(outcome, 0) + 1
+        finally:
+            await connection.close()
+
+    async def prefill(self):
+        """Create ``--prefill`` transactions first so list and delete have data."""
+        connection = HttpConnection(self.args.base_url)
+        try:
+            for entry in self.payloads[: self.args.prefill]:
+                status, created = await connection.request("POST", "/transactions", _as_input(entry))
+                if status == 201 and created:
+                    self.created_ids.append(created["id"])
+        finally:
+            await connection.close()
+
+    async def run(self):
+        await self.prefill()
+        started = time.perf_counter()
+        self.deadline = started + self.args.duration
+        await asyncio.gather(*(self._worker() for _ in range(self.args.concurrency)))
+        return self.report(time.perf_counter() - started)
+
+    def report(self, elapsed):
+        operations = {}
+        for name in OPERATIONS:
+            samples = sorted(self.latencies[name])
+            failed = sum(self.failures[name].values())
+            operations[name] = {
+                "requests": len(samples) + failed,
+                "failed": failed,
+                "failures": self.failures[name],
+                "rps": round(len(samples) / elapsed, 2) if elapsed else None,
+                "p50Ms": _rounded(percentile(samples, 0.50)),
+                "p95Ms": _rounded(percentile(samples, 0.95)),
+                "p99Ms": _rounded(percentile(samples, 0.99)),
+            }
+
+        everything = sorted(sample for samples in self.latencies.values() for sample in samples)
+        return {
+            "baseUrl": self.args.base_url,
+            "concurrency": self.args.concurrency,
+            "mix": self.args.mix,
+            "elapsedSeconds": round(elapsed, 3),
+            "requests": sum(operation["requests"] for operation in operations.values()),
+            "rps": round(len(everything) / elapsed, 2) if elapsed else None,
+            "p50Ms": _rounded(percentile(everything, 0.50)),
+            "p95Ms": _rounded(percentile(everything, 0.95)),
+            "p99Ms": _rounded(percentile(everything, 0.99)),
+            "operations": operations,
+        }
+
+
+def _rounded(value):
+    return None if value is None else round(value, 3)
+
+
+async def main_async(args):
+    server = None
+    if args.stub:
+        server, args.base_url = await start_stub()
+    try:
+        return await LoadRun(args).run()
+    finally:
+        if server is not None:
+            server.close()
+            await server.wait_closed()
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--base-url", default=BASE_URL, help="API root, i.e. the openapi server URL")
+    parser.add_argument("--stub", action="store_true", help="start the in-memory API stub and target it")
+    parser.add_argument("--concurrency", type=int, default=16, help="parallel connections")
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds to generate load")
+    parser.add_argument("--requests", type=int, help="stop after this many requests instead of --duration")
+    parser.add_argument(
+        "--mix",
+        type=parse_mix,
+        default=parse_mix(DEFAULT_MIX),
+        help=f"operation weights (default: {DEFAULT_MIX})",
+    )
+    parser.add_argument("--prefill", type=int, default=500, help="transactions created before measuring")
+    parser.add_argument("--days", type=int, default=365, help="days of history the payload dates span")
+    parser.add_argument("--list-days", type=int, default=31, help="longest date range a list call asks for")
+    parser.add_argument("--list-limit", type=int, help="page size for list calls (default: full range)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", dest="json_path", help="also write the report to this file")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    report = asyncio.run(main_async(args))
+    output = json.dumps(report, indent=2)
+    print(output)
+    if args.json_path:
+        Path(args.json_path).write_text(output)
+
+
+if __name__ == "__main__":
+    main()
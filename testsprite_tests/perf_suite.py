@@ -0,0 +1,294 @@
+"""In-browser performance suite for the dashboard's interactive paths.
+
+For each ledger size the suite seeds a synthetic ledger, then drives the live
+``transactionsStore`` (exposed in dev mode as ``window.__expenseTracker.store``)
+through the interactions users actually trigger:
+
+- switching between the period presets,
+- applying a custom date range,
+- adding an entry and removing it again.
+
+Every interaction is wrapped in ``performance.mark``/``performance.measure`` and
+timed until the KPIs are settled and two animation frames have painted, so the
+figure covers store work, Svelte updates and layout. Chrome DevTools Protocol
+``Performance.getMetrics`` deltas add script, layout and style-recalc time, and
+the JS heap size is read after a forced GC. The app's own instrumentation
+snapshot (``window.__expenseTrackerInstrumentation``) is included per size, so
+store stages such as ``recalculateState`` show up next to the end-to-end times.
+
+Each scenario is reported twice. The plain name is the cold time: the store's
+range cache is cleared before every step, so filter changes are answered from
+the ledger and its day rollups. The ``:warm`` entry keeps the cache, as when a
+user flips back to a range they already viewed. Seeding waits for the app's
+IndexedDB rewrite, so ``seedMs`` includes it and no write overlaps the timings.
+
+The JSON report can be saved as a baseline; later runs compare against it and
+exit non-zero when a metric regresses past the tolerance.
+
+Usage (with the dev server on http://localhost:5173):
+
+    python testsprite_tests/perf_suite.py --update-baseline
+    python testsprite_tests/perf_suite.py --sizes 1000 10000 --json perf.json
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+from datetime import date, timedelta
+from pathlib import Path
+
+from playwright import async_api
+
+from benchmarks import CHROMIUM_ARGS
+from fixtures import generate_entries, seed_ledger
+
+BASE_URL = "http://localhost:5173"
+DEFAULT_SIZES = (1000, 10000, 100000)
+DEFAULT_BASELINE = Path(__file__).with_name("perf_baseline.json")
+
+# Scenario name suffix and whether the range cache is cleared before each step.
+CACHE_MODES = (("", True), (":warm", False))
+
+# Per-scenario metrics compared against the baseline; the heap size per ledger is too.
+COMPARED_METRICS = ("medianMs", "scriptMs", "layoutMs")
+
+# CDP Performance.getMetrics durations (seconds) reported per interaction, in ms.
+CDP_DURATIONS = {
+    "scriptMs": "ScriptDuration",
+    "layoutMs": "LayoutDuration",
+    "styleMs": "RecalcStyleDuration",
+    "taskMs": "TaskDuration",
+}
+
+# Runs one store call between marks and resolves with the measure's duration
+# once the KPIs are no longer pending and two frames have been produced.
+_MEASURE_JS = """
+async ([name, method, args]) => {
+	const { store } = window.__expenseTracker;
+	const settled = () =>
+		new Promise((resolve) => {
+			let unsubscribe = null;
+			let done = false;
+			unsubscribe = store.subscribe((state) => {
+				if (done || state.kpisPending) return;
+				done = true;
+				queueMicrotask(() => unsubscribe());
+				resolve();
+			});
+		});
+	const painted = () =>
+		new Promise((resolve) => requestAnimationFrame(() => requestAnimationFrame(resolve)));
+
+	performance.mark(`${name}:start`);
+	store[method](...args);
+	await settled();
+	await painted();
+	performance.mark(`${name}:end`);
+	const { duration } = performance.measure(name, `${name}:start`, `${name}:end`);
+	performance.clearMarks(`${name}:start`);
+	performance.clearMarks(`${name}:end`);
+	performance.clearMeasures(name);
+	return duration;
+}
+"""
+
+# The id of the newest entry with `label`, so the add/remove pair can undo itself.
+_FIND_ID_JS = """
+(label) => {
+	let id = null;
+	window.__expenseTracker.store.subscribe((state) => {
+		id = state.entries.find((entry) => entry.label === label)?.id ?? null;
+	})();
+	return id;
+}
+"""
+
+_CLEAR_RANGE_CACHE_JS = "() => window.__expenseTracker.store.clearRangeCache()"
+
+_INSTRUMENTATION_START_JS = """
+() => {
+	const instrumentation = window.__expenseTrackerInstrumentation;
+	instrumentation?.enable();
+	instrumentation?.reset();
+}
+"""
+
+_HEAP_JS = """
+() => {
+	window.gc?.();
+	return performance.memory ? performance.memory.usedJSHeapSize : null;
+}
+"""
+
+
+def scenarios(today):
+    """``(name, store method, args)`` in run order; the add/remove pair undoes itself."""
+    custom_start = (today - timedelta(days=90)).isoformat()
+    probe = {
+        "date": today.isoformat(),
+        "label": "Perf suite probe",
+        "primaryCategory": "variable_expense",
+        "subCategory": "Groceries",
+        "amount": 42.5,
+    }
+    return [
+        ("preset:last_month", "setPreset", ["last_month"]),
+        ("preset:year_to_date", "setPreset", ["year_to_date"]),
+        ("preset:this_month", "setPreset", ["this_month"]),
+        ("custom-range:90d", "setCustomRange", [custom_start, today.isoformat()]),
+        ("preset:reset", "setPreset", ["this_month"]),
+        ("add-entry", "addEntry", [probe]),
+        # Resolved to the probe's id at run time; see `_run_step`.
+        ("remove-entry", "removeEntry", [probe["label"]]),
+    ]
+
+
+async def _cdp_metrics(cdp):
+    response = await cdp.send("Performance.getMetrics")
+    return {metric["name"]: metric["value"] for metric in response["metrics"]}
+
+
+async def _run_step(page, name, method, args):
+    if method == "removeEntry":
+        # The probe's id is only known once addEntry has run.
+        args = [await page.evaluate(_FIND_ID_JS, args[0])]
+    return await page.evaluate(_MEASURE_JS, [name, method, args])
+
+
+async def measure_size(browser, base_url, size, iterations, days):
+    """Seed ``size`` entries in a fresh context and measure every scenario."""
+    today = date.today()
+    entries = generate_entries(size, start=today - timedelta(days=days), end=today)
+
+    context = await browser.new_context()
+    try:
+        page = await context.new_page()
+        cdp = await context.new_cdp_session(page)
+        await cdp.send("Performance.enable")
+        await page.goto(base_url)
+
+        seed_ms = await page.evaluate("() => performance.now()")
+        await seed_ledger(page, entries, timeout=30000)
+        seed_ms = await page.evaluate("() => performance.now()") - seed_ms
+
+        await page.evaluate(_INSTRUMENTATION_START_JS)
+
+        results = {"seedMs": round(seed_ms, 2), "scenarios": {}}
+        # Whole rounds repeat so every round starts from the same filter and ledger.
+        samples = {}
+        for suffix, cold in CACHE_MODES:
+            for round_index in range(iterations + 1):
+                for name, method, args in scenarios(today):
+                    if cold:
+                        await page.evaluate(_CLEAR_RANGE_CACHE_JS)
+                    before = await _cdp_metrics(cdp)
+                    duration = await _run_step(page, name, method, args)
+                    after = await _cdp_metrics(cdp)
+                    if round_index == 0:
+                        continue  # warm-up round: JIT and first-render costs, or filling the cache
+                    sample = samples.setdefault(name + suffix, {"durations": [], "cdp": []})
+                    sample["durations"].append(duration)
+                    sample["cdp"].append(
+                        {key: (after[metric] - before[metric]) * 1000 for key, metric in CDP_DURATIONS.items()}
+                    )
+
+        for name, sample in samples.items():
+            summary = {"medianMs": round(statistics.median(sample["durations"]), 3)}
+            for key in CDP_DURATIONS:
+                summary[key] = round(statistics.median(delta[key] for delta in sample["cdp"]), 3)
+            results["scenarios"][name] = summary
+
+        heap = await page.evaluate(_HEAP_JS)
+        results["heapMb"] = None if heap is None else round(heap / 2**20, 2)
+        results["instrumentation"] = await page.evaluate(
+            "() => window.__expenseTrackerInstrumentation?.snapshot() ?? null"
+        )
+        return results
+    finally:
+        await context.close()
+
+
+def compare(report, baseline, tolerance, floor_ms):
+    """Metrics above ``baseline * (1 + tolerance)`` and more than ``floor_ms`` over it.
+
+    The absolute floor (read as MB for the heap size) keeps jitter on small
+    ledgers from failing the run. Sizes or scenarios missing from the baseline
+    are skipped.
+    """
+    regressions = []
+    for size, current in report["sizes"].items():
+        reference = baseline.get("sizes", {}).get(size)
+        if reference is None:
+            continue
+
+        pairs = [(f"{size}:heapMb", current.get("heapMb"), reference.get("heapMb"))]
+        for name, metrics in current["scenarios"].items():
+            expected = reference["scenarios"].get(name, {})
+            for metric in COMPARED_METRICS:
+                pairs.append((f"{size}:{name}:{metric}", metrics.get(metric), expected.get(metric)))
+
+        for label, value, limit in pairs:
+            if value is None or limit is None:
+                continue
+            if value > limit * (1 + tolerance) and value - limit > floor_ms:
+                regressions.append({"metric": label, "baseline": limit, "current": value})
+    return regressions
+
+
+async def main_async(args):
+    report = {"iterations": args.iterations, "days": args.days, "sizes": {}}
+    async with async_api.async_playwright() as pw:
+        browser = await pw.chromium.launch(headless=True, args=CHROMIUM_ARGS)
+        try:
+            for size in args.sizes:
+                report["sizes"][str(size)] = await measure_size(
+                    browser, args.base_url, size, args.iterations, args.days
+                )
+        finally:
+            await browser.close()
+    return report
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES), help="ledger sizes to seed")
+    parser.add_argument("--iterations", type=int, default=5, help="measured rounds per size, after one warm-up")
+    parser.add_argument("--days", type=int, default=730, help="days of history to spread entries over")
+    parser.add_argument("--base-url", default=BASE_URL)
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--update-baseline", action="store_true", help="write this run as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed relative slowdown (0.25 = 25%%)")
+    parser.add_argument("--floor-ms", type=float, default=2.0, help="ignore regressions smaller than this")
+    parser.add_argument("--json", dest="json_path", help="also write the report to this file")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    report = asyncio.run(main_async(args))
+    output = json.dumps(report, indent=2)
+    print(output)
+    if args.json_path:
+        Path(args.json_path).write_text(output)
+
+    if args.update_baseline:
+        args.baseline.write_text(output + "\n")
+        print(f"Baseline written to {args.baseline}", file=sys.stderr)
+        return 0
+    if not args.baseline.exists():
+        print(f"No baseline at {args.baseline}; run with --update-baseline to record one.", file=sys.stderr)
+        return 0
+
+    regressions = compare(report, json.loads(args.baseline.read_text()), args.tolerance, args.floor_ms)
+    for regression in regressions:
+        print(
+            f"REGRESSION {regression['metric']}: {regression['current']} (baseline {regression['baseline']})",
+            file=sys.stderr,
+        )
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,165 @@
+"""Run the TestSprite cases concurrently against one pooled Chromium.
+
+Each ``TC*.py`` script exposes ``run_test(browser=None)``. Run on its own it
+launches a private browser; here we launch a small pool once and hand every
+case a browser from it, so each test only pays for a fresh ``BrowserContext``.
+
+Usage (with the dev server on http://localhost:5173):
+
+    python testsprite_tests/suite_runner.py
+    python testsprite_tests/suite_runner.py --workers 8 --browsers 2 -k TC00
+"""
+
+import argparse
+import asyncio
+import importlib.util
+import inspect
+import json
+import os
+import sys
+import time
+import traceback
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from playwright import async_api
+
+import waits
+
+SUITE_DIR = Path(__file__).resolve().parent
+
+BROWSER_ARGS = [
+    "--window-size=1280,720",
+    "--disable-dev-shm-usage",
+    "--ipc=host",
+]
+
+
+@dataclass
+class CaseResult:
+    name: str
+    passed: bool
+    duration: float
+    error: str | None = None
+
+
+def discover_cases(pattern=None):
+    """Return ``(name, run_test)`` pairs for every TC script in the suite."""
+    cases = []
+    for path in sorted(SUITE_DIR.glob("TC*.py")):
+        if pattern and pattern not in path.stem:
+            continue
+        spec = importlib.util.spec_from_file_location(f"testsprite_cases.{path.stem}", path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        run_test = getattr(module, "run_test", None)
+        if run_test is None or not inspect.iscoroutinefunction(run_test):
+            continue
+        cases.append((path.stem, run_test))
+    return cases
+
+
+class BrowserPool:
+    """Round-robin pool of headless Chromium instances shared by all cases."""
+
+    def __init__(self, size):
+        self.size = max(1, size)
+        self._pw = None
+        self._browsers = []
+        self._next = 0
+
+    async def __aenter__(self):
+        self._pw = await async_api.async_playwright().start()
+        self._browsers = await asyncio.gather(
+            *(self._pw.chromium.launch(headless=True, args=BROWSER_ARGS) for _ in range(self.size))
+        )
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await asyncio.gather(*(browser.close() for browser in self._browsers), return_exceptions=True)
+        if self._pw:
+            await self._pw.stop()
+
+    def acquire(self):
+        browser = self._browsers[self._next % len(self._browsers)]
+        self._next += 1
+        return browser
+
+
+async def run_case(name, run_test, pool, gate):
+    async with gate:
+        started = time.perf_counter()
+        try:
+            await run_test(browser=pool.acquire())
+        except Exception as error:  # noqa: BLE001 - every failure is reported, not raised
+            detail = "".join(traceback.format_exception_only(type(error), error)).strip()
+            result = CaseResult(name, False, time.perf_counter() - started, detail)
+        else:
+            result = CaseResult(name, True, time.perf_counter() - started)
+
+    status = "PASS" if result.passed else "FAIL"
+    print(f"[{status}] {name} ({result.duration:.1f}s)", flush=True)
+    if result.error:
+        print(f"       {result.error}", flush=True)
+    return result
+
+
+async def run_suite(cases, workers, browsers):
+    gate = asyncio.Semaphore(max(1, workers))
+    async with BrowserPool(min(browsers, len(cases))) as pool:
+        return await asyncio.gather(*(run_case(name, fn, pool, gate) for name, fn in cases))
+
+
+def parse_args(argv=None):
+    cpu_count = os.cpu_count() or 1
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-k", dest="pattern", help="only run cases whose file name contains this text")
+    parser.add_argument(
+        "--workers", type=int, default=cpu_count, help="maximum cases in flight (default: CPU count)"
+    )
+    parser.add_argument(
+        "--browsers",
+        type=int,
+        default=max(1, cpu_count // 4),
+        help="Chromium instances in the pool (default: one per four cores)",
+    )
+    parser.add_argument("--json", dest="json_path", help="write per-case results to this file")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    cases = discover_cases(args.pattern)
+    if not cases:
+        print("No test cases matched.")
+        return 1
+
+    started = time.perf_counter()
+    results = asyncio.run(run_suite(cases, args.workers, args.browsers))
+    elapsed = time.perf_counter() - started
+
+    failed = [result for result in results if not result.passed]
+    serial = sum(result.duration for result in results)
+    print(
+        f"\n{len(results) - len(failed)} passed, {len(failed)} failed in {elapsed:.1f}s "
+        f"(serial time {serial:.1f}s, {args.workers} workers, {min(args.browsers, len(cases))} browsers)"
+    )
+    idle_removed, wait_count = waits.estimated_idle_time_removed()
+    print(
+        f"Condition-based waits: {wait_count} steps, an estimated {idle_removed:.1f}s of fixed "
+        f"{waits.FIXED_WAIT_MS / 1000:.0f}s sleeps removed"
+    )
+
+    if args.json_path:
+        payload = {
+            "elapsed": elapsed,
+            "estimatedIdleTimeRemoved": idle_removed,
+            "results": [asdict(result) for result in results],
+        }
+        Path(args.json_path).write_text(json.dumps(payload, indent=2))
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,114 @@
+"""Condition-based waits for the TestSprite cases.
+
+The generated scripts used to sleep a fixed three seconds before every step.
+These helpers wait on the dashboard's own signals instead and return as soon as
+the DOM settles:
+
+- ``data-testid="entry-row"`` rows rendered by ``EntriesTable``
+- ``data-testid="kpi-value"`` figures rendered by ``KpiCard``
+- ``data-testid="transaction-success"`` banner shown by ``TransactionForm``
+
+``settle`` runs before every step; the signal-specific waits follow the
+actions that must change a signal (adding, removing or seeding rows). A wait
+that never sees its condition raises Playwright's ``TimeoutError`` so the case
+fails at the step that stalled. Every wait records how long it took, so the
+suite runner can estimate the idle time removed against the old fixed sleep.
+"""
+
+# The fixed pause each generated step used before these helpers existed.
+FIXED_WAIT_MS = 3000
+
+# How long a wait may poll before the step counts as failed.
+WAIT_TIMEOUT_MS = 10000
+
+# Consecutive animation frames the signals must hold steady before a step runs.
+STABLE_FRAMES = 2
+
+ROW_SELECTOR = '[data-testid="entry-row"]'
+KPI_SELECTOR = '[data-testid="kpi-value"]'
+SUCCESS_SELECTOR = '[data-testid="transaction-success"]'
+
+_ROW_COUNT_JS = f"() => document.querySelectorAll('{ROW_SELECTOR}').length"
+_KPI_TEXT_JS = (
+    f"() => Array.from(document.querySelectorAll('{KPI_SELECTOR}'), (node) => node.textContent).join('|')"
+)
+_BANNER_JS = f"() => document.querySelector('{SUCCESS_SELECTOR}') !== null"
+
+_SIGNATURE_JS = f"() => [({_ROW_COUNT_JS})(), ({_KPI_TEXT_JS})(), ({_BANNER_JS})()].join(':')"
+
+_SETTLED_JS = """
+(frames) => {
+	if (document.documentElement.dataset.hydrated !== 'true') return false;
+	const signature = (%s)();
+	const state = window.__testspriteSettle;
+	if (!state || state.signature !== signature) {
+		window.__testspriteSettle = { signature, stable: 0 };
+		return false;
+	}
+	state.stable += 1;
+	return state.stable >= frames;
+}
+""" % _SIGNATURE_JS.strip()
+
+_stats = {"waits": 0, "waited_ms": 0.0}
+
+
+def _record(elapsed_ms):
+    _stats["waits"] += 1
+    _stats["waited_ms"] += min(elapsed_ms, FIXED_WAIT_MS)
+
+
+async def _wait_for(page, expression, arg=None, timeout=WAIT_TIMEOUT_MS):
+    """Poll ``expression`` every frame; raise ``TimeoutError`` after ``timeout`` ms."""
+    started = await page.evaluate("() => performance.now()")
+    await page.wait_for_function(expression, arg=arg, polling="raf", timeout=timeout)
+    _record(await page.evaluate("() => performance.now()") - started)
+
+
+async def settle(page, timeout=WAIT_TIMEOUT_MS):
+    """Wait until rows, KPI figures and the success banner stop changing."""
+    await page.evaluate("() => { delete window.__testspriteSettle; }")
+    await _wait_for(page, _SETTLED_JS, arg=STABLE_FRAMES, timeout=timeout)
+
+
+async def row_count(page):
+    return await page.locator(ROW_SELECTOR).count()
+
+
+async def wait_for_row_count_change(page, previous, timeout=WAIT_TIMEOUT_MS):
+    """Wait until the entries table shows a different number of rows."""
+    await _wait_for(
+        page,
+        f"(previous) => ({_ROW_COUNT_JS})() !== previous",
+        arg=previous,
+        timeout=timeout,
+    )
+
+
+async def kpi_text(page):
+    return await page.evaluate(_KPI_TEXT_JS)
+
+
+async def wait_for_kpi_change(page, previous, timeout=WAIT_TIMEOUT_MS):
+    """Wait until any KPI card shows a value other than ``previous``."""
+    await _wait_for(
+        page,
+        f"(previous) => ({_KPI_TEXT_JS})() !== previous",
+        arg=previous,
+        timeout=timeout,
+    )
+
+
+async def wait_for_success_banner(page, timeout=WAIT_TIMEOUT_MS):
+    """Wait until the transaction form confirms the submission."""
+    await _wait_for(page, _BANNER_JS, timeout=timeout)
+
+
+def estimated_idle_time_removed():
+    """Estimated seconds of sleeping skipped so far, and the number of waits.
+
+    An estimate, not a measurement: it assumes each wait replaced exactly one
+    ``FIXED_WAIT_MS`` sleep and subtracts the time the wait actually took.
+    """
+    saved_ms = _stats["waits"] * FIXED_WAIT_MS - _stats["waited_ms"]
+    return saved_ms / 1000, _stats["waits"]